@@ -2,11 +2,13 @@ import sys
 import signal
 import os
 import faulthandler
+import functools
+import socket
 import traceback
 import ctypes
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QSocketNotifier
 from src.tracker import ActivityTrack
 from src.ui.main_window import MainWindow
 from src.ui.tray_icon import TrayIcon
@@ -14,8 +16,13 @@ from src.config import Config
 from src.break_reminder import BreakReminder
 
 
+@functools.lru_cache(maxsize=1)
 def _load_app_icon():
-    """Load the application icon for windows and taskbar."""
+    """Load the application icon for windows and taskbar.
+
+    Memoized so every consumer (app, main window, future dialogs) shares
+    one QIcon instance and the filesystem probes run only once.
+    """
     icon_paths = []
 
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -45,8 +52,11 @@ def main():
     def log_exception(exc_type, exc_value, exc_tb):
         # When packaged without console, stderr might be None
         if sys.stderr is not None:
-            print("[FATAL] Unhandled exception:", exc_type.__name__, exc_value, file=sys.stderr)
-            traceback.print_exception(exc_type, exc_value, exc_tb)
+            # Single write for the prefix; print()'s sep/end handling can
+            # issue several, and this hook also fires for non-fatal
+            # exceptions raised inside Qt slots.
+            sys.stderr.write(f"[FATAL] Unhandled exception: {exc_type.__name__} {exc_value}\n")
+            traceback.print_exception(exc_type, exc_value, exc_tb, file=sys.stderr)
 
     sys.excepthook = log_exception
 
@@ -90,21 +100,21 @@ def main():
     # Initialize break reminder
     break_reminder = BreakReminder(tracker, config)
     
-    # Set up notification callback using tray icon
-    def show_break_notification(title, message):
-        """Show a Windows notification via the system tray icon."""
-        if config.show_notifications:
-            tray.showMessage(title, message, tray.MessageIcon.Information, 10000)
-    
-    break_reminder.set_notification_callback(show_break_notification)
+    # Notifications go through the tray icon; the reminder checks
+    # config.show_notifications itself before showing anything.
+    break_reminder.set_tray(tray)
     break_reminder.start()
     
     # Connect settings change to break reminder
     def on_settings_changed():
-        # Break reminder will pick up new config values automatically
-        # since it reads from config on each check
-        pass
-    
+        # Start or stop the monitor thread to match the current config.
+        # A running reminder picks up other value changes automatically
+        # since it reads from config on each check.
+        if config.break_reminder_enabled and config.break_reminder_interval_minutes > 0:
+            break_reminder.start()
+        else:
+            break_reminder.stop()
+
     window.settings_tab.settings_changed.connect(on_settings_changed)
     
     # Connect signals
@@ -115,18 +125,24 @@ def main():
         break_reminder.stop()
         if not skip_tracker:
             tracker.stop()
+        config.flush()  # Write any pending debounced config save
         app.quit()
         
     tray.quit_signal.connect(quit_app)
     
     # Show window initially
     window.show()
-    
-    # Allow python to handle signals by letting the event loop wake up periodically
-    timer = QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)
-    
+
+    # Deliver Python signals (e.g. Ctrl+C) through the Qt event loop
+    # without polling: the interpreter writes a byte into the socketpair
+    # on each signal and the notifier wakes the loop immediately, instead
+    # of a 500ms timer firing a no-op lambda forever.
+    rsock, wsock = socket.socketpair()
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+    signal_notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read)
+    signal_notifier.activated.connect(lambda *_: rsock.recv(4096))
+
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -9,37 +9,65 @@ Key features:
 - Tracks continuous usage time
 - Sends Windows notifications via QSystemTrayIcon
 - Respects user-configured intervals and break durations
+
+The periodic check runs on a QTimer on the main Qt thread, so there is
+no background thread and no cross-thread locking.
 """
 
 import time
-import threading
 from typing import Optional, Callable, TYPE_CHECKING
-from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import QTimer
 
 if TYPE_CHECKING:
     from .tracker import ActivityTrack
     from .config import Config
 
+# How often the reminder state is re-evaluated
+CHECK_INTERVAL_MS = 30000
+
+# Resolve the translator once at import time instead of per notification;
+# the guard keeps us safe if an import cycle ever forms with i18n, in
+# which case _send_reminder resolves it lazily on first use.
+try:
+    from .i18n import tr as _tr
+except ImportError:
+    _tr = None
+
+
+class ActivityWindow:
+    """Rolling window of recent activity samples.
+
+    Samples live in a preallocated int32 ring buffer with one column per
+    counter (keys, clicks, scrolls, distance in mm), so window sums and
+    any future heuristics (inter-click variance, autocorrelation) are
+    NumPy reductions instead of Python loops over a growing list.
+    """
+
+    COLUMNS = 4  # keys, clicks, scrolls, distance_mm
+
+    def __init__(self, window: int = 16):
+        self._buf = np.zeros((window, self.COLUMNS), dtype=np.int32)
+        self._head = 0
+
+    def push(self, keys: int, clicks: int, scrolls: float, distance_m: float):
+        """Record one sample, overwriting the oldest slot."""
+        self._buf[self._head] = (keys, clicks, int(scrolls), int(distance_m * 1000))
+        self._head = (self._head + 1) % len(self._buf)
+
+    def sums(self):
+        """Column sums (keys, clicks, scrolls, distance_mm) over the window."""
+        return self._buf.sum(axis=0)
 
-@dataclass
-class ActivityStats:
-    """Statistics about recent user activity."""
-    total_keys: int = 0
-    total_clicks: int = 0
-    total_scrolls: int = 0
-    total_distance: float = 0.0
-    
     def has_activity(self) -> bool:
-        """Check if there's any activity recorded."""
-        return (self.total_keys > 0 or self.total_clicks > 0 or 
-                self.total_scrolls > 0 or self.total_distance > 0)
-    
+        """Check if there's any activity recorded in the window."""
+        return bool(self._buf.any())
+
     def reset(self):
-        """Reset all counters."""
-        self.total_keys = 0
-        self.total_clicks = 0
-        self.total_scrolls = 0
-        self.total_distance = 0.0
+        """Zero all samples."""
+        self._buf[:] = 0
+        self._head = 0
 
 
 class BreakReminder:
@@ -70,56 +98,84 @@ class BreakReminder:
         self.tracker = tracker
         self.config = config
         
-        # State
+        # State. The periodic check runs on the Qt main thread via a
+        # QTimer, so no thread, lock, or stop event is needed.
         self._running = False
-        self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        self._timer = QTimer()
+        self._timer.setInterval(CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_tick)
         
         # Timing
         self._continuous_usage_start: Optional[float] = None
         self._last_reminder_time: Optional[float] = None
-        self._last_activity_snapshot = ActivityStats()
+        self._last_activity_snapshot = ActivityWindow()
         
-        # Callback for showing notifications (set by UI)
+        # Notification sinks (set by UI). A tray icon is preferred; the
+        # plain callback remains as a fallback for callers without one.
+        self._tray = None
         self._notification_callback: Optional[Callable[[str, str], None]] = None
         
         # Break state
         self._on_break = False
         self._break_start_time: Optional[float] = None
+
+        # Published status for the UI, rebuilt once per tick so
+        # get_status() stays a plain attribute read.
+        self._status_snapshot = {
+            'enabled': False,
+            'continuous_minutes': 0,
+            'until_reminder_minutes': 0,
+            'on_break': False
+        }
     
+    def set_tray(self, tray):
+        """Attach the system tray icon used to show notifications.
+
+        Reminders call tray.showMessage directly, respecting the
+        show_notifications setting, instead of going through a closure.
+
+        Args:
+            tray: QSystemTrayIcon instance (or compatible)
+        """
+        self._tray = tray
+
     def set_notification_callback(self, callback: Callable[[str, str], None]):
         """Set the callback for showing notifications.
-        
+
         Args:
             callback: Function that takes (title, message) and shows a notification
         """
         self._notification_callback = callback
     
     def start(self):
-        """Start the break reminder monitoring thread."""
+        """Start the break reminder monitoring timer.
+
+        No-op while reminders are disabled, so disabled users don't pay
+        for an idle periodic check. Call again (e.g. from the
+        settings-changed handler) once the feature is enabled.
+        """
         if self._running:
             return
-        
+        if not self._is_enabled():
+            return
+
         self._running = True
-        self._continuous_usage_start = time.time()
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
-    
+        self._continuous_usage_start = time.monotonic()
+        self._timer.start()
+
     def stop(self):
         """Stop the break reminder monitoring."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=2.0)
-            self._thread = None
+        self._timer.stop()
     
     def reset_timer(self):
         """Reset the continuous usage timer (e.g., when user takes a break)."""
-        with self._lock:
-            self._continuous_usage_start = time.time()
-            self._last_reminder_time = None
-            self._on_break = False
-            self._break_start_time = None
-            self._last_activity_snapshot.reset()
+        self._continuous_usage_start = time.monotonic()
+        self._last_reminder_time = None
+        self._on_break = False
+        self._break_start_time = None
+        self._last_activity_snapshot.reset()
+        self._status_snapshot = self._build_status(time.monotonic())
     
     def snooze(self, minutes: int = 10):
         """Snooze the reminder for specified minutes.
@@ -127,14 +183,14 @@ class BreakReminder:
         Args:
             minutes: Number of minutes to snooze
         """
-        with self._lock:
-            self._last_reminder_time = time.time()
-            # Effectively extends the timer by snooze duration
-            snooze_seconds = minutes * 60
-            if self._continuous_usage_start:
-                self._continuous_usage_start = time.time() - (
-                    self.config.break_reminder_interval_minutes * 60 - snooze_seconds
-                )
+        now = time.monotonic()
+        self._last_reminder_time = now
+        # Effectively extends the timer by snooze duration
+        snooze_seconds = minutes * 60
+        if self._continuous_usage_start:
+            self._continuous_usage_start = now - (
+                self.config.break_reminder_interval_seconds - snooze_seconds
+            )
     
     def _is_enabled(self) -> bool:
         """Check if break reminders are enabled."""
@@ -143,11 +199,11 @@ class BreakReminder:
     
     def _get_interval_seconds(self) -> float:
         """Get the reminder interval in seconds."""
-        return self.config.break_reminder_interval_minutes * 60
-    
+        return self.config.break_reminder_interval_seconds
+
     def _get_break_duration_seconds(self) -> float:
         """Get the required break duration in seconds."""
-        return self.config.break_reminder_duration_minutes * 60
+        return self.config.break_reminder_duration_seconds
     
     def _is_user_idle(self) -> bool:
         """Check if the user is currently idle (no recent activity).
@@ -168,47 +224,46 @@ class BreakReminder:
         Returns:
             True if activity appears genuine, False if likely automated
         """
-        # Get current stats snapshot
-        current = self.tracker.get_stats_snapshot()
-        
-        # Calculate deltas since last check
-        current_keys = current.get('buffer_keys', 0)
-        current_clicks = current.get('buffer_clicks', 0) 
-        current_distance = current.get('buffer_distance', 0.0)
-        current_scroll = current.get('buffer_scroll', 0.0)
-        
+        # One fused snapshot: a single tracker lock acquisition covering
+        # input buffers and the foreground app count.
+        snap = self.tracker.get_reminder_snapshot()
+        self._last_activity_snapshot.push(
+            snap.buffer_keys, snap.buffer_clicks,
+            snap.buffer_scroll, snap.buffer_distance)
+
         # If there are key presses, it's almost certainly human
         # (automation rarely types random keys)
-        if current_keys > 0:
+        if snap.buffer_keys > 0:
             return True
-        
+
         # If there's mouse movement, probably human
         # (automation tools usually click without moving)
-        if current_distance > 0.001:  # More than 1mm of movement
+        if snap.buffer_distance > 0.001:  # More than 1mm of movement
             return True
-        
+
         # If there's scrolling, probably human
-        if current_scroll > 0:
+        if snap.buffer_scroll > 0:
             return True
-        
+
         # Only clicks with no other activity is suspicious
-        # But we still count it if user has been typing/moving recently
-        # Check tracker's foreground time buffer for recent app switches
+        # But we still count it if user switches between apps
         # (humans switch apps, automation usually doesn't)
-        foreground_snapshot = self.tracker.get_foreground_time_snapshot()
-        if len(foreground_snapshot) > 1:  # Multiple apps used
+        if snap.foreground_app_count > 1:  # Multiple apps used
             return True
-        
+
         # If we only have clicks and nothing else, might be automation
         # But give benefit of doubt if there's at least some variety
-        return current_clicks < 100  # Very high click count without other input is suspicious
+        return snap.buffer_clicks < 100  # Very high click count without other input is suspicious
     
-    def _check_break_taken(self) -> bool:
+    def _check_break_taken(self, now: float) -> bool:
         """Check if user has taken a sufficient break.
-        
+
         A break is considered taken when the user has been idle for
         at least the configured break duration.
-        
+
+        Args:
+            now: Current time.monotonic() reading, sampled once per tick
+
         Returns:
             True if user has taken a full break
         """
@@ -224,20 +279,23 @@ class BreakReminder:
         if not self._on_break:
             # Just started being idle
             self._on_break = True
-            self._break_start_time = time.time()
+            self._break_start_time = now
             return False
         
         # Check if break is long enough
         if self._break_start_time:
-            break_duration = time.time() - self._break_start_time
+            break_duration = now - self._break_start_time
             if break_duration >= self._get_break_duration_seconds():
                 return True
         
         return False
     
-    def _should_remind(self) -> bool:
+    def _should_remind(self, now: float) -> bool:
         """Determine if a break reminder should be sent now.
-        
+
+        Args:
+            now: Current time.monotonic() reading, sampled once per tick
+
         Returns:
             True if reminder should be sent
         """
@@ -256,92 +314,105 @@ class BreakReminder:
             return False
         
         # Check elapsed time since last break
-        elapsed = time.time() - self._continuous_usage_start
+        elapsed = now - self._continuous_usage_start
         interval = self._get_interval_seconds()
-        
+
         if elapsed >= interval:
             # Check cooldown - don't spam reminders
             if self._last_reminder_time:
                 # Wait at least 5 minutes between reminders
-                if time.time() - self._last_reminder_time < 300:
+                if now - self._last_reminder_time < 300:
                     return False
             return True
         
         return False
     
-    def _send_reminder(self):
+    def _send_reminder(self, now: float) -> None:
         """Send a break reminder notification."""
-        if self._notification_callback:
-            # Import here to avoid circular dependency
+        if self._tray is None and self._notification_callback is None:
+            return
+
+        global _tr
+        if _tr is None:
+            # Fallback for the circular-import case; caches for next time
             from .i18n import tr
-            
-            title = tr('break_reminder.title')
-            minutes_used = int((time.time() - self._continuous_usage_start) / 60)
-            suggested_break = self.config.break_reminder_duration_minutes
-            
-            message = tr('break_reminder.message', 
-                        minutes=minutes_used, 
-                        break_duration=suggested_break)
-            
+            _tr = tr
+
+        title = _tr('break_reminder.title')
+        minutes_used = int((now - self._continuous_usage_start) / 60)
+        suggested_break = self.config.break_reminder_duration_minutes
+
+        message = _tr('break_reminder.message',
+                     minutes=minutes_used,
+                     break_duration=suggested_break)
+
+        if self._tray is not None:
+            if self.config.show_notifications:
+                self._tray.showMessage(title, message,
+                                       self._tray.MessageIcon.Information, 10000)
+        else:
             self._notification_callback(title, message)
-            
-            with self._lock:
-                self._last_reminder_time = time.time()
-    
-    def _monitor_loop(self):
-        """Main monitoring loop running in background thread."""
-        check_interval = 30  # Check every 30 seconds
-        
-        while self._running:
-            try:
-                # Check if user has taken a break
-                if self._check_break_taken():
-                    self.reset_timer()
-                    continue
-                
-                # Check if we should send a reminder
-                if self._should_remind():
-                    self._send_reminder()
-                
-            except Exception as e:
-                # Log but don't crash the monitor
-                print(f"[BreakReminder] Error in monitor loop: {e}")
-            
-            # Sleep in small intervals to allow quick shutdown
-            for _ in range(check_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+
+        self._last_reminder_time = now
     
+    def _on_tick(self):
+        """Periodic check driven by the QTimer on the main thread."""
+        try:
+            # Sample the clock once per tick; monotonic so the duration
+            # math is immune to wall-clock/NTP adjustments.
+            now = time.monotonic()
+
+            # Check if user has taken a break
+            if self._check_break_taken(now):
+                self.reset_timer()
+                return
+
+            # Check if we should send a reminder
+            if self._should_remind(now):
+                self._send_reminder(now)
+
+            # Publish a fresh status snapshot for cheap UI polls
+            self._status_snapshot = self._build_status(now)
+
+        except Exception as e:
+            # Log but don't crash the monitor
+            print(f"[BreakReminder] Error in monitor tick: {e}")
+
+    def _build_status(self, now: float) -> dict:
+        """Build a status dict for UI display."""
+        if not self._is_enabled():
+            return {
+                'enabled': False,
+                'continuous_minutes': 0,
+                'until_reminder_minutes': 0,
+                'on_break': False
+            }
+
+        continuous_minutes = 0
+        until_reminder_minutes = 0
+
+        if self._continuous_usage_start:
+            elapsed = now - self._continuous_usage_start
+            continuous_minutes = int(elapsed / 60)
+            remaining = self._get_interval_seconds() - elapsed
+            until_reminder_minutes = max(0, int(remaining / 60))
+
+        return {
+            'enabled': True,
+            'continuous_minutes': continuous_minutes,
+            'until_reminder_minutes': until_reminder_minutes,
+            'on_break': self._on_break,
+            'interval_minutes': self.config.break_reminder_interval_minutes,
+            'break_duration_minutes': self.config.break_reminder_duration_minutes
+        }
+
     def get_status(self) -> dict:
         """Get current break reminder status for UI display.
-        
+
+        Returns the snapshot last published by the periodic tick, so
+        polling stays a plain attribute read.
+
         Returns:
             Dict with status information
         """
-        with self._lock:
-            if not self._is_enabled():
-                return {
-                    'enabled': False,
-                    'continuous_minutes': 0,
-                    'until_reminder_minutes': 0,
-                    'on_break': False
-                }
-            
-            continuous_minutes = 0
-            until_reminder_minutes = 0
-            
-            if self._continuous_usage_start:
-                elapsed = time.time() - self._continuous_usage_start
-                continuous_minutes = int(elapsed / 60)
-                remaining = self._get_interval_seconds() - elapsed
-                until_reminder_minutes = max(0, int(remaining / 60))
-            
-            return {
-                'enabled': True,
-                'continuous_minutes': continuous_minutes,
-                'until_reminder_minutes': until_reminder_minutes,
-                'on_break': self._on_break,
-                'interval_minutes': self.config.break_reminder_interval_minutes,
-                'break_duration_minutes': self.config.break_reminder_duration_minutes
-            }
+        return self._status_snapshot
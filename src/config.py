@@ -6,8 +6,12 @@ Handles persistent settings like autostart, data retention, and theme preference
 import json
 import os
 import sys
+import tempfile
+import threading
 import winreg
 
+import numpy as np
+
 # Default configuration values
 DEFAULT_CONFIG = {
     'autostart': False,
@@ -32,6 +36,11 @@ DEFAULT_CONFIG = {
 
 CONFIG_FILE = 'config.json'
 
+# Delay before a scheduled save hits disk. Bursts of setter calls (e.g.
+# the settings dialog applying several options at once) collapse into a
+# single file write.
+SAVE_DEBOUNCE_SECONDS = 0.2
+
 # Registry key for Windows autostart
 AUTOSTART_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 APP_NAME = "ActivityTrack"
@@ -58,8 +67,11 @@ class Config:
         self.config_dir = config_dir
         self.config_path = os.path.join(config_dir, CONFIG_FILE)
         self._config = dict(DEFAULT_CONFIG)
+        self._save_timer = None
+        self._save_timer_lock = threading.Lock()
+        self._autostart_registry_cached = None  # Cached is_autostart_enabled() result
         self.load()
-    
+
     def load(self):
         """Load configuration from file."""
         try:
@@ -70,14 +82,81 @@ class Config:
                     self._config.update(saved_config)
         except Exception as e:
             print(f"Warning: Could not load config: {e}")
+        self._refresh_attrs()
+
+    def _refresh_attrs(self):
+        """Mirror config values into plain instance attributes.
+
+        The properties below are read on hot paths (the break reminder's
+        monitor loop, input-event handlers routed through the tray), so
+        they return these cached attributes instead of paying a dict
+        lookup on every access. Setters keep both sides in sync.
+        """
+        cfg = self._config
+        self._autostart = cfg.get('autostart', False)
+        self._data_retention_days = cfg.get('data_retention_days', 365)
+        self._heatmap_theme = cfg.get('heatmap_theme', 'default')
+        self._keyboard_layout = cfg.get('keyboard_layout', 'tkl')
+        self._minimize_to_tray = cfg.get('minimize_to_tray', True)
+        self._show_notifications = cfg.get('show_notifications', True)
+        self._language = cfg.get('language', 'en')
+        self._idle_timeout_seconds = cfg.get('idle_timeout_seconds', 300)
+        self._break_reminder_enabled = cfg.get('break_reminder_enabled', True)
+        self._break_reminder_interval_minutes = cfg.get('break_reminder_interval_minutes', 45)
+        self._break_reminder_duration_minutes = cfg.get('break_reminder_duration_minutes', 5)
+        self._screen_time_group_display = cfg.get('screen_time_group_display', False)
+        # Seconds-valued forms, precomputed so per-tick consumers don't
+        # redo the minutes * 60 conversion on every check.
+        self._interval_seconds = self._break_reminder_interval_minutes * 60
+        self._break_duration_seconds = self._break_reminder_duration_minutes * 60
     
     def save(self):
-        """Save configuration to file."""
+        """Schedule a debounced save to disk.
+
+        Each setter used to rewrite the whole file immediately; scheduling
+        the write lets rapid successive changes coalesce into one. Call
+        flush() to force any pending save to disk (e.g. on shutdown).
+        """
+        with self._save_timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._write)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Cancel any pending debounced save and write immediately."""
+        with self._save_timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._write()
+
+    def _write(self):
+        """Write configuration to file atomically.
+
+        The JSON is written to a temporary file in the same directory and
+        moved over config.json with os.replace, so a crash or concurrent
+        save can never leave a torn/half-written file for load() to choke on.
+        """
+        tmp_path = None
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_dir, prefix=CONFIG_FILE + '.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            tmp_path = None
         except Exception as e:
             print(f"Warning: Could not save config: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
     
     def get(self, key, default=None):
         """Get a configuration value."""
@@ -86,12 +165,13 @@ class Config:
     def set(self, key, value):
         """Set a configuration value and save."""
         self._config[key] = value
+        self._refresh_attrs()
         self.save()
-    
+
     # Property accessors for common settings
     @property
     def autostart(self):
-        return self._config.get('autostart', False)
+        return self._autostart
     
     @autostart.setter
     def autostart(self, value):
@@ -101,108 +181,137 @@ class Config:
         The result is stored in self._last_autostart_result for UI to check.
         """
         self._config['autostart'] = value
+        self._autostart = value
         self.save()  # Save config first
         result = self._update_autostart_registry(value)  # Then update registry
+        self._autostart_registry_cached = None  # Registry changed; re-read on next check
         self._last_autostart_result = result
-        
+
         # If registry update failed, revert config to match actual state
         if not result[0]:
             actual_state = self.is_autostart_enabled()
             self._config['autostart'] = actual_state
+            self._autostart = actual_state
             self.save()
-        
+
         return result
-    
+
     @property
     def data_retention_days(self):
-        return self._config.get('data_retention_days', 365)
-    
+        return self._data_retention_days
+
     @data_retention_days.setter
     def data_retention_days(self, value):
         self._config['data_retention_days'] = value
+        self._data_retention_days = value
         self.save()
-    
+
     @property
     def heatmap_theme(self):
-        return self._config.get('heatmap_theme', 'default')
-    
+        return self._heatmap_theme
+
     @heatmap_theme.setter
     def heatmap_theme(self, value):
         self._config['heatmap_theme'] = value
+        self._heatmap_theme = value
         self.save()
-    
+
     @property
     def keyboard_layout(self):
-        return self._config.get('keyboard_layout', 'tkl')
-    
+        return self._keyboard_layout
+
     @keyboard_layout.setter
     def keyboard_layout(self, value):
         self._config['keyboard_layout'] = value
+        self._keyboard_layout = value
         self.save()
-    
+
     @property
     def minimize_to_tray(self):
-        return self._config.get('minimize_to_tray', True)
-    
+        return self._minimize_to_tray
+
     @minimize_to_tray.setter
     def minimize_to_tray(self, value):
         self._config['minimize_to_tray'] = value
+        self._minimize_to_tray = value
         self.save()
-    
+
     @property
     def show_notifications(self):
-        return self._config.get('show_notifications', True)
-    
+        return self._show_notifications
+
     @show_notifications.setter
     def show_notifications(self, value):
         self._config['show_notifications'] = value
+        self._show_notifications = value
         self.save()
-    
+
     @property
     def language(self):
-        return self._config.get('language', 'en')
-    
+        return self._language
+
     @language.setter
     def language(self, value):
         self._config['language'] = value
+        self._language = value
         self.save()
-    
+
     @property
     def idle_timeout_seconds(self):
-        return self._config.get('idle_timeout_seconds', 300)
-    
+        return self._idle_timeout_seconds
+
     @idle_timeout_seconds.setter
     def idle_timeout_seconds(self, value):
-        self._config['idle_timeout_seconds'] = max(0, int(value))
+        value = max(0, int(value))
+        self._config['idle_timeout_seconds'] = value
+        self._idle_timeout_seconds = value
         self.save()
-    
+
     @property
     def break_reminder_enabled(self):
-        return self._config.get('break_reminder_enabled', True)
-    
+        return self._break_reminder_enabled
+
     @break_reminder_enabled.setter
     def break_reminder_enabled(self, value):
-        self._config['break_reminder_enabled'] = bool(value)
+        value = bool(value)
+        self._config['break_reminder_enabled'] = value
+        self._break_reminder_enabled = value
         self.save()
-    
+
     @property
     def break_reminder_interval_minutes(self):
-        return self._config.get('break_reminder_interval_minutes', 45)
-    
+        return self._break_reminder_interval_minutes
+
     @break_reminder_interval_minutes.setter
     def break_reminder_interval_minutes(self, value):
-        self._config['break_reminder_interval_minutes'] = max(0, int(value))
+        value = max(0, int(value))
+        self._config['break_reminder_interval_minutes'] = value
+        self._break_reminder_interval_minutes = value
+        self._interval_seconds = value * 60
         self.save()
-    
+
     @property
     def break_reminder_duration_minutes(self):
-        return self._config.get('break_reminder_duration_minutes', 5)
-    
+        return self._break_reminder_duration_minutes
+
     @break_reminder_duration_minutes.setter
     def break_reminder_duration_minutes(self, value):
-        self._config['break_reminder_duration_minutes'] = max(1, int(value))
+        value = max(1, int(value))
+        self._config['break_reminder_duration_minutes'] = value
+        self._break_reminder_duration_minutes = value
+        self._break_duration_seconds = value * 60
         self.save()
     
+    @property
+    def break_reminder_interval_seconds(self):
+        """Reminder interval in seconds (precomputed from the minute value)."""
+        return self._interval_seconds
+
+    @property
+    def break_reminder_duration_seconds(self):
+        """Required break duration in seconds (precomputed from the minute value)."""
+        return self._break_duration_seconds
+
     @property
     def app_groups(self):
         """Get app groups configuration."""
@@ -217,12 +326,14 @@ class Config:
     @property
     def screen_time_group_display(self):
         """Get screen time group display mode. False = individual apps, True = category groups."""
-        return self._config.get('screen_time_group_display', False)
-    
+        return self._screen_time_group_display
+
     @screen_time_group_display.setter
     def screen_time_group_display(self, value):
         """Set screen time group display mode."""
-        self._config['screen_time_group_display'] = bool(value)
+        value = bool(value)
+        self._config['screen_time_group_display'] = value
+        self._screen_time_group_display = value
         self.save()
     
     def get_app_group(self, app_name):
@@ -326,7 +437,19 @@ class Config:
             return (False, error_msg)
     
     def is_autostart_enabled(self):
-        """Check if autostart is currently enabled in registry."""
+        """Check if autostart is currently enabled in registry.
+
+        The registry roundtrip is done once and cached; the autostart
+        setter invalidates the cache after touching the registry.
+        """
+        if self._autostart_registry_cached is not None:
+            return self._autostart_registry_cached
+        state = self._read_autostart_registry()
+        self._autostart_registry_cached = state
+        return state
+
+    def _read_autostart_registry(self):
+        """Query the registry for the autostart entry (uncached)."""
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -349,6 +472,7 @@ class Config:
         actual_state = self.is_autostart_enabled()
         if self._config.get('autostart', False) != actual_state:
             self._config['autostart'] = actual_state
+            self._autostart = actual_state
             self.save()
         return actual_state
 
@@ -414,31 +538,100 @@ HEATMAP_THEMES = {
 }
 
 
+def _flatten_themes():
+    """Flatten theme color stops into parallel NumPy arrays.
+
+    The nested dict/list/tuple layout of HEATMAP_THEMES is kept for
+    definition readability (and the settings UI reads theme names from
+    it), but the interpolation kernel works on a flat structure-of-arrays
+    form: one float64 positions array plus one (n, 3) float64 RGB array
+    per theme.
+    """
+    flat = {}
+    for name, theme in HEATMAP_THEMES.items():
+        positions = np.array([stop[0] for stop in theme['colors']], dtype=np.float64)
+        rgb = np.array([stop[1] for stop in theme['colors']], dtype=np.float64)
+        flat[name] = (positions, rgb)
+    return flat
+
+
+_THEMES_FLAT = _flatten_themes()
+
+
+def _build_theme_luts():
+    """Build a 256-entry RGB lookup table per theme at import time."""
+    ratios = np.linspace(0.0, 1.0, 256)
+    luts = {}
+    for name, (positions, rgb) in _THEMES_FLAT.items():
+        idx = np.searchsorted(positions, ratios, side='right') - 1
+        idx = np.clip(idx, 0, len(positions) - 2)
+        span = positions[idx + 1] - positions[idx]
+        t = (ratios - positions[idx]) / np.where(span == 0, 1.0, span)
+        colors = rgb[idx] + (rgb[idx + 1] - rgb[idx]) * t[:, None]
+        luts[name] = colors.astype(np.uint8)
+    return luts
+
+
+# Precomputed per-theme LUTs so get_theme_color is a single array index
+# instead of a per-call interpolation loop. Heatmap rendering calls it
+# once per cell, so this is a hot path.
+THEME_LUT = _build_theme_luts()
+
+
 def get_theme_color(theme_name, ratio):
     """Get interpolated color for a given theme and ratio (0.0 to 1.0).
-    
+
     Args:
         theme_name: Name of the theme ('default', 'fire', 'ocean', etc.)
         ratio: Heat ratio from 0.0 to 1.0
-    
+
     Returns:
         Tuple of (r, g, b) values
     """
-    theme = HEATMAP_THEMES.get(theme_name, HEATMAP_THEMES['default'])
-    colors = theme['colors']
-    
-    # Find the two colors to interpolate between
-    for i in range(len(colors) - 1):
-        pos1, color1 = colors[i]
-        pos2, color2 = colors[i + 1]
-        
-        if pos1 <= ratio <= pos2:
-            # Interpolate
-            t = (ratio - pos1) / (pos2 - pos1) if pos2 != pos1 else 0
-            r = int(color1[0] + (color2[0] - color1[0]) * t)
-            g = int(color1[1] + (color2[1] - color1[1]) * t)
-            b = int(color1[2] + (color2[2] - color1[2]) * t)
-            return (r, g, b)
-    
-    # Fallback to last color
-    return colors[-1][1]
+    lut = THEME_LUT.get(theme_name)
+    if lut is None:
+        lut = THEME_LUT['default']
+    i = int(ratio * 255.0)
+    if i < 0:
+        i = 0
+    elif i > 255:
+        i = 255
+    r, g, b = lut[i]
+    return (int(r), int(g), int(b))
+
+
+def get_theme_colors_float(theme_name, ratios):
+    """Un-quantized theme interpolation.
+
+    Like get_theme_colors but straight from the float stop arrays, for
+    callers that dither before quantizing (the 256-entry LUT would bake
+    the 8-bit rounding in too early).
+
+    Args:
+        theme_name: Name of the theme ('default', 'fire', 'ocean', etc.)
+        ratios: Array-like of heat ratios from 0.0 to 1.0
+
+    Returns:
+        float64 ndarray of shape (len(ratios), 3) with RGB values
+    """
+    positions, rgb = _THEMES_FLAT.get(theme_name) or _THEMES_FLAT['default']
+    ratios = np.asarray(ratios, dtype=np.float64)
+    return np.stack([np.interp(ratios, positions, rgb[:, c]) for c in range(3)],
+                    axis=1)
+
+
+def get_theme_colors(theme_name, ratios):
+    """Vectorized form of get_theme_color for an array of ratios.
+
+    Args:
+        theme_name: Name of the theme ('default', 'fire', 'ocean', etc.)
+        ratios: Array-like of heat ratios from 0.0 to 1.0
+
+    Returns:
+        uint8 ndarray of shape (len(ratios), 3) with RGB values
+    """
+    lut = THEME_LUT.get(theme_name)
+    if lut is None:
+        lut = THEME_LUT['default']
+    idx = np.clip((np.asarray(ratios, dtype=np.float64) * 255.0).astype(np.int32), 0, 255)
+    return lut[idx]
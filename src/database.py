@@ -2,12 +2,120 @@ import sqlite3
 import datetime
 import os
 import sys
+import threading
+import time
+
+import numpy as np
+
+# Hot-path DML hoisted to module level. sqlite3's per-connection statement
+# cache is keyed by SQL text, so sharing one string object per statement
+# (rather than per-call literals) keeps the LRU hits deterministic.
+_SQL_UPSERT_DAILY = '''
+    INSERT INTO daily_stats (date, key_count, mouse_click_count, mouse_distance, scroll_distance)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        key_count = key_count + excluded.key_count,
+        mouse_click_count = mouse_click_count + excluded.mouse_click_count,
+        mouse_distance = mouse_distance + excluded.mouse_distance,
+        scroll_distance = scroll_distance + excluded.scroll_distance
+'''
+
+_SQL_UPSERT_APP = '''
+    INSERT INTO app_stats (date, app_name, key_count, clicks, scrolls, distance)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date, app_name) DO UPDATE SET
+        key_count = key_count + excluded.key_count,
+        clicks = clicks + excluded.clicks,
+        scrolls = scrolls + excluded.scrolls,
+        distance = distance + excluded.distance
+'''
+
+_SQL_UPSERT_HEATMAP = '''
+    INSERT INTO heatmap_data (date, key_code, count)
+    VALUES (?, ?, ?)
+    ON CONFLICT(date, key_code) DO UPDATE SET
+        count = count + excluded.count
+'''
+
+def to_db_date(value):
+    """Convert a date-ish value to the INTEGER ordinal stored in SQLite.
+
+    Dates are stored as datetime.date.toordinal() integers: the fat part
+    of several primary keys shrinks from 10-byte TEXT to a varint, and
+    B-tree comparisons become integer compares instead of memcmp.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date().toordinal()
+    if isinstance(value, datetime.date):
+        return value.toordinal()
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value).toordinal()
+    return int(value)
+
+
+def from_db_date(value):
+    """Convert a stored INTEGER ordinal back to datetime.date."""
+    if isinstance(value, int):
+        return datetime.date.fromordinal(value)
+    return value
+
 
 class Database:
     def __init__(self, db_path="tracker.db"):
         self.db_path = self._resolve_db_path(db_path)
+        # One long-lived connection shared by all callers. Opening a new
+        # connection per statement paid syscalls, page-cache warmup, and
+        # PRAGMA reapplication on every counter update; reusing one keeps
+        # SQLite's page cache hot. RLock because init/migration helpers
+        # nest. check_same_thread=False: access is serialized by the lock.
+        self._lock = threading.RLock()
+        # cached_statements=256 comfortably covers every distinct SQL
+        # string in this module, so statements stay compiled for the
+        # connection's lifetime instead of being re-parsed.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=256)
+        self._apply_pragmas(self._conn)
         self.init_db()
 
+        # In-memory delta buffers for the highest-frequency counters.
+        # update_stats/update_app_stats/update_heatmap only add to these
+        # dicts; flush() drains them in one transaction, so the disk sees
+        # one fsync per flush interval instead of one per call.
+        self._pending_daily = {}    # date -> [keys, clicks, distance, scroll]
+        self._pending_app = {}      # (date, app_name) -> [keys, clicks, scrolls, distance]
+        self._pending_heatmap = {}  # (date, key_code) -> count
+
+        # Bumped whenever committed data changes. UI-side caches compare
+        # this against the version they were built at instead of hooking
+        # Qt signals into a non-Qt module.
+        self.data_version = 0
+
+        # Rate limits for checkpoint(): WAL truncation at most once a
+        # minute, planner re-optimization every 15 minutes.
+        self._last_checkpoint = 0.0
+        self._last_optimize = time.monotonic()
+
+        # Dedicated writer thread: producers only append to the pending
+        # dicts and set the wake event; the transaction (and its fsync)
+        # runs here so input-hook and UI threads never block on disk.
+        self._writer_stop = False
+        self._writer_wake = threading.Event()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            self._writer_wake.wait()
+            if self._writer_stop:
+                break
+            # Short batch window so a burst of updates lands in one commit
+            time.sleep(0.05)
+            self._writer_wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"Writer thread warning: {e}")
+
     def _resolve_db_path(self, db_path):
         """Ensure DB path is anchored to the install directory."""
         if db_path == ":memory:":
@@ -23,16 +131,79 @@ class Database:
         return os.path.join(base_dir, db_path)
 
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        """Return the shared long-lived connection.
+
+        Kept for callers that do `with db.get_connection() as conn:` —
+        that context manages a transaction, not the connection lifetime.
+        Flushes pending counters first so raw-SQL callers see them.
+        """
+        self.flush()
+        return self._conn
+
+    def close(self):
+        """Stop the writer thread, flush pending deltas and close."""
+        self._writer_stop = True
+        self._writer_wake.set()
+        self._writer.join(timeout=2.0)
+        with self._lock:
+            try:
+                self.flush()
+                self._conn.commit()
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    def checkpoint(self):
+        """Checkpoint the WAL while the app is idle.
+
+        Safe to call often: the TRUNCATE checkpoint runs at most once per
+        minute and PRAGMA optimize at most every 15 minutes, so callers
+        (idle detection, shutdown) don't need their own rate limiting.
+        """
+        now = time.monotonic()
+        if now - self._last_checkpoint < 60.0:
+            return
+        with self._lock:
+            self._last_checkpoint = now
+            try:
+                self.flush()
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                if now - self._last_optimize >= 900.0:
+                    self._last_optimize = now
+                    self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Checkpoint warning: {e}")
+
+    def _apply_pragmas(self, conn):
+        """Apply performance PRAGMAs (must be set per connection).
+
+        The workload is write-heavy (tracker counters) and read-light
+        (UI widgets), which is what WAL targets: writers no longer block
+        readers and each commit costs one fsync instead of two.
+        """
+        if self.db_path == ":memory:":
+            return
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+            conn.execute("PRAGMA mmap_size=268435456")  # 256MB mmap window
+            # Default autocheckpoint (1000 pages) fires mid-write and
+            # blocks the writer; raise it and checkpoint explicitly from
+            # checkpoint() while the user is idle instead.
+            conn.execute("PRAGMA wal_autocheckpoint=10000")
+        except sqlite3.Error as e:
+            print(f"Pragma warning: {e}")
 
     def init_db(self):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             # Daily stats table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS daily_stats (
-                    date DATE PRIMARY KEY,
+                    date INTEGER PRIMARY KEY,
                     key_count INTEGER DEFAULT 0,
                     mouse_click_count INTEGER DEFAULT 0,
                     mouse_distance REAL DEFAULT 0.0,
@@ -43,7 +214,7 @@ class Database:
             # App stats table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_stats (
-                    date DATE,
+                    date INTEGER,
                     app_name TEXT,
                     key_count INTEGER DEFAULT 0,
                     PRIMARY KEY (date, app_name)
@@ -53,7 +224,7 @@ class Database:
             # Heatmap data table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS heatmap_data (
-                    date DATE,
+                    date INTEGER,
                     key_code INTEGER,
                     count INTEGER DEFAULT 0,
                     PRIMARY KEY (date, key_code)
@@ -63,7 +234,7 @@ class Database:
             # Mouse Heatmap data table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS mouse_heatmap_data (
-                    date DATE,
+                    date INTEGER,
                     x INTEGER,
                     y INTEGER,
                     count INTEGER DEFAULT 0,
@@ -74,7 +245,7 @@ class Database:
             # App-specific keyboard heatmap data table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_heatmap_data (
-                    date DATE,
+                    date INTEGER,
                     app_name TEXT,
                     key_code INTEGER,
                     count INTEGER DEFAULT 0,
@@ -85,7 +256,7 @@ class Database:
             # App-specific mouse heatmap data table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_mouse_heatmap_data (
-                    date DATE,
+                    date INTEGER,
                     app_name TEXT,
                     x INTEGER,
                     y INTEGER,
@@ -93,7 +264,7 @@ class Database:
                     PRIMARY KEY (date, app_name, x, y)
                 )
             ''')
-            conn.commit()
+            self._conn.commit()
             
             # Migration for new columns in app_stats
             self._migrate_app_stats_schema()
@@ -101,7 +272,7 @@ class Database:
             # Hourly App Stats table for granular tracking
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS hourly_app_stats (
-                    date DATE,
+                    date INTEGER,
                     hour INTEGER,
                     app_name TEXT,
                     key_count INTEGER DEFAULT 0,
@@ -116,22 +287,60 @@ class Database:
             self._migrate_app_metadata_schema()
             
             # App foreground time table for screen time tracking
+            # Covering index for get_heatmap_range's GROUP BY key_code over
+            # a date range: matching the grouping key lets SQLite stream
+            # the aggregation instead of sorting a temp table, and the
+            # trailing count column keeps it index-only.
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_heatmap_keycode_date
+                ON heatmap_data(key_code, date, count)
+            ''')
+
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_foreground_time (
-                    date DATE,
+                    date INTEGER,
                     hour INTEGER,
                     app_name TEXT,
                     duration_seconds INTEGER DEFAULT 0,
                     PRIMARY KEY (date, hour, app_name)
                 )
             ''')
-            
-            conn.commit()
+
+            self._conn.commit()
+
+            # Rewrite any legacy TEXT dates to INTEGER ordinals
+            self._migrate_dates_to_ordinal()
+
+            # Refresh planner statistics so range queries pick the
+            # covering index over a primary-key scan.
+            cursor.execute('ANALYZE')
+
+            self._conn.commit()
+
+    def _migrate_dates_to_ordinal(self):
+        """One-shot rewrite of legacy TEXT 'YYYY-MM-DD' dates to ordinals."""
+        tables = ('daily_stats', 'app_stats', 'heatmap_data',
+                  'mouse_heatmap_data', 'app_heatmap_data',
+                  'app_mouse_heatmap_data', 'hourly_app_stats',
+                  'app_foreground_time')
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                for table in tables:
+                    # julianday('0001-01-01') is 1721425.5, so this maps
+                    # ISO text directly onto date.toordinal() integers.
+                    cursor.execute(
+                        f"UPDATE {table} "
+                        "SET date = CAST(julianday(date) - 1721424.5 AS INTEGER) "
+                        "WHERE typeof(date) = 'text'")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Migration warning: {e}")
 
     def _migrate_app_stats_schema(self):
         """Add new columns to app_stats if they don't exist."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             try:
                 # Check if columns exist
                 cursor.execute("PRAGMA table_info(app_stats)")
@@ -143,41 +352,34 @@ class Database:
                     cursor.execute("ALTER TABLE app_stats ADD COLUMN scrolls INTEGER DEFAULT 0")
                 if 'distance' not in columns:
                     cursor.execute("ALTER TABLE app_stats ADD COLUMN distance INTEGER DEFAULT 0")
-                conn.commit()
+                self._conn.commit()
             except sqlite3.Error as e:
                 print(f"Migration warning: {e}")
 
     def update_stats(self, date, key_count=0, click_count=0, distance=0.0, scroll=0.0):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO daily_stats (date, key_count, mouse_click_count, mouse_distance, scroll_distance)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    key_count = key_count + excluded.key_count,
-                    mouse_click_count = mouse_click_count + excluded.mouse_click_count,
-                    mouse_distance = mouse_distance + excluded.mouse_distance,
-                    scroll_distance = scroll_distance + excluded.scroll_distance
-            ''', (date, key_count, click_count, distance, scroll))
-            conn.commit()
+        date = to_db_date(date)
+        with self._lock:
+            row = self._pending_daily.setdefault(date, [0, 0, 0.0, 0.0])
+            row[0] += key_count
+            row[1] += click_count
+            row[2] += distance
+            row[3] += scroll
+        self._writer_wake.set()
 
     def update_app_stats(self, date, app_name, key_count=0, click_count=0, scroll_count=0, distance=0):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO app_stats (date, app_name, key_count, clicks, scrolls, distance)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(date, app_name) DO UPDATE SET
-                    key_count = key_count + excluded.key_count,
-                    clicks = clicks + excluded.clicks,
-                    scrolls = scrolls + excluded.scrolls,
-                    distance = distance + excluded.distance
-            ''', (date, app_name, key_count, click_count, scroll_count, distance))
-            conn.commit()
+        date = to_db_date(date)
+        with self._lock:
+            row = self._pending_app.setdefault((date, app_name), [0, 0, 0, 0])
+            row[0] += key_count
+            row[1] += click_count
+            row[2] += scroll_count
+            row[3] += distance
+        self._writer_wake.set()
 
     def update_hourly_app_stats(self, date, hour, app_name, key_count=0, clicks=0, scrolls=0, distance=0.0):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 INSERT INTO hourly_app_stats (date, hour, app_name, key_count, clicks, scrolls, distance)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -187,83 +389,125 @@ class Database:
                     scrolls = scrolls + excluded.scrolls,
                     distance = distance + excluded.distance
             ''', (date, hour, app_name, key_count, clicks, scrolls, distance))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
 
     def update_heatmap(self, date, key_code, count):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO heatmap_data (date, key_code, count)
-                VALUES (?, ?, ?)
-                ON CONFLICT(date, key_code) DO UPDATE SET
-                    count = count + excluded.count
-            ''', (date, key_code, count))
+        date = to_db_date(date)
+        with self._lock:
+            key = (date, key_code)
+            self._pending_heatmap[key] = self._pending_heatmap.get(key, 0) + count
+        self._writer_wake.set()
+
+    def flush(self):
+        """Write all pending counter deltas in one transaction.
 
-            conn.commit()
+        A single BEGIN/executemany/COMMIT per flush interval replaces one
+        commit (and fsync) per individual counter update. Cheap no-op when
+        nothing is pending, so readers can call it defensively.
+        """
+        with self._lock:
+            if not (self._pending_daily or self._pending_app or self._pending_heatmap):
+                return
+            daily = [(d, v[0], v[1], v[2], v[3]) for d, v in self._pending_daily.items()]
+            apps = [(d, a, v[0], v[1], v[2], v[3]) for (d, a), v in self._pending_app.items()]
+            heat = [(d, k, c) for (d, k), c in self._pending_heatmap.items()]
+            self._pending_daily = {}
+            self._pending_app = {}
+            self._pending_heatmap = {}
+            cursor = self._conn.cursor()
+            if daily:
+                cursor.executemany(_SQL_UPSERT_DAILY, daily)
+            if apps:
+                cursor.executemany(_SQL_UPSERT_APP, apps)
+            if heat:
+                cursor.executemany(_SQL_UPSERT_HEATMAP, heat)
+            self._conn.commit()
+            self.data_version += 1
 
     def update_mouse_heatmap(self, date, x, y, count):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 INSERT INTO mouse_heatmap_data (date, x, y, count)
                 VALUES (?, ?, ?, ?)
                 ON CONFLICT(date, x, y) DO UPDATE SET
                     count = count + excluded.count
             ''', (date, x, y, count))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
 
     def update_app_heatmap(self, date, app_name, key_code, count):
         """Update app-specific keyboard heatmap data."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 INSERT INTO app_heatmap_data (date, app_name, key_code, count)
                 VALUES (?, ?, ?, ?)
                 ON CONFLICT(date, app_name, key_code) DO UPDATE SET
                     count = count + excluded.count
             ''', (date, app_name, key_code, count))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
 
     def update_app_mouse_heatmap(self, date, app_name, x, y, count):
         """Update app-specific mouse heatmap data."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 INSERT INTO app_mouse_heatmap_data (date, app_name, x, y, count)
                 VALUES (?, ?, ?, ?, ?)
                 ON CONFLICT(date, app_name, x, y) DO UPDATE SET
                     count = count + excluded.count
             ''', (date, app_name, x, y, count))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
 
-    def get_today_stats(self):
-        today = datetime.date.today()
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    def get_today_stats(self, today=None):
+        if today is None:
+            today = datetime.date.today()
+        today = to_db_date(today)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('SELECT * FROM daily_stats WHERE date = ?', (today,))
-            return cursor.fetchone()
+            row = cursor.fetchone()
+            if row:
+                row = (from_db_date(row[0]),) + tuple(row[1:])
+            return row
 
     def get_weekly_stats(self):
         today = datetime.date.today()
         start_date = today - datetime.timedelta(days=6)
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT date, key_count FROM daily_stats WHERE date BETWEEN ? AND ? ORDER BY date', (start_date, today))
-            return cursor.fetchall()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('SELECT date, key_count FROM daily_stats WHERE date BETWEEN ? AND ? ORDER BY date',
+                           (start_date.toordinal(), today.toordinal()))
+            return [(from_db_date(r[0]), r[1]) for r in cursor.fetchall()]
 
-    def get_today_heatmap(self):
+    def get_today_heatmap(self, today=None):
         """Get today's keyboard heatmap data from database."""
-        today = datetime.date.today()
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if today is None:
+            today = datetime.date.today()
+        today = to_db_date(today)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('SELECT key_code, count FROM heatmap_data WHERE date = ?', (today,))
             rows = cursor.fetchall()
             return {row[0]: row[1] for row in rows}
 
     def get_heatmap_range(self, start_date, end_date, app_filter=None):
         """Get aggregated heatmap data for a date range, optionally filtered by app."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT key_code, SUM(count) as total_count 
@@ -281,18 +525,54 @@ class Database:
             rows = cursor.fetchall()
             return {row[0]: row[1] for row in rows}
 
-    def get_today_mouse_heatmap(self):
+    def get_heatmap_range_arrays(self, start_date, end_date, app_filter=None):
+        """Array variant of get_heatmap_range for numeric consumers.
+
+        Returns (key_codes, counts) as int32/int64 numpy arrays, skipping
+        the per-row dict allocation and int boxing; callers that need
+        dict semantics (e.g. merging live buffers) should keep using
+        get_heatmap_range.
+        """
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
+            if app_filter and app_filter != "All Applications":
+                cursor.execute('''
+                    SELECT key_code, SUM(count) as total_count 
+                    FROM app_heatmap_data 
+                    WHERE date BETWEEN ? AND ? AND app_name = ?
+                    GROUP BY key_code
+                ''', (start_date, end_date, app_filter))
+            else:
+                cursor.execute('''
+                    SELECT key_code, SUM(count) as total_count 
+                    FROM heatmap_data 
+                    WHERE date BETWEEN ? AND ? 
+                    GROUP BY key_code
+                ''', (start_date, end_date))
+            rows = cursor.fetchall()
+            key_codes = np.fromiter((r[0] for r in rows), dtype=np.int32, count=len(rows))
+            counts = np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows))
+            return key_codes, counts
+
+    def get_today_mouse_heatmap(self, today=None):
         """Get today's mouse heatmap data from database."""
-        today = datetime.date.today()
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if today is None:
+            today = datetime.date.today()
+        today = to_db_date(today)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('SELECT x, y, count FROM mouse_heatmap_data WHERE date = ?', (today,))
             return cursor.fetchall()
 
     def get_mouse_heatmap_range(self, start_date, end_date, app_filter=None):
         """Get aggregated mouse heatmap data for a date range, optionally filtered by app."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT x, y, SUM(count) as total_count 
@@ -311,8 +591,11 @@ class Database:
 
     def get_stats_range(self, start_date, end_date):
         """Get aggregated stats for a date range."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 SELECT 
                     SUM(key_count) as total_keys,
@@ -338,8 +621,9 @@ class Database:
 
     def get_all_time_stats(self):
         """Get all-time aggregated statistics."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 SELECT 
                     SUM(key_count) as total_keys,
@@ -351,12 +635,19 @@ class Database:
                     COUNT(DISTINCT date) as days_tracked
                 FROM daily_stats
             ''')
-            return cursor.fetchone()
+            row = cursor.fetchone()
+            if row and row[4] is not None:
+                row = tuple(row[:4]) + (from_db_date(row[4]), from_db_date(row[5])) + tuple(row[6:])
+            return row
 
     def get_top_apps(self, limit=10, start_date=None, end_date=None):
         """Get top applications by keystroke count within a date range."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if start_date and end_date:
+            start_date = to_db_date(start_date)
+            end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             if start_date and end_date:
                 cursor.execute('''
                     SELECT app_name, SUM(key_count) as total_keys
@@ -378,8 +669,12 @@ class Database:
 
     def get_app_stats_summary(self, limit=50, start_date=None, end_date=None):
         """Get detailed app stats within a date range."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if start_date and end_date:
+            start_date = to_db_date(start_date)
+            end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             if start_date and end_date:
                 cursor.execute('''
                     SELECT 
@@ -412,8 +707,12 @@ class Database:
 
     def get_daily_history(self, start_date=None, end_date=None, app_filter=None):
         """Get daily statistics for trend charts. Returns list of (date, keys, clicks, distance, scroll)."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if start_date and end_date:
+            start_date = to_db_date(start_date)
+            end_date = to_db_date(end_date)
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             if app_filter and app_filter != "All Applications":
                 if start_date and end_date:
@@ -446,13 +745,15 @@ class Database:
                         FROM daily_stats 
                         ORDER BY date ASC
                     ''')
-            return cursor.fetchall()
+            return [(from_db_date(r[0]),) + tuple(r[1:]) for r in cursor.fetchall()]
 
-    def get_today_hourly_stats(self, app_filter=None):
+    def get_today_hourly_stats(self, app_filter=None, today=None):
         """Get today's hourly stats: [(hour, keys, clicks), ...]"""
-        today = datetime.date.today()
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if today is None:
+            today = datetime.date.today()
+        today = to_db_date(today)
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT hour, SUM(key_count), SUM(clicks)
@@ -472,16 +773,18 @@ class Database:
             return cursor.fetchall()
 
     def get_day_of_week_averages(self, app_filter=None):
-        """Get average stats per day of week (0=Sunday, 6=Saturday in SQLite strftime %w)."""
-        # Note: SQLite %w returns 0-6 where 0 is Sunday.
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        """Get average stats per day of week (0=Sunday, 6=Saturday)."""
+        # Note: toordinal() % 7 gives 0-6 where 0 is Sunday, matching the
+        # old strftime('%w') semantics without per-row date parsing.
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 # Average per day for specific app involves summing for each date then averaging by DOW
                 # But querying raw app_stats is easier:
                 cursor.execute('''
                     SELECT 
-                        strftime('%w', date) as dow,
+                        (date % 7) as dow,
                         AVG(key_count),
                         AVG(clicks)
                     FROM app_stats
@@ -492,7 +795,7 @@ class Database:
             else:
                 cursor.execute('''
                     SELECT 
-                        strftime('%w', date) as dow,
+                        (date % 7) as dow,
                         AVG(key_count),
                         AVG(mouse_click_count)
                     FROM daily_stats
@@ -503,8 +806,8 @@ class Database:
 
     def get_hour_of_day_averages(self, app_filter=None):
         """Get average stats per hour of day over history."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT hour, AVG(key_count), AVG(clicks)
@@ -531,28 +834,163 @@ class Database:
                 ''')
             return cursor.fetchall()
 
+    def get_day_of_week_averages_dense(self, app_filter=None):
+        """Day-of-week averages as a dense (7, 3) float array.
+
+        A recursive CTE generates all seven dow values (0=Sunday) and the
+        averages are LEFT JOINed onto it, so SQLite hands back one row per
+        day with NULLs already coalesced — no bin-padding in Python.
+
+        Returns:
+            numpy array of shape (7, 3): columns dow, avg_keys, avg_clicks.
+        """
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
+            if app_filter and app_filter != "All Applications":
+                cursor.execute('''
+                    WITH RECURSIVE days(d) AS (
+                        SELECT 0 UNION ALL SELECT d + 1 FROM days WHERE d < 6
+                    )
+                    SELECT d, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM days
+                    LEFT JOIN (
+                        SELECT (date % 7) as dow, AVG(key_count) as k, AVG(clicks) as c
+                        FROM app_stats
+                        WHERE app_name = ?
+                        GROUP BY dow
+                    ) a ON a.dow = d
+                    ORDER BY d
+                ''', (app_filter,))
+            else:
+                cursor.execute('''
+                    WITH RECURSIVE days(d) AS (
+                        SELECT 0 UNION ALL SELECT d + 1 FROM days WHERE d < 6
+                    )
+                    SELECT d, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM days
+                    LEFT JOIN (
+                        SELECT (date % 7) as dow, AVG(key_count) as k, AVG(mouse_click_count) as c
+                        FROM daily_stats
+                        GROUP BY dow
+                    ) a ON a.dow = d
+                    ORDER BY d
+                ''')
+            return np.asarray(cursor.fetchall(), dtype=np.float64)
+
+    def get_hour_of_day_averages_dense(self, app_filter=None):
+        """Hour-of-day averages as a dense (24, 3) float array.
+
+        Same LEFT JOIN against a generated 0-23 series as
+        get_day_of_week_averages_dense, so empty hours arrive as zero rows.
+
+        Returns:
+            numpy array of shape (24, 3): columns hour, avg_keys, avg_clicks.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            if app_filter and app_filter != "All Applications":
+                cursor.execute('''
+                    WITH RECURSIVE hours(h) AS (
+                        SELECT 0 UNION ALL SELECT h + 1 FROM hours WHERE h < 23
+                    )
+                    SELECT h, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM hours
+                    LEFT JOIN (
+                        SELECT hour, AVG(key_count) as k, AVG(clicks) as c
+                        FROM hourly_app_stats
+                        WHERE app_name = ?
+                        GROUP BY hour
+                    ) a ON a.hour = h
+                    ORDER BY h
+                ''', (app_filter,))
+            else:
+                cursor.execute('''
+                    WITH RECURSIVE hours(h) AS (
+                        SELECT 0 UNION ALL SELECT h + 1 FROM hours WHERE h < 23
+                    )
+                    SELECT h, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM hours
+                    LEFT JOIN (
+                        SELECT hour, AVG(total_keys) as k, AVG(total_clicks) as c
+                        FROM (
+                            SELECT date, hour, SUM(key_count) as total_keys, SUM(clicks) as total_clicks
+                            FROM hourly_app_stats
+                            GROUP BY date, hour
+                        )
+                        GROUP BY hour
+                    ) a ON a.hour = h
+                    ORDER BY h
+                ''')
+            return np.asarray(cursor.fetchall(), dtype=np.float64)
+
+    def get_today_hourly_stats_dense(self, app_filter=None, today=None):
+        """Today's hourly stats as a dense (24, 3) float array.
+
+        Returns:
+            numpy array of shape (24, 3): columns hour, keys, clicks, with
+            missing hours present as zero rows.
+        """
+        if today is None:
+            today = datetime.date.today()
+        today = to_db_date(today)
+        with self._lock:
+            cursor = self._conn.cursor()
+            if app_filter and app_filter != "All Applications":
+                cursor.execute('''
+                    WITH RECURSIVE hours(h) AS (
+                        SELECT 0 UNION ALL SELECT h + 1 FROM hours WHERE h < 23
+                    )
+                    SELECT h, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM hours
+                    LEFT JOIN (
+                        SELECT hour, SUM(key_count) as k, SUM(clicks) as c
+                        FROM hourly_app_stats
+                        WHERE date = ? AND app_name = ?
+                        GROUP BY hour
+                    ) a ON a.hour = h
+                    ORDER BY h
+                ''', (today, app_filter))
+            else:
+                cursor.execute('''
+                    WITH RECURSIVE hours(h) AS (
+                        SELECT 0 UNION ALL SELECT h + 1 FROM hours WHERE h < 23
+                    )
+                    SELECT h, COALESCE(a.k, 0), COALESCE(a.c, 0)
+                    FROM hours
+                    LEFT JOIN (
+                        SELECT hour, SUM(key_count) as k, SUM(clicks) as c
+                        FROM hourly_app_stats
+                        WHERE date = ?
+                        GROUP BY hour
+                    ) a ON a.hour = h
+                    ORDER BY h
+                ''', (today,))
+            return np.asarray(cursor.fetchall(), dtype=np.float64)
+
     def get_top_app_by_weekday(self):
         """Get the most used application for each day of week.
         
         Returns list of (weekday_idx, app_name, avg_activity) where weekday_idx is 0-6 (Mon-Sun).
         Only returns entries for weekdays that have data.
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             # SQLite %w: 0=Sunday, 1=Monday, ..., 6=Saturday
             # We want to return 0=Monday, so we transform: (dow + 6) % 7
             # Calculate average by dividing total by GLOBAL count of distinct dates for that weekday
             cursor.execute('''
                 WITH global_dow_counts AS (
                     SELECT 
-                        CAST(strftime('%w', date) AS INTEGER) as dow, 
+                        (date % 7) as dow, 
                         COUNT(DISTINCT date) as total_days_for_dow
                     FROM daily_stats
                     GROUP BY dow
                 ),
                 app_dow_totals AS (
                     SELECT 
-                        CAST(strftime('%w', date) AS INTEGER) as sqlite_dow,
+                        (date % 7) as sqlite_dow,
                         app_name,
                         SUM(key_count + clicks) as total_activity
                     FROM hourly_app_stats
@@ -580,8 +1018,8 @@ class Database:
         Returns list of (hour, app_name, avg_activity) for hours 0-23.
         Only returns entries for hours that have data.
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             # Calculate average by dividing total by GLOBAL count of distinct dates
             cursor.execute('''
                 WITH global_days AS (
@@ -613,32 +1051,60 @@ class Database:
 
     def get_all_apps(self):
         """Get list of all unique app names for dropdown."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             # Try to return friendly names if available, else app_name
             # But grouping is by app_name. UI can look up friendly name.
             # Let's just return app_name sorted.
             cursor.execute('SELECT DISTINCT app_name FROM app_stats ORDER BY app_name')
             return [row[0] for row in cursor.fetchall()]
 
+    def get_apps_with_metadata_sorted(self):
+        """Get (display_name, app_name) pairs for the app dropdown.
+
+        Joins friendly names in and sorts case-insensitively in SQL, so
+        the UI can fill its combobox without a per-row metadata lookup
+        or a Python-side sort.
+        """
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute('''
+                    SELECT DISTINCT COALESCE(m.friendly_name, s.app_name), s.app_name
+                    FROM app_stats s
+                    LEFT JOIN app_metadata m ON m.app_name = s.app_name
+                    ORDER BY 1 COLLATE NOCASE
+                ''')
+            except sqlite3.OperationalError:
+                # app_metadata may not exist in very old databases
+                cursor.execute('''
+                    SELECT DISTINCT app_name, app_name
+                    FROM app_stats
+                    ORDER BY 1 COLLATE NOCASE
+                ''')
+            return cursor.fetchall()
+
     def get_apps_by_date_range(self, start_date=None, end_date=None):
         """Get list of unique app names that have activity within the date range."""
         if start_date is None or end_date is None:
             return self.get_all_apps()
             
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.flush()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 SELECT DISTINCT app_name 
                 FROM app_stats 
                 WHERE date BETWEEN ? AND ? 
                 ORDER BY app_name
-            ''', (start_date, end_date))
+            ''', (to_db_date(start_date), to_db_date(end_date)))
             return [row[0] for row in cursor.fetchall()]
 
     def _migrate_app_metadata_schema(self):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_metadata (
                     app_name TEXT PRIMARY KEY,
@@ -646,7 +1112,7 @@ class Database:
                     exe_path TEXT
                 )
             ''')
-            conn.commit()
+            self._conn.commit()
 
     def update_app_metadata(self, app_name, friendly_name, exe_path):
         """Update or insert app metadata."""
@@ -656,8 +1122,8 @@ class Database:
         # Let's add it to init_db actually, but since I am editing here...
         # I'll rely on init_db calling it if I add it there, or just call it.
         # Let's just execute the create if not exists here to be safe for this patch.
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS app_metadata (
                     app_name TEXT PRIMARY KEY,
@@ -672,12 +1138,13 @@ class Database:
                     friendly_name = excluded.friendly_name,
                     exe_path = excluded.exe_path
             ''', (app_name, friendly_name, exe_path))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
 
     def get_app_metadata_dict(self):
         """Return dict {app_name: {'friendly_name': ..., 'exe_path': ...}}."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             # Check table exists first
             try:
                 cursor.execute("SELECT app_name, friendly_name, exe_path FROM app_metadata")
@@ -686,24 +1153,75 @@ class Database:
             except sqlite3.OperationalError:
                 return {}
 
+    def clear_all_data(self):
+        """Delete every tracked stat (app_metadata keeps friendly names).
+
+        All seven DELETEs run as one executescript batch: a single
+        Python->SQLite round-trip and one transaction/fsync, followed by
+        VACUUM so the freed pages go back to the filesystem.
+        """
+        with self._lock:
+            # Drop buffered deltas first so a later flush can't
+            # resurrect pre-clear counts
+            self._pending_daily = {}
+            self._pending_app = {}
+            self._pending_heatmap = {}
+            self._conn.executescript('''
+                BEGIN IMMEDIATE;
+                DELETE FROM daily_stats;
+                DELETE FROM app_stats;
+                DELETE FROM heatmap_data;
+                DELETE FROM mouse_heatmap_data;
+                DELETE FROM app_heatmap_data;
+                DELETE FROM app_mouse_heatmap_data;
+                DELETE FROM hourly_app_stats;
+                COMMIT;
+            ''')
+            self._conn.execute("VACUUM")
+            self.data_version += 1
+
     # ==================== Screen Time / Foreground Time Methods ====================
     
     def update_foreground_time(self, date, hour, app_name, duration_seconds):
         """Update app foreground time for a specific date and hour."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 INSERT INTO app_foreground_time (date, hour, app_name, duration_seconds)
                 VALUES (?, ?, ?, ?)
                 ON CONFLICT(date, hour, app_name) DO UPDATE SET
                     duration_seconds = duration_seconds + excluded.duration_seconds
             ''', (date, hour, app_name, duration_seconds))
-            conn.commit()
+            self._conn.commit()
+            self.data_version += 1
+
+    def update_foreground_times(self, rows):
+        """Apply many foreground-time deltas in a single transaction.
+
+        Args:
+            rows: Iterable of (date, hour, app_name, duration_seconds) tuples.
+        """
+        rows = [(to_db_date(date), hour, app_name, duration_seconds)
+                for date, hour, app_name, duration_seconds in rows]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany('''
+                INSERT INTO app_foreground_time (date, hour, app_name, duration_seconds)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(date, hour, app_name) DO UPDATE SET
+                    duration_seconds = duration_seconds + excluded.duration_seconds
+            ''', rows)
+            self._conn.commit()
+            self.data_version += 1
 
     def get_foreground_time_by_app(self, start_date, end_date):
         """Get total foreground time per app within date range. Returns list of (app_name, total_seconds)."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute('''
                 SELECT app_name, SUM(duration_seconds) as total_seconds
                 FROM app_foreground_time
@@ -715,8 +1233,9 @@ class Database:
 
     def get_foreground_time_hourly(self, date, app_filter=None):
         """Get hourly foreground time for a specific date. Returns list of (hour, total_seconds)."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        date = to_db_date(date)
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT hour, SUM(duration_seconds) as total_seconds
@@ -737,8 +1256,10 @@ class Database:
 
     def get_foreground_time_daily(self, start_date, end_date, app_filter=None):
         """Get daily foreground time for date range. Returns list of (date, total_seconds)."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT date, SUM(duration_seconds) as total_seconds
@@ -755,12 +1276,14 @@ class Database:
                     GROUP BY date
                     ORDER BY date ASC
                 ''', (start_date, end_date))
-            return cursor.fetchall()
+            return [(from_db_date(r[0]), r[1]) for r in cursor.fetchall()]
 
     def get_total_foreground_time(self, start_date, end_date, app_filter=None):
         """Get total foreground time for date range in seconds."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        start_date = to_db_date(start_date)
+        end_date = to_db_date(end_date)
+        with self._lock:
+            cursor = self._conn.cursor()
             if app_filter and app_filter != "All Applications":
                 cursor.execute('''
                     SELECT SUM(duration_seconds)
@@ -9,6 +9,8 @@ import os
 import datetime
 from typing import Optional, Dict, List, Any, Tuple
 
+from .database import to_db_date, from_db_date
+
 
 class DataExporter:
     """Handles data export operations for ActivityTrack."""
@@ -64,7 +66,7 @@ class DataExporter:
                         FROM daily_stats
                         WHERE date BETWEEN ? AND ?
                         ORDER BY date ASC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT date, key_count, mouse_click_count, mouse_distance, scroll_distance
@@ -79,7 +81,7 @@ class DataExporter:
                     writer.writerow(['Date', 'Keystrokes', 'Mouse Clicks', 'Mouse Distance (m)', 'Scroll Distance'])
                     for row in rows:
                         # Ensure date is formatted as ISO string (YYYY-MM-DD)
-                        date_val = row[0]
+                        date_val = from_db_date(row[0])
                         if hasattr(date_val, 'isoformat'):
                             date_str = date_val.isoformat()
                         else:
@@ -119,7 +121,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY app_name
                         ORDER BY keys DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT 
@@ -174,7 +176,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY key_code
                         ORDER BY total_count DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT key_code, SUM(count) as total_count
@@ -219,7 +221,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY app_name
                         ORDER BY total_seconds DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT app_name, SUM(duration_seconds) as total_seconds
@@ -327,7 +329,7 @@ class DataExporter:
                         FROM daily_stats
                         WHERE date BETWEEN ? AND ?
                         ORDER BY date ASC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT date, key_count, mouse_click_count, mouse_distance, scroll_distance
@@ -337,7 +339,7 @@ class DataExporter:
                 
                 for row in cursor.fetchall():
                     data['daily_stats'].append({
-                        'date': str(row[0]),
+                        'date': str(from_db_date(row[0])),
                         'keystrokes': row[1] or 0,
                         'mouse_clicks': row[2] or 0,
                         'mouse_distance': row[3] or 0,
@@ -357,7 +359,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY app_name
                         ORDER BY keys DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT 
@@ -394,7 +396,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY key_code
                         ORDER BY total_count DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT key_code, SUM(count) as total_count
@@ -417,7 +419,7 @@ class DataExporter:
                         WHERE date BETWEEN ? AND ?
                         GROUP BY app_name
                         ORDER BY total_seconds DESC
-                    ''', (start_date, end_date))
+                    ''', (to_db_date(start_date), to_db_date(end_date)))
                 else:
                     cursor.execute('''
                         SELECT app_name, SUM(duration_seconds) as total_seconds
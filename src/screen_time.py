@@ -9,6 +9,10 @@ from __future__ import annotations
 import datetime
 from typing import Iterable, Iterator
 
+_HOUR = 3600.0
+_ONE_HOUR = datetime.timedelta(hours=1)
+_ONE_DAY = datetime.timedelta(days=1)
+
 
 def split_interval_by_local_hour(start_ts: float, end_ts: float) -> list[tuple[datetime.date, int, float]]:
     """Split a time interval into local-hour buckets.
@@ -23,12 +27,59 @@ def split_interval_by_local_hour(start_ts: float, end_ts: float) -> list[tuple[d
 
     Notes:
         - Uses local time via datetime.fromtimestamp().
-        - Guards against pathological DST/clock issues that could cause non-
-          increasing boundaries.
+        - Hour boundaries are computed arithmetically (one timezone conversion
+          for the whole interval instead of two per hour); if the local-hour
+          grid is not uniform across the interval (a DST transition), the
+          per-hour fallback below handles it.
     """
     if end_ts <= start_ts:
         return []
 
+    start_ts = float(start_ts)
+    end_ts = float(end_ts)
+
+    dt0 = datetime.datetime.fromtimestamp(start_ts)
+    hour0 = dt0.replace(minute=0, second=0, microsecond=0)
+    base = hour0.timestamp()
+    n = int((end_ts - base) // _HOUR)
+
+    # The arithmetic grid is valid only if local hours are exactly 3600s
+    # apart across the whole interval. A UTC-offset change in between
+    # shifts the wall clock at the last boundary away from the arithmetic
+    # prediction, so one fromtimestamp comparison catches it.
+    last = hour0 + datetime.timedelta(hours=n)
+    if base > start_ts or datetime.datetime.fromtimestamp(base + _HOUR * n) != last:
+        return _split_interval_by_local_hour_slow(start_ts, end_ts)
+
+    # The guard above proved the grid is uniform, so the walk needs no
+    # datetime arithmetic at all: an integer hour counter plus one date
+    # object that only advances at midnight.
+    segments: list[tuple[datetime.date, int, float]] = []
+    cursor = start_ts
+    day = hour0.date()
+    hour = hour0.hour
+    for i in range(n + 1):
+        slice_end = min(end_ts, base + _HOUR * (i + 1))
+        seconds = slice_end - cursor
+        if seconds > 0:
+            segments.append((day, hour, seconds))
+        cursor = slice_end
+        if cursor >= end_ts:
+            break
+        hour += 1
+        if hour == 24:
+            hour = 0
+            day = day + _ONE_DAY
+
+    return segments
+
+
+def _split_interval_by_local_hour_slow(start_ts: float, end_ts: float) -> list[tuple[datetime.date, int, float]]:
+    """Per-hour fallback used when a DST transition breaks the 3600s grid.
+
+    Guards against pathological DST/clock issues that could cause non-
+    increasing boundaries.
+    """
     segments: list[tuple[datetime.date, int, float]] = []
     cursor = float(start_ts)
     end_ts = float(end_ts)
@@ -36,7 +87,7 @@ def split_interval_by_local_hour(start_ts: float, end_ts: float) -> list[tuple[d
     while cursor < end_ts:
         dt = datetime.datetime.fromtimestamp(cursor)
         hour_start = dt.replace(minute=0, second=0, microsecond=0)
-        next_hour = hour_start + datetime.timedelta(hours=1)
+        next_hour = hour_start + _ONE_HOUR
         next_boundary = next_hour.timestamp()
 
         # Safety: avoid infinite loops if boundary is not advancing (DST weirdness)
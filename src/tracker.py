@@ -12,7 +12,7 @@ import psutil
 from .database import Database
 from .screen_time import split_interval_by_local_hour
 import datetime
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 
 # Ctypes definitions
 user32 = ctypes.windll.user32
@@ -61,6 +61,12 @@ HOOKPROC = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, LPARAM)
 user32.CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, LPARAM]
 user32.CallNextHookEx.restype = LRESULT
 
+# Compact snapshot of just the fields the break reminder inspects
+ReminderSnapshot = namedtuple('ReminderSnapshot', [
+    'buffer_keys', 'buffer_clicks', 'buffer_distance', 'buffer_scroll',
+    'foreground_app_count'
+])
+
 class ActivityTrack:
     def __init__(self, db_path="tracker.db"):
         self.db = Database(db_path)
@@ -81,7 +87,7 @@ class ActivityTrack:
         # Screen time tracking
         # Buffer by (date, hour, app_name) to avoid dumping long spans into a single hour.
         # Values are float seconds.
-        self.foreground_time_buffer = {}  # {(date, hour, app_name): seconds}
+        self.foreground_time_buffer = defaultdict(float)  # {(date, hour, app_name): seconds}
         self.current_foreground_app = None
         self.foreground_app_start_time = None
         
@@ -125,7 +131,7 @@ class ActivityTrack:
             if seconds <= 0:
                 continue
             key = (date_part, hour_part, app_name)
-            self.foreground_time_buffer[key] = self.foreground_time_buffer.get(key, 0.0) + float(seconds)
+            self.foreground_time_buffer[key] += float(seconds)
 
     def _detect_and_handle_suspend_gap_unlocked(self, current_time: float) -> bool:
         """Detect a large wall-clock gap and reset tracking to avoid overcounting.
@@ -248,6 +254,7 @@ class ActivityTrack:
         # Flush remaining foreground time
         self._record_foreground_time()
         self.flush_stats()
+        self.db.checkpoint()
 
     def foreground_track_loop(self):
         """Track foreground window changes every second."""
@@ -333,21 +340,29 @@ class ActivityTrack:
         """Record current foreground app's accumulated time before flush."""
         current_time = time.time()
         with self.lock:
-            # If we resumed from suspend, skip attributing the gap.
-            if self._detect_and_handle_suspend_gap_unlocked(current_time):
-                return
+            self._record_foreground_time_unlocked(current_time)
 
-            if self.is_idle and self.idle_start_time:
-                # Record accumulated idle time
-                self._add_foreground_duration('[Idle]', self.idle_start_time, current_time)
-                # Reset idle start time but keep idle state
-                self.idle_start_time = current_time
-            elif self.current_foreground_app and self.foreground_app_start_time:
-                elapsed = current_time - self.foreground_app_start_time
-                if elapsed > 0 and self.current_foreground_app != "Unknown":
-                    self._add_foreground_duration(self.current_foreground_app, self.foreground_app_start_time, current_time)
-                # Reset start time but keep current app
-                self.foreground_app_start_time = current_time
+    def _record_foreground_time_unlocked(self, current_time):
+        """Lock-free body of _record_foreground_time.
+
+        Callers already holding self.lock (batched ticks, flush paths)
+        use this directly so consecutive calls don't re-acquire the lock.
+        """
+        # If we resumed from suspend, skip attributing the gap.
+        if self._detect_and_handle_suspend_gap_unlocked(current_time):
+            return
+
+        if self.is_idle and self.idle_start_time:
+            # Record accumulated idle time
+            self._add_foreground_duration('[Idle]', self.idle_start_time, current_time)
+            # Reset idle start time but keep idle state
+            self.idle_start_time = current_time
+        elif self.current_foreground_app and self.foreground_app_start_time:
+            elapsed = current_time - self.foreground_app_start_time
+            if elapsed > 0 and self.current_foreground_app != "Unknown":
+                self._add_foreground_duration(self.current_foreground_app, self.foreground_app_start_time, current_time)
+            # Reset start time but keep current app
+            self.foreground_app_start_time = current_time
 
     def get_foreground_time_snapshot(self):
         """Get a thread-safe snapshot of current foreground time buffer."""
@@ -378,6 +393,26 @@ class ActivityTrack:
 
             return dict(totals)
 
+    def get_reminder_snapshot(self):
+        """Lightweight snapshot of the fields the break reminder checks.
+
+        Takes the lock once and skips the DB queries and heatmap copies
+        done by get_stats_snapshot(), which the reminder doesn't need.
+        """
+        with self.lock:
+            today = datetime.date.today()
+            apps = {app_name for (date_part, _hour_part, app_name)
+                    in self.foreground_time_buffer if date_part == today}
+            if self.current_foreground_app and self.current_foreground_app != "Unknown":
+                apps.add(self.current_foreground_app)
+            return ReminderSnapshot(
+                buffer_keys=self.key_buffer,
+                buffer_clicks=self.click_buffer,
+                buffer_distance=self.distance_buffer,
+                buffer_scroll=self.scroll_buffer,
+                foreground_app_count=len(apps)
+            )
+
     def get_stats_snapshot(self):
         """Get a thread-safe snapshot of current buffers + DB stats."""
         with self.lock:
@@ -688,6 +723,10 @@ class ActivityTrack:
             time.sleep(5)
             self._record_foreground_time()  # Record current foreground time before flush
             self.flush_stats()
+            # Checkpoint the WAL while the user is away; rate-limited
+            # inside the database so this is cheap to call every cycle.
+            if self.is_idle:
+                self.db.checkpoint()
 
     def flush_stats(self):
         with self.lock:
@@ -755,9 +794,16 @@ class ActivityTrack:
                 self.app_mouse_heatmap_buffer.clear()
             
             if has_time:
-                # Flush foreground time buffer
-                for (date_part, hour_part, app_name), seconds in self.foreground_time_buffer.items():
-                    if seconds > 0:
-                        self.db.update_foreground_time(date_part, hour_part, app_name, int(seconds))
-                
+                # The buffer already holds per-(date, hour, app) buckets
+                # split once at record time; write them all in a single
+                # transaction instead of one commit per row
+                self.db.update_foreground_times(
+                    (date_part, hour_part, app_name, int(seconds))
+                    for (date_part, hour_part, app_name), seconds
+                    in self.foreground_time_buffer.items() if seconds > 0)
+
                 self.foreground_time_buffer.clear()
+
+            # Drain the database's own pending-counter buffers in one
+            # transaction so everything above hits disk with one commit.
+            self.db.flush()
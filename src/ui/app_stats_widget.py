@@ -1,28 +1,46 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, 
-                                 QTableWidgetItem, QHeaderView, QLabel, QFileIconProvider)
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTableView,
+                                 QHeaderView, QLabel, QFileIconProvider,
+                                 QStyledItemDelegate)
 from PySide6.QtCore import Qt, QFileInfo
+from PySide6.QtGui import QStandardItemModel, QStandardItem
 from ..i18n import tr
 
+class DistanceDelegate(QStyledItemDelegate):
+    """Formats distance cells on paint.
+
+    The model keeps the raw float (so sorting is numeric); only the rows
+    actually painted pay for the f-string, instead of formatting every
+    row up-front in update_data.
+    """
+
+    def displayText(self, value, locale):
+        return f"{value:.2f}m"
+
+
 class AppStatsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.init_ui()
-        
+
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Table Setup
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            tr('apps.header.application'), 
-            tr('apps.header.keys'), 
-            tr('apps.header.clicks'), 
-            tr('apps.header.scrolls'), 
+
+        # Model/view setup: a QStandardItemModel behind a QTableView is
+        # much cheaper to refill than per-cell QTableWidget items, since
+        # the view re-layouts once instead of per setItem call.
+        self.model = QStandardItemModel(0, 5, self)
+        self.model.setHorizontalHeaderLabels([
+            tr('apps.header.application'),
+            tr('apps.header.keys'),
+            tr('apps.header.clicks'),
+            tr('apps.header.scrolls'),
             tr('apps.header.distance')
         ])
-        
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+
         # Styling
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch) # App name stretches
@@ -30,12 +48,14 @@ class AppStatsWidget(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        
+
+        self.table.setItemDelegateForColumn(4, DistanceDelegate(self.table))
+
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e1e;
                 color: #e0e0e0;
                 gridline-color: #333333;
@@ -48,17 +68,17 @@ class AppStatsWidget(QWidget):
                 border: none;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #00bcd4;
                 color: black;
             }
         """)
-        
+
         layout.addWidget(self.table)
-        
+
     def update_data(self, data, metadata=None):
         """
         Update table with list of tuples: (app_name, keys, clicks, scrolls, distance)
@@ -66,10 +86,12 @@ class AppStatsWidget(QWidget):
         """
         metadata = metadata or {}
         icon_provider = QFileIconProvider()
-        
+
         self.table.setSortingEnabled(False) # Disable sorting while updating
-        self.table.setRowCount(len(data))
-        
+        # One dataChanged storm per refresh instead of one per cell
+        self.model.blockSignals(True)
+        self.model.setRowCount(len(data))
+
         for row, (app, keys, clicks, scrolls, dist) in enumerate(data):
             # Resolve Metadata
             friendly_name = app
@@ -78,40 +100,40 @@ class AppStatsWidget(QWidget):
                 meta = metadata[app]
                 friendly_name = meta.get('friendly_name') or app
                 exe_path = meta.get('exe_path')
-            
+
             # App Name Item with Icon
-            name_item = QTableWidgetItem(str(friendly_name))
-            
+            name_item = QStandardItem(str(friendly_name))
+
             # Load Icon
             if exe_path:
                 info = QFileInfo(exe_path)
                 icon = icon_provider.icon(info)
                 if not icon.isNull():
                     name_item.setIcon(icon)
-            
+
             name_item.setToolTip(app) # Show real exe name on hover
-            self.table.setItem(row, 0, name_item)
-            
+            self.model.setItem(row, 0, name_item)
+
             # Keys
-            keys_item = QTableWidgetItem()
-            keys_item.setData(Qt.DisplayRole, keys)
-            self.table.setItem(row, 1, keys_item)
-            
+            keys_item = QStandardItem()
+            keys_item.setData(keys, Qt.DisplayRole)
+            self.model.setItem(row, 1, keys_item)
+
             # Clicks
-            clicks_item = QTableWidgetItem()
-            clicks_item.setData(Qt.DisplayRole, clicks)
-            self.table.setItem(row, 2, clicks_item)
-            
+            clicks_item = QStandardItem()
+            clicks_item.setData(clicks, Qt.DisplayRole)
+            self.model.setItem(row, 2, clicks_item)
+
             # Scrolls
-            scrolls_item = QTableWidgetItem()
-            scrolls_item.setData(Qt.DisplayRole, scrolls)
-            self.table.setItem(row, 3, scrolls_item)
-            
-            # Distance
-            dist_str = f"{dist:.2f}m"
-            dist_item = QTableWidgetItem()
-            dist_item.setData(Qt.DisplayRole, dist) # Sort by value
-            dist_item.setText(dist_str) # Display string
-            self.table.setItem(row, 4, dist_item)
-            
+            scrolls_item = QStandardItem()
+            scrolls_item.setData(scrolls, Qt.DisplayRole)
+            self.model.setItem(row, 3, scrolls_item)
+
+            # Distance: raw float; the column delegate formats on paint
+            dist_item = QStandardItem()
+            dist_item.setData(dist, Qt.DisplayRole)
+            self.model.setItem(row, 4, dist_item)
+
+        self.model.blockSignals(False)
+        self.model.layoutChanged.emit() # Repaint once with the new rows
         self.table.setSortingEnabled(True) # Re-enable sorting
@@ -3,15 +3,30 @@ History Chart Widget - Displays detailed analytics with app filtering
 """
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QComboBox, QFrame, QStackedWidget)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker
 from PySide6.QtGui import QFont
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib import font_manager
+from matplotlib.colors import to_rgba_array
 import matplotlib.pyplot as plt
 import datetime
+import functools
+import os
+import numpy as np
 from ..i18n import tr, tr_list, get_language
 
+# dark_background plus the static spine/tick/grid chrome for all charts
+_MPL_STYLE = ['dark_background',
+              os.path.join(os.path.dirname(__file__), 'activitytrack.mplstyle')]
+
+# Lookback spans per mode, built once at import
+_RANGE_SPANS = {
+    'week': datetime.timedelta(days=6),
+    'month': datetime.timedelta(days=29),
+    'year': datetime.timedelta(days=364),
+}
+
 # Common Styles
 BTN_STYLE_BAR = """
     QPushButton {
@@ -75,6 +90,10 @@ COMBO_STYLE = """
     }
 """
 
+# Bar colors for the top-apps charts, cycled per unique app
+_TOP_APPS_PALETTE = np.array(
+    ['#00e676', '#2196f3', '#ff9800', '#e91e63', '#9c27b0', '#00bcd4', '#ffeb3b'])
+
 _CJK_FONT_CANDIDATES = [
     "Microsoft YaHei",
     "SimHei",
@@ -83,13 +102,36 @@ _CJK_FONT_CANDIDATES = [
     "WenQuanYi Micro Hei"
 ]
 
-_FONT_INITIALIZED = False
+
+@functools.lru_cache(maxsize=1)
+def _cjk_font():
+    """Return the first installed CJK font candidate, or None.
+
+    The fontManager.ttflist scan can cover thousands of fonts, so the
+    result is cached for the life of the process.
+    """
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    for font_name in _CJK_FONT_CANDIDATES:
+        if font_name in installed:
+            return font_name
+    return None
 
 
 class BaseChartWidget(QWidget):
     """Base widget for shared chart functionality."""
+
+    # Shared bin/tick positions, built once instead of per redraw
+    _HOURS_X = np.arange(24)
+    _EVEN_HOUR_TICKS = np.arange(0, 24, 2)
+    _WEEKDAY_X = np.arange(7)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.current_app = None
+        # Set when a filter change arrives while this widget is hidden;
+        # the redraw is deferred to the next showEvent so only the
+        # visible chart pays for each filter change.
+        self._dirty = False
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(10)
@@ -99,8 +141,28 @@ class BaseChartWidget(QWidget):
         self.layout.addLayout(self.header)
         
         # Chart
-        plt.style.use('dark_background')
+        plt.style.use(_MPL_STYLE)
         self._ensure_font_support()
+
+        # Translated strings used on every refresh, resolved once per
+        # widget: a language change requires an app restart, so these
+        # never go stale and each redraw costs attribute loads instead
+        # of catalog lookups.
+        self._s = {
+            'keys': tr('history.legend.keys'),
+            'clicks': tr('history.legend.clicks'),
+            'avg_keys': tr('history.legend.avg_keys'),
+            'avg_clicks': tr('history.legend.avg_clicks'),
+            'activity': tr('history.legend.activity'),
+            'no_data': tr('history.no_data'),
+            'today': tr('history.chart.today'),
+            'history': tr('history.chart.history'),
+            'weekday': tr('history.chart.weekday'),
+            'hourly': tr('history.chart.hourly'),
+            'top_apps_weekday': tr('history.chart.top_apps_weekday'),
+            'top_apps_hourly': tr('history.chart.top_apps_hourly'),
+        }
+        self._weekdays = tr_list('history.weekdays')
         # Taller figure since we only have one chart now
         self.figure = Figure(figsize=(10, 6), facecolor='#1e1e1e')
         self.canvas = FigureCanvas(self.figure)
@@ -125,34 +187,39 @@ class BaseChartWidget(QWidget):
 
     def on_mode_changed(self, key):
         raise NotImplementedError
+
+    def update_filter(self, app_name):
+        self.current_app = app_name
+        self.request_refresh()
+
+    def request_refresh(self):
+        """Redraw now if visible, otherwise defer to the next showEvent."""
+        if self.isVisible():
+            self.refresh()
+        else:
+            self._dirty = True
+
+    def showEvent(self, event):
+        if self._dirty:
+            self._dirty = False
+            self.refresh()
+        super().showEvent(event)
     
     def set_common_style(self, ax, title_text):
-        ax.set_title(title_text, color='#dddddd', pad=20)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_color('#3d3d3d')
-        ax.spines['left'].set_color('#3d3d3d')
-        ax.tick_params(colors='#aaaaaa')
-        ax.grid(True, alpha=0.1)
+        # Spine/tick/grid/title styling comes from activitytrack.mplstyle
+        ax.set_title(title_text)
         ax.set_ylim(bottom=0) # Non-negative axis
 
     def _ensure_font_support(self):
         """Configure matplotlib fonts so Chinese labels render correctly."""
-        global _FONT_INITIALIZED
-        if _FONT_INITIALIZED:
-            return
-        _FONT_INITIALIZED = True
-
         if get_language() != 'zh':
             return
 
-        installed = {f.name for f in font_manager.fontManager.ttflist}
-        for font_name in _CJK_FONT_CANDIDATES:
-            if font_name in installed:
-                plt.rcParams['font.family'] = font_name
-                plt.rcParams['font.sans-serif'] = [font_name, 'DejaVu Sans']
-                plt.rcParams['axes.unicode_minus'] = False
-                break
+        font_name = _cjk_font()
+        if font_name:
+            plt.rcParams['font.family'] = font_name
+            plt.rcParams['font.sans-serif'] = [font_name, 'DejaVu Sans']
+            plt.rcParams['axes.unicode_minus'] = False
 
 class TimelineWidget(BaseChartWidget):
     """Displays user activity over time (Today/Week/History)."""
@@ -161,6 +228,21 @@ class TimelineWidget(BaseChartWidget):
         self.db = db
         self.current_app = None
         self.current_mode = 'today'
+
+        # Query-result cache so flipping range buttons doesn't re-run the
+        # same SQL. Entries are keyed by (mode, app, date); the whole
+        # cache is dropped when the database's data_version moves on.
+        self._cache = {}
+        self._cache_version = -1
+
+        # Incremental-redraw state: the axes and its artists are built
+        # once per plot kind ('today'/'history'/'empty') and updated in
+        # place afterwards, skipping the axes/spine/grid reconstruction
+        # that figure.clear() forces on every toggle.
+        self._plot_kind = None
+        self._ax = None
+        self._bars = None
+        self._clicks_line = None
         
         # Buttons
         self.setup_buttons([
@@ -172,17 +254,29 @@ class TimelineWidget(BaseChartWidget):
         self.set_active_button('today')
         
     def on_mode_changed(self, key):
+        if key == self.current_mode:
+            # Qt emits clicked even on the already-checked button
+            return
         self.current_mode = key
         self.set_active_button(key)
         self.refresh()
-        
-    def update_filter(self, app_name):
-        self.current_app = app_name
-        self.refresh()
+
+    def _cached_query(self, key, query):
+        """Return a cached query result, re-running it only when stale.
+
+        Args:
+            key: Hashable cache key identifying the query variant.
+            query: Zero-argument callable producing the rows.
+        """
+        version = getattr(self.db, 'data_version', 0)
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+        if key not in self._cache:
+            self._cache[key] = query()
+        return self._cache[key]
         
     def refresh(self):
-        self.figure.clear()
-        
         try:
             if self.current_mode == 'today':
                 self.plot_today()
@@ -190,69 +284,102 @@ class TimelineWidget(BaseChartWidget):
                 self.plot_history()
         except Exception as e:
             print(f"Chart Error: {e}")
-            
-        self.canvas.draw()
+
+        self.canvas.draw_idle()
+
+    def _get_axes(self, kind):
+        """Return the chart axes, rebuilding only on plot-kind changes."""
+        if self._plot_kind != kind:
+            self.figure.clear()
+            self._ax = self.figure.add_subplot(111)
+            self._plot_kind = kind
+            self._bars = None
+            self._clicks_line = None
+        return self._ax
         
     def plot_today(self):
-        ax = self.figure.add_subplot(111)
-        data = self.db.get_today_hourly_stats(self.current_app)
-        # data: list of (hour, keys, clicks)
-        
-        # Fill all 24 hours
-        hours = list(range(24))
-        keys_map = {r[0]: r[1] or 0 for r in data}
-        clicks_map = {r[0]: r[2] or 0 for r in data}
-        
-        keys = [keys_map.get(h, 0) for h in hours]
-        clicks = [clicks_map.get(h, 0) for h in hours]
-        
-        # Plot keys as bars
-        ax.bar(hours, keys, color='#00e676', alpha=0.7, label=tr('history.legend.keys'))
-        
-        ax.plot(hours, clicks, 'o-', color='#2196f3', linewidth=2, label=tr('history.legend.clicks'))
-        
-        self.set_common_style(ax, tr('history.chart.today'))
-        ax.set_xlabel("Hour")
-        ax.set_ylabel("Count")
-        ax.legend()
-        ax.set_xticks(hours[::2])
+        ax = self._get_axes('today')
+        today = datetime.date.today()
+        # The dense query LEFT JOINs onto a generated 0-23 series, so all
+        # 24 bins arrive zero-filled straight from SQLite
+        arr = self._cached_query(
+            ('today', self.current_app, today),
+            lambda: self.db.get_today_hourly_stats_dense(self.current_app, today=today))
+        hours = self._HOURS_X
+        keys = arr[:, 1]
+        clicks = arr[:, 2]
+        
+        if self._bars is None:
+            # First draw for this kind: build bars, line and styling once
+            self._bars = ax.bar(hours, keys, color='#00e676', alpha=0.7,
+                                label=self._s['keys'])
+            self._clicks_line, = ax.plot(hours, clicks, 'o-', color='#2196f3',
+                                         linewidth=2, label=self._s['clicks'])
+            self.set_common_style(ax, self._s['today'])
+            ax.set_xlabel("Hour")
+            ax.set_ylabel("Count")
+            ax.legend()
+            ax.set_xticks(self._EVEN_HOUR_TICKS)
+        else:
+            # Same 24 bars every time: just move the heights and the line
+            for rect, height in zip(self._bars, keys):
+                rect.set_height(height)
+            self._clicks_line.set_ydata(clicks)
+            # relim() ignores patch heights, so compute the y range directly
+            top = max(keys.max(), clicks.max())
+            ax.set_ylim(0, top * 1.1 if top > 0 else 1)
         
     def plot_history(self):
         today = datetime.date.today()
         start_date = today
         
         if self.current_mode == 'week':
-            start_date = today - datetime.timedelta(days=6)
+            start_date = today - _RANGE_SPANS['week']
         elif self.current_mode == 'month':
-            start_date = today - datetime.timedelta(days=29)
+            start_date = today - _RANGE_SPANS['month']
         elif self.current_mode == 'year':
-            start_date = today - datetime.timedelta(days=364)
+            start_date = today - _RANGE_SPANS['year']
             
-        raw_data = self.db.get_daily_history(start_date, today, self.current_app)
+        raw_data = self._cached_query(
+            (self.current_mode, self.current_app, today),
+            lambda: self.db.get_daily_history(start_date, today, self.current_app))
         
         if not raw_data:
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, tr('history.no_data'), ha='center', color='gray')
+            ax = self._get_axes('empty')
+            for old_text in list(ax.texts):
+                old_text.remove()
+            ax.text(0.5, 0.5, self._s['no_data'], ha='center', color='gray')
             ax.set_facecolor('#1e1e1e')
             return
 
-        dates = [r[0] for r in raw_data]
+        # One object array, sliced by column; NULL counts become zeros in
+        # a vectorized pass instead of per-row `or 0` comprehensions.
+        arr = np.asarray(raw_data, dtype=object)
+        dates = arr[:, 0]
         if isinstance(dates[0], str):
-            dates = [datetime.datetime.strptime(d, '%Y-%m-%d').date() for d in dates]
-            
-        keys = [r[1] or 0 for r in raw_data]
-        clicks = [r[2] or 0 for r in raw_data]
-        
-        ax = self.figure.add_subplot(111)
-        # Plot keys as bars (convert dates to numbers for bar width logic if needed, but matplotlib handles dates well)
-        # We might need to adjust width if it's too thin/thick. Auto usually works okay for simple time series.
-        # Let's try standard bar first.
-        ax.bar(dates, keys, color='#00e676', alpha=0.7, label=tr('history.legend.keys'))
-        
-        ax.plot(dates, clicks, 'o-', color='#2196f3', linewidth=2, label=tr('history.legend.clicks'))
-        
-        self.set_common_style(ax, tr('history.chart.history'))
-        ax.legend()
+            # Legacy TEXT dates: numpy parses ISO-8601 in C, instead of a
+            # per-row Python strptime (365 calls in year mode)
+            dates = np.asarray(dates, dtype='datetime64[D]')
+
+        keys = np.where(np.equal(arr[:, 1], None), 0, arr[:, 1]).astype(np.float64)
+        clicks = np.where(np.equal(arr[:, 2], None), 0, arr[:, 2]).astype(np.float64)
+        
+        ax = self._get_axes('history')
+        # Bar counts differ per range, so bars are rebuilt; the clicks
+        # line and the axes styling survive via set_data.
+        if self._bars is not None:
+            self._bars.remove()
+        self._bars = ax.bar(dates, keys, color='#00e676', alpha=0.7,
+                            label=self._s['keys'])
+        if self._clicks_line is None:
+            self._clicks_line, = ax.plot(dates, clicks, 'o-', color='#2196f3',
+                                         linewidth=2, label=self._s['clicks'])
+            self.set_common_style(ax, self._s['history'])
+            ax.legend()
+        else:
+            self._clicks_line.set_data(dates, clicks)
+            ax.relim()
+            ax.autoscale_view()
         self.figure.autofmt_xdate()
 
 class InsightWidget(BaseChartWidget):
@@ -263,7 +390,33 @@ class InsightWidget(BaseChartWidget):
         self.current_app = None
         self.current_mode = 'weekday'
         self.top_apps_submode = 'weekday'  # Sub-mode for Top Apps (weekday or hourly)
-        
+
+        # Incremental-redraw state (see TimelineWidget): the fixed-bin
+        # weekday/hour charts reuse their bars and line across refreshes;
+        # the top-apps charts are rebuilt each time since bar colors,
+        # labels and legend all change with the data.
+        self._plot_kind = None
+        self._ax = None
+        self._bars = None
+        self._clicks_line = None
+
+        # Blitting state: the weekday/hour bars and line are animated
+        # artists, so a full draw renders only the static background
+        # (spines, ticks, legend). _on_draw captures that background and
+        # refresh() composites the dynamic artists over it with blit(),
+        # skipping layout and tick rendering entirely.
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Legend handles for the hourly top-apps chart, keyed by the app
+        # set; Patch objects are only rebuilt when that set changes
+        self._legend_cache = {}
+
+        # App metadata shared by both top-apps plots, re-fetched only
+        # when the database's data_version moves on
+        self._metadata_cache = None
+        self._metadata_version = -1
+
         self.setup_buttons([
             ('weekday', tr('history.weekday')),
             ('hour', tr('history.hourly')),
@@ -297,197 +450,254 @@ class InsightWidget(BaseChartWidget):
         self.sub_toggle_frame.hide()  # Hidden by default
         
     def set_top_apps_submode(self, mode):
+        if mode == self.top_apps_submode:
+            return
         self.top_apps_submode = mode
         self.btn_top_weekday.setChecked(mode == 'weekday')
         self.btn_top_hourly.setChecked(mode == 'hourly')
         self.refresh()
         
     def on_mode_changed(self, key):
+        if key == self.current_mode:
+            return
         self.current_mode = key
         self.set_active_button(key)
         # Show/hide sub-toggle based on mode
         self.sub_toggle_frame.setVisible(key == 'top_apps')
         self.refresh()
         
-    def update_filter(self, app_name):
-        self.current_app = app_name
-        self.refresh()
-        
     def refresh(self):
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         if self.current_mode == 'weekday':
-            self.plot_weekday(ax)
+            self.plot_weekday(self._get_axes('weekday'))
         elif self.current_mode == 'hour':
-            self.plot_hourly(ax)
+            self.plot_hourly(self._get_axes('hour'))
         elif self.current_mode == 'top_apps':
             if self.top_apps_submode == 'weekday':
-                self.plot_top_apps_weekday(ax)
+                self.plot_top_apps_weekday(self._get_axes(('top', 'weekday'), fresh=True))
             else:
-                self.plot_top_apps_hourly(ax)
-            
-        self.canvas.draw()
+                self.plot_top_apps_hourly(self._get_axes(('top', 'hourly'), fresh=True))
+
+        if self._bg is not None and self._bars is not None:
+            # Background (axes frame, ticks, legend) is still valid:
+            # repaint just the bars and the line over the cached pixels.
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.figure.bbox)
+        else:
+            self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """Recapture the static background after every full draw.
+
+        Fires on resize and on the first draw of a plot kind; animated
+        artists are excluded from the regular render, so the snapshot
+        holds only the static chrome.
+        """
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        if self._bars is not None:
+            for rect in self._bars:
+                self._ax.draw_artist(rect)
+        if self._clicks_line is not None:
+            self._ax.draw_artist(self._clicks_line)
+
+    def _app_metadata(self):
+        """Return the app metadata dict, cached per database version."""
+        version = getattr(self.db, 'data_version', 0)
+        if self._metadata_cache is None or version != self._metadata_version:
+            self._metadata_cache = self.db.get_app_metadata_dict()
+            self._metadata_version = version
+        return self._metadata_cache
+
+    def _rescale_y(self, ax, avg_keys, avg_clicks):
+        """Fit the y axis to the data; a limit change redraws the ticks."""
+        top = float(max(np.max(avg_keys), np.max(avg_clicks)))
+        new_lim = (0, top * 1.1 if top > 0 else 1)
+        if ax.get_ylim() != new_lim:
+            ax.set_ylim(*new_lim)
+            # Tick labels belong to the cached background; invalidate it
+            # so refresh() falls back to one full draw.
+            self._bg = None
+
+    def _get_axes(self, kind, fresh=False):
+        """Return the chart axes, rebuilding only on plot-kind changes.
+
+        Args:
+            kind: Hashable plot-kind key; a change forces a full rebuild.
+            fresh: Clear the axes even for the same kind, for charts whose
+                artists cannot be updated in place.
+        """
+        if self._plot_kind != kind:
+            self.figure.clear()
+            self._ax = self.figure.add_subplot(111)
+            self._plot_kind = kind
+            self._bars = None
+            self._clicks_line = None
+            self._bg = None
+        elif fresh:
+            self._ax.clear()
+            self._bars = None
+            self._clicks_line = None
+            self._bg = None
+        return self._ax
         
     def plot_weekday(self, ax):
-        data = self.db.get_day_of_week_averages(self.current_app)
-        days_map = {int(r[0]): r for r in data}
-        
-        ordered_indices = [1, 2, 3, 4, 5, 6, 0]
-        labels = tr_list('history.weekdays')
-        
-        avg_keys = []
-        avg_clicks = []
-        
-        for idx in ordered_indices:
-            row = days_map.get(idx)
-            if row:
-                avg_keys.append(row[1] or 0)
-                avg_clicks.append(row[2] or 0)
-            else:
-                avg_keys.append(0)
-                avg_clicks.append(0)
-                
-        import numpy as np
-        x = np.arange(len(labels))
-        
-        # Plot keys as bars
-        ax.bar(x, avg_keys, color='#00e676', alpha=0.7, label=tr('history.legend.avg_keys'))
-        
-        # Plot clicks as line
-        ax.plot(x, avg_clicks, 'o-', color='#2196f3', linewidth=2, label=tr('history.legend.avg_clicks'))
-        
-        self.set_common_style(ax, tr('history.chart.weekday'))
-        ax.set_xticks(x)
-        ax.set_xticklabels(labels)
-        ax.legend()
+        arr = self.db.get_day_of_week_averages_dense(self.current_app)
+        # Dense rows come back in dow order (0=Sunday); reorder to the
+        # Monday-first display order with one fancy-index gather
+        arr = arr[[1, 2, 3, 4, 5, 6, 0]]
+        labels = self._weekdays
+        avg_keys = arr[:, 1]
+        avg_clicks = arr[:, 2]
+
+        x = self._WEEKDAY_X
+
+        if self._bars is None:
+            self._bars = ax.bar(x, avg_keys, color='#00e676', alpha=0.7,
+                                label=self._s['avg_keys'], animated=True)
+            self._clicks_line, = ax.plot(x, avg_clicks, 'o-', color='#2196f3',
+                                         linewidth=2, label=self._s['avg_clicks'],
+                                         animated=True)
+            self.set_common_style(ax, self._s['weekday'])
+            ax.set_xticks(x)
+            ax.set_xticklabels(labels)
+            ax.legend()
+            self._rescale_y(ax, avg_keys, avg_clicks)
+        else:
+            # Fixed 7 bars: move heights and the line in place
+            for rect, height in zip(self._bars, avg_keys):
+                rect.set_height(height)
+            self._clicks_line.set_ydata(avg_clicks)
+            self._rescale_y(ax, avg_keys, avg_clicks)
 
     def plot_hourly(self, ax):
-        data = self.db.get_hour_of_day_averages(self.current_app)
-        hours = list(range(24))
-        data_map = {r[0]: r for r in data}
-        
-        avg_keys = [data_map[h][1] if h in data_map else 0 for h in hours]
-        avg_clicks = [data_map[h][2] if h in data_map else 0 for h in hours]
-        
-        # Plot keys as bars
-        ax.bar(hours, avg_keys, color='#00e676', alpha=0.7, label=tr('history.legend.avg_keys'))
-        
-        # Plot clicks as line
-        ax.plot(hours, avg_clicks, 'o-', color='#2196f3', linewidth=2, label=tr('history.legend.avg_clicks'))
-        
-        self.set_common_style(ax, tr('history.chart.hourly'))
-        ax.set_xticks(hours[::2])
-        ax.legend()
+        arr = self.db.get_hour_of_day_averages_dense(self.current_app)
+        hours = self._HOURS_X
+        avg_keys = arr[:, 1]
+        avg_clicks = arr[:, 2]
+        
+        if self._bars is None:
+            self._bars = ax.bar(hours, avg_keys, color='#00e676', alpha=0.7,
+                                label=self._s['avg_keys'], animated=True)
+            self._clicks_line, = ax.plot(hours, avg_clicks, 'o-', color='#2196f3',
+                                         linewidth=2, label=self._s['avg_clicks'],
+                                         animated=True)
+            self.set_common_style(ax, self._s['hourly'])
+            ax.set_xticks(self._EVEN_HOUR_TICKS)
+            ax.legend()
+            self._rescale_y(ax, avg_keys, avg_clicks)
+        else:
+            # Fixed 24 bars: move heights and the line in place
+            for rect, height in zip(self._bars, avg_keys):
+                rect.set_height(height)
+            self._clicks_line.set_ydata(avg_clicks)
+            self._rescale_y(ax, avg_keys, avg_clicks)
 
     def plot_top_apps_weekday(self, ax):
         """Plot most used app for each weekday."""
-        import numpy as np
-        
         data = self.db.get_top_app_by_weekday()
-        labels = tr_list('history.weekdays')
+        labels = self._weekdays
         
         if not data:
-            ax.text(0.5, 0.5, tr('history.no_data'), ha='center', va='center', 
+            ax.text(0.5, 0.5, self._s['no_data'], ha='center', va='center', 
                     color='gray', fontsize=14, transform=ax.transAxes)
             ax.set_facecolor('#1e1e1e')
             return
         
         # Get metadata for friendly names
-        metadata = self.db.get_app_metadata_dict()
-        
-        # Build data for all 7 days (Mon=0 to Sun=6)
-        data_map = {r[0]: r for r in data}  # weekday_idx -> (idx, app_name, activity)
-        
-        # Collect unique apps to assign colors
-        unique_apps = list(set(r[1] for r in data))
-        color_palette = ['#00e676', '#2196f3', '#ff9800', '#e91e63', '#9c27b0', '#00bcd4', '#ffeb3b']
-        app_colors = {app: color_palette[i % len(color_palette)] for i, app in enumerate(unique_apps)}
-        
-        x = np.arange(len(labels))
-        activities = []
-        bar_colors = []
-        app_labels = []
-        
-        for idx in range(7):
-            if idx in data_map:
-                _, app_name, activity = data_map[idx]
-                activities.append(activity or 0)
-                bar_colors.append(app_colors[app_name])
-                # Get friendly name if available
-                friendly = metadata.get(app_name, {}).get('friendly_name') or app_name
-                app_labels.append(friendly)
-            else:
-                activities.append(0)
-                bar_colors.append('#555555')
-                app_labels.append('')
-        
-        bars = ax.bar(x, activities, color=bar_colors, alpha=0.8)
-        
-        # Add app name labels on bars
-        for i, (bar, label) in enumerate(zip(bars, app_labels)):
-            if label and bar.get_height() > 0:
-                # Truncate long names
-                display_label = label[:12] + '...' if len(label) > 12 else label
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(activities)*0.02,
-                       display_label, ha='center', va='bottom', fontsize=8, color='#dddddd',
-                       rotation=45)
-        
-        self.set_common_style(ax, tr('history.chart.top_apps_weekday'))
+        metadata = self._app_metadata()
+        
+        arr = np.asarray(data, dtype=object)
+        day_idx = arr[:, 0].astype(np.intp)
+        names = arr[:, 1].astype(str)
+        acts = np.where(np.equal(arr[:, 2], None), 0, arr[:, 2]).astype(np.float64)
+
+        # np.unique gives a sorted (deterministic) app order, and the
+        # inverse index turns color assignment into one palette gather
+        # instead of per-row dict lookups
+        uniq, inv = np.unique(names, return_inverse=True)
+        row_colors = _TOP_APPS_PALETTE[inv % len(_TOP_APPS_PALETTE)]
+
+        # Scatter the sparse rows into the 7 weekday slots
+        x = self._WEEKDAY_X
+        activities = np.zeros(7)
+        bar_colors = np.full(7, '#555555', dtype=object)
+        activities[day_idx] = acts
+        bar_colors[day_idx] = row_colors
+        app_labels = [''] * 7
+        for idx, app_name in zip(day_idx, names):
+            app_labels[idx] = metadata.get(app_name, {}).get('friendly_name') or app_name
+        
+        # to_rgba_array resolves the whole color sequence (and the
+        # alpha) in one vectorized pass instead of per-bar
+        bars = ax.bar(x, activities, color=to_rgba_array(bar_colors.tolist(), alpha=0.8))
+        
+        # One bar_label pass creates all the app-name texts at once;
+        # zero-height bars get an empty label (truncate long names)
+        display_labels = [
+            (label[:12] + '...' if len(label) > 12 else label) if activities[i] > 0 else ''
+            for i, label in enumerate(app_labels)
+        ]
+        ax.bar_label(bars, labels=display_labels, padding=3, rotation=45,
+                     fontsize=8, color='#dddddd')
+        
+        self.set_common_style(ax, self._s['top_apps_weekday'])
         ax.set_xticks(x)
         ax.set_xticklabels(labels)
-        ax.set_ylabel(tr('history.legend.activity'))
+        ax.set_ylabel(self._s['activity'])
 
     def plot_top_apps_hourly(self, ax):
         """Plot most used app for each hour of day."""
-        import numpy as np
-        
         data = self.db.get_top_app_by_hour()
         
         if not data:
-            ax.text(0.5, 0.5, tr('history.no_data'), ha='center', va='center', 
+            ax.text(0.5, 0.5, self._s['no_data'], ha='center', va='center', 
                     color='gray', fontsize=14, transform=ax.transAxes)
             ax.set_facecolor('#1e1e1e')
             return
         
         # Get metadata for friendly names
-        metadata = self.db.get_app_metadata_dict()
-        
-        # Build data for all 24 hours
-        data_map = {r[0]: r for r in data}  # hour -> (hour, app_name, activity)
-        
-        # Collect unique apps to assign colors
-        unique_apps = list(set(r[1] for r in data))
-        color_palette = ['#00e676', '#2196f3', '#ff9800', '#e91e63', '#9c27b0', '#00bcd4', '#ffeb3b']
-        app_colors = {app: color_palette[i % len(color_palette)] for i, app in enumerate(unique_apps)}
+        metadata = self._app_metadata()
         
-        hours = list(range(24))
-        activities = []
-        bar_colors = []
-        
-        for h in hours:
-            if h in data_map:
-                _, app_name, activity = data_map[h]
-                activities.append(activity or 0)
-                bar_colors.append(app_colors[app_name])
-            else:
-                activities.append(0)
-                bar_colors.append('#555555')
-        
-        ax.bar(hours, activities, color=bar_colors, alpha=0.8)
-        
-        # Build legend for unique apps
-        from matplotlib.patches import Patch
-        legend_elements = [Patch(facecolor=app_colors[app], alpha=0.8, 
-                                label=metadata.get(app, {}).get('friendly_name') or app[:15])
-                         for app in unique_apps]
+        arr = np.asarray(data, dtype=object)
+        hour_idx = arr[:, 0].astype(np.intp)
+        names = arr[:, 1].astype(str)
+        acts = np.where(np.equal(arr[:, 2], None), 0, arr[:, 2]).astype(np.float64)
+
+        # Sorted-unique apps keep colors and legend order stable across
+        # refreshes; colors come from one vectorized palette gather
+        uniq, inv = np.unique(names, return_inverse=True)
+        row_colors = _TOP_APPS_PALETTE[inv % len(_TOP_APPS_PALETTE)]
+
+        # Scatter the sparse rows into the 24 hour slots
+        hours = self._HOURS_X
+        activities = np.zeros(24)
+        bar_colors = np.full(24, '#555555', dtype=object)
+        activities[hour_idx] = acts
+        bar_colors[hour_idx] = row_colors
+        
+        ax.bar(hours, activities, color=to_rgba_array(bar_colors.tolist(), alpha=0.8))
+        
+        # Build legend for unique apps, reusing handles while the app
+        # set is unchanged (np.unique keeps the key order stable)
+        legend_key = tuple(uniq)
+        legend_elements = self._legend_cache.get(legend_key)
+        if legend_elements is None:
+            from matplotlib.patches import Patch
+            legend_elements = [Patch(facecolor=_TOP_APPS_PALETTE[i % len(_TOP_APPS_PALETTE)],
+                                    alpha=0.8,
+                                    label=metadata.get(app, {}).get('friendly_name') or app[:15])
+                             for i, app in enumerate(uniq)]
+            self._legend_cache = {legend_key: legend_elements}
         ax.legend(handles=legend_elements, loc='upper right', fontsize=8,
                  framealpha=0.7, facecolor='#2d2d2d')
         
-        self.set_common_style(ax, tr('history.chart.top_apps_hourly'))
-        ax.set_xticks(hours[::2])
+        self.set_common_style(ax, self._s['top_apps_hourly'])
+        ax.set_xticks(self._EVEN_HOUR_TICKS)
         ax.set_xlabel('Hour')
-        ax.set_ylabel(tr('history.legend.activity'))
+        ax.set_ylabel(self._s['activity'])
 
 class HistoryChartWidget(QWidget):
     """Main History Widget with Filter and Sub-charts."""
@@ -496,6 +706,19 @@ class HistoryChartWidget(QWidget):
         self.db = database
         # Map friendly name -> app_name
         self.app_map = {} 
+
+        # Debounce for combobox selection: currentTextChanged can fire
+        # for intermediate states (keyboard scrubbing, programmatic
+        # rebuilds), so only the last selection within the window drives
+        # a chart redraw.
+        self._pending_app_key = None
+        # Items currently in the combobox, to skip no-op rebuilds
+        self._combo_items = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -540,62 +763,68 @@ class HistoryChartWidget(QWidget):
         self.timeline = TimelineWidget(self.db)
         self.stack.addWidget(self.timeline)
         
-        self.insight = InsightWidget(self.db)
-        self.stack.addWidget(self.insight)
+        # The insight view is built lazily on first activation: each
+        # chart widget drags in a full Figure + Agg canvas, so deferring
+        # it roughly halves cold-start chart construction for users who
+        # stay on the timeline tab.
+        self.insight = None
+        self._insight_placeholder = QWidget()
+        self.stack.addWidget(self._insight_placeholder)
         
         layout.addWidget(self.stack)
         
     def on_app_changed(self, text):
-        # Resolve friendly name back to app_name key
-        app_key = self.app_map.get(text)
-        
-        self.timeline.update_filter(app_key)
-        self.insight.update_filter(app_key)
+        # Resolve friendly name back to app_name key and restart the
+        # debounce window; only the final selection reaches the charts
+        self._pending_app_key = self.app_map.get(text)
+        self._filter_timer.start()
+        
+    def _apply_filter(self):
+        self.timeline.update_filter(self._pending_app_key)
+        if self.insight is not None:
+            self.insight.update_filter(self._pending_app_key)
+        
+    def _ensure_insight(self):
+        """Build the insight view on first use, replacing its placeholder."""
+        if self.insight is None:
+            self.insight = InsightWidget(self.db)
+            self.stack.removeWidget(self._insight_placeholder)
+            self._insight_placeholder.deleteLater()
+            self._insight_placeholder = None
+            self.stack.insertWidget(1, self.insight)
+            # Catch up with the currently selected scope filter
+            self.insight.update_filter(self.app_map.get(self.app_combo.currentText()))
         
     def switch_view(self, index):
+        if index == 1:
+            self._ensure_insight()
         self.stack.setCurrentIndex(index)
         self.btn_timeline.setChecked(index == 0)
         self.btn_insights.setChecked(index == 1)
         
     def showEvent(self, event):
         """Refreshes app list when tab is shown."""
-        current_text = self.app_combo.currentText()
-        self.app_combo.blockSignals(True)
-        self.app_combo.clear()
-        
-        # Rebuild Map
-        # 1. Get all app keys
-        app_keys = self.db.get_all_apps()
-        # 2. Get metadata
-        metadata = self.db.get_app_metadata_dict()
-        
-        self.app_map = {}
-        
-        # "All Applications"
+        # One query returns (display, app_key) already joined with
+        # friendly names and sorted case-insensitively
+        rows = self.db.get_apps_with_metadata_sorted()
+
         all_apps_text = tr('history.all_apps')
-        self.app_combo.addItem(all_apps_text)
-        self.app_map[all_apps_text] = None
-        
-        # Populate
-        items = []
-        for app in app_keys:
-            friendly = metadata.get(app, {}).get('friendly_name')
-            if friendly:
-                display = friendly
-            else:
-                display = app
-                
-            self.app_map[display] = app
-            items.append(display)
-            
-        items.sort()
-        self.app_combo.addItems(items)
-        
-        # Restore selection
-        if current_text in self.app_map:
-            self.app_combo.setCurrentText(current_text)
-            
-        self.app_combo.blockSignals(False)
+        self.app_map = {all_apps_text: None}
+        self.app_map.update(rows)
+
+        new_items = [all_apps_text] + [display for display, _ in rows]
+        if new_items != self._combo_items:
+            # Only rebuild the model when the app list actually changed;
+            # re-showing the tab with an unchanged list is the common case
+            current_text = self.app_combo.currentText()
+            with QSignalBlocker(self.app_combo):
+                self.app_combo.clear()
+                self.app_combo.addItems(new_items)
+
+                # Restore selection
+                if current_text in self.app_map:
+                    self.app_combo.setCurrentText(current_text)
+            self._combo_items = new_items
         
         # Initial refresh
         self.on_app_changed(self.app_combo.currentText())
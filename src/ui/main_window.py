@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                 QLabel, QTabWidget, QFrame, QGridLayout, QPushButton,
                                 QButtonGroup, QSizePolicy, QStackedWidget, QComboBox,
                                 QSplitter)
-from PySide6.QtCore import QTimer, Qt, Signal
+from PySide6.QtCore import QTimer, Qt, Signal, Slot, QObject, QThread
 from PySide6.QtGui import QFont, QColor, QPalette
 from .utils import HeatmapWidget, MouseHeatmapWidget
 from .history_chart import HistoryChartWidget
@@ -13,8 +13,21 @@ from .screen_time_widget import ScreenTimeWidget
 from ..config import Config
 from ..i18n import tr, get_i18n, set_language
 import datetime
+from collections import Counter
 
 
+
+# (start, end) offsets from today per range key, built once at import so
+# get_date_range is a single dict lookup; None means unbounded ('all').
+_RANGE_OFFSETS = {
+    'today': (datetime.timedelta(0), datetime.timedelta(0)),
+    'yesterday': (datetime.timedelta(days=1), datetime.timedelta(days=1)),
+    'week': (datetime.timedelta(days=6), datetime.timedelta(0)),
+    'month': (datetime.timedelta(days=29), datetime.timedelta(0)),
+    'year': (datetime.timedelta(days=364), datetime.timedelta(0)),
+    'all': None,
+}
+
 class TimeRangeSelector(QWidget):
     """Button bar for selecting time range: Today, Yesterday, Week, Month, Year/All"""
     range_changed = Signal(str)  # Emits: 'today', 'yesterday', 'week', 'month', 'year', 'all'
@@ -154,6 +167,11 @@ class TimeRangeSelector(QWidget):
     
     def on_range_selected(self, key):
         """Handle button selection."""
+        if key == self.current_range and not self._combo_active:
+            # Stray click on the already-selected button: keep it checked
+            # but skip the range_changed refresh cascade
+            self.buttons[key].setChecked(True)
+            return
         # Uncheck all buttons
         for k, btn in self.buttons.items():
             btn.setChecked(k == key)
@@ -178,22 +196,20 @@ class TimeRangeSelector(QWidget):
             self.current_range = key
             self.range_changed.emit(key)
     
-    def get_date_range(self):
-        """Returns (start_date, end_date) based on current selection."""
-        today = datetime.date.today()
-        if self.current_range == 'today':
-            return today, today
-        elif self.current_range == 'yesterday':
-            yesterday = today - datetime.timedelta(days=1)
-            return yesterday, yesterday
-        elif self.current_range == 'week':
-            return today - datetime.timedelta(days=6), today
-        elif self.current_range == 'month':
-            return today - datetime.timedelta(days=29), today
-        elif self.current_range == 'year':
-            return today - datetime.timedelta(days=364), today
-        else:  # 'all'
+    def get_date_range(self, today=None):
+        """Returns (start_date, end_date) based on current selection.
+
+        Args:
+            today: Optional precomputed date, so repaint loops can share
+                one datetime.date.today() call per refresh.
+        """
+        offsets = _RANGE_OFFSETS.get(self.current_range)
+        if offsets is None:  # 'all'
             return None, None
+        if today is None:
+            today = datetime.date.today()
+        start_offset, end_offset = offsets
+        return today - start_offset, today - end_offset
 
 
 class StatCard(QFrame):
@@ -224,12 +240,61 @@ class StatCard(QFrame):
         layout.addWidget(self.lbl_value)
         
         self.unit = unit
+        self._last_text = f"{value} {unit}"
 
     def update_value(self, value):
-        self.lbl_value.setText(f"{value} {self.unit}")
+        # Called every second; unchanged text shouldn't dirty the label
+        new_text = f"{value} {self.unit}"
+        if new_text == self._last_text:
+            return
+        self._last_text = new_text
+        self.lbl_value.setText(new_text)
+
+
+class DbWorker(QObject):
+    """Runs the periodic dashboard/heatmap queries off the UI thread.
+
+    The tracker's Database already serializes access to one shared
+    connection behind a lock (check_same_thread=False), so the worker
+    calls its methods directly instead of opening a second raw
+    connection and re-implementing the flush and ordinal-date logic.
+    A query latency spike now stalls this thread, not the event loop.
+    """
+
+    stats_ready = Signal(tuple, tuple)
+    keyboard_heatmap_ready = Signal(tuple, dict)
+    mouse_heatmap_ready = Signal(tuple, dict)
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+
+    @Slot(tuple, object, object)
+    def fetch_stats(self, key, start_date, end_date):
+        if start_date is None:  # All time
+            row = self.db.get_all_time_stats()
+        else:
+            row = self.db.get_stats_range(start_date, end_date)
+        self.stats_ready.emit(key, tuple(row))
+
+    @Slot(tuple, object, object, object)
+    def fetch_keyboard_heatmap(self, key, start_date, end_date, app_filter):
+        data = self.db.get_heatmap_range(start_date, end_date, app_filter=app_filter)
+        self.keyboard_heatmap_ready.emit(key, data)
+
+    @Slot(tuple, object, object, object)
+    def fetch_mouse_heatmap(self, key, start_date, end_date, app_filter):
+        rows = self.db.get_mouse_heatmap_range(start_date, end_date, app_filter=app_filter)
+        # raw rows are (x, y, count); the widget wants a dict
+        self.mouse_heatmap_ready.emit(key, {(row[0], row[1]): row[2] for row in rows})
 
 
 class MainWindow(QMainWindow):
+    # Emitted towards the DbWorker; cross-thread, so Qt queues them
+    request_stats = Signal(tuple, object, object)
+    request_keyboard_heatmap = Signal(tuple, object, object, object)
+    request_mouse_heatmap = Signal(tuple, object, object, object)
+
     def __init__(self, tracker, config: Config = None):
         super().__init__()
         self.tracker = tracker
@@ -304,13 +369,44 @@ class MainWindow(QMainWindow):
         # Hook after all tabs are created
         self.tabs.currentChanged.connect(self.on_tab_changed)
         
-        # Timer to update UI
+        # Database worker thread: update_stats/update_heatmap only emit
+        # request signals, results come back via the *_ready signals
+        self._db_thread = QThread(self)
+        self._db_worker = DbWorker(self.tracker.db)
+        self._db_worker.moveToThread(self._db_thread)
+        self.request_stats.connect(self._db_worker.fetch_stats)
+        self.request_keyboard_heatmap.connect(self._db_worker.fetch_keyboard_heatmap)
+        self.request_mouse_heatmap.connect(self._db_worker.fetch_mouse_heatmap)
+        self._db_worker.stats_ready.connect(self._apply_stats)
+        self._db_worker.keyboard_heatmap_ready.connect(self._apply_keyboard_heatmap)
+        self._db_worker.mouse_heatmap_ready.connect(self._apply_mouse_heatmap)
+        self._db_thread.start()
+
+        # Worker-result caches: the DB-resident part of each window only
+        # changes when the database does, so replies are memoized per
+        # query key and dropped when data_version moves or the day rolls
+        # over. The 1s tick then costs a dict hit plus buffer merging.
+        self._stats_cache = {}
+        self._heatmap_cache = {}
+        self._cache_version = -1
+        self._cache_date = datetime.date.today()
+
+        # Timer to update UI (stat cards and visible-tab refreshes).
+        # Both timers are started by showEvent and stopped by hideEvent,
+        # so a window living in the tray costs no periodic work at all.
+        # Coarse timers: neither tick needs sub-millisecond accuracy,
+        # and letting the OS coalesce the wakeups saves power on laptops
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self.update_stats)
-        self.timer.start(1000) # Update every second
-        
-        # Initial update
-        self.update_stats()
+
+        # Heatmap repaints run on their own slower cadence, gated so a
+        # quiet database doesn't trigger redraws; user actions (range,
+        # filter, view, theme) still call update_heatmap directly.
+        self._heatmap_version = -1
+        self.heatmap_timer = QTimer()
+        self.heatmap_timer.setTimerType(Qt.CoarseTimer)
+        self.heatmap_timer.timeout.connect(self._heatmap_tick)
 
     def on_tab_changed(self, index):
         try:
@@ -326,6 +422,9 @@ class MainWindow(QMainWindow):
                 print(f"[ERROR] update_apps on tab change failed: {e}")
                 import traceback
                 traceback.print_exc()
+        # Catch the heatmap up when its tab becomes visible
+        elif self.tabs.widget(index) == self.heatmap_tab:
+            self.update_heatmap()
         # Refresh screen time tab when selected
         elif self.tabs.widget(index) == self.screen_time_tab:
             try:
@@ -728,7 +827,9 @@ class MainWindow(QMainWindow):
             'year': 'dashboard.title.year',
             'all': 'dashboard.title.all'
         }
-        self.dashboard_title.setText(tr(title_keys.get(range_key, 'dashboard.title.today')))
+        new_title = tr(title_keys.get(range_key, 'dashboard.title.today'))
+        if new_title != self.dashboard_title.text():
+            self.dashboard_title.setText(new_title)
         self.update_stats()
 
     def on_heatmap_range_changed(self, range_key):
@@ -776,37 +877,49 @@ class MainWindow(QMainWindow):
         # Get userData (raw app_name)
         return self.heatmap_app_filter.itemData(idx)
 
+    def _refresh_caches(self, today=None):
+        """Drop memoized worker results when the DB or the day changes."""
+        version = getattr(self.tracker.db, 'data_version', 0)
+        if today is None:
+            today = datetime.date.today()
+        if version != self._cache_version or today != self._cache_date:
+            self._stats_cache.clear()
+            self._heatmap_cache.clear()
+            self._cache_version = version
+            self._cache_date = today
+
+    def _stats_key(self, today=None):
+        start_date, end_date = self.time_selector.get_date_range(today)
+        return (self.time_selector.current_range, start_date, end_date)
+
+    def showEvent(self, event):
+        """(Re)start the periodic refreshes and catch up immediately."""
+        self.timer.start(1000)
+        self.heatmap_timer.start(2000)
+        self.update_stats()
+        if self.tabs.currentWidget() is self.heatmap_tab:
+            self.update_heatmap()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Stop all periodic DB queries and repaints while hidden."""
+        self.timer.stop()
+        self.heatmap_timer.stop()
+        super().hideEvent(event)
+
     def update_stats(self):
-        # Get date range from selector
-        start_date, end_date = self.time_selector.get_date_range()
-        
-        if start_date is None:  # All time
-            db_stats = self.tracker.db.get_all_time_stats()
-            keys = db_stats[0] or 0
-            clicks = db_stats[1] or 0
-            distance = db_stats[2] or 0.0
-            scroll = db_stats[3] or 0.0
+        if not self.isVisible():
+            return
+        # Serve the cards from cache when the DB hasn't changed;
+        # otherwise hand the query to the worker and render on reply
+        today = datetime.date.today()
+        self._refresh_caches(today)
+        key = self._stats_key(today)
+        cached = self._stats_cache.get(key)
+        if cached is not None:
+            self._render_stats(cached)
         else:
-            # Get stats from database for the selected range
-            db_stats = self.tracker.db.get_stats_range(start_date, end_date)
-            keys = db_stats[0] or 0
-            clicks = db_stats[1] or 0
-            distance = db_stats[2] or 0.0
-            scroll = db_stats[3] or 0.0
-        
-        # If viewing today, also add current buffer
-        if self.time_selector.current_range == 'today':
-            buffer_stats = self.tracker.get_stats_snapshot()
-            keys += buffer_stats.get('buffer_keys', 0)
-            clicks += buffer_stats.get('buffer_clicks', 0)
-            distance += buffer_stats.get('buffer_distance', 0.0)
-            scroll += buffer_stats.get('buffer_scroll', 0.0)
-        
-        # Update Cards
-        self.card_keys.update_value(f"{int(keys):,}")
-        self.card_clicks.update_value(f"{int(clicks):,}")
-        self.card_distance.update_value(f"{distance:.2f}")
-        self.card_scroll.update_value(f"{scroll:.0f}")
+            self.request_stats.emit(key, key[1], key[2])
         
         # Refresh app list periodically (every 10 updates = 10 seconds)
         if not hasattr(self, '_app_list_refresh_counter'):
@@ -816,9 +929,6 @@ class MainWindow(QMainWindow):
             self._app_list_refresh_counter = 0
             self.refresh_heatmap_app_list()
         
-        # Update Heatmap (only if on today or using heatmap tab)
-        self.update_heatmap()
-        
         # Update Apps (only if visible or on today)
         if self.tabs.currentWidget() == self.apps_tab:
             self.update_apps()
@@ -827,68 +937,119 @@ class MainWindow(QMainWindow):
         if self.tabs.currentWidget() == self.screen_time_tab:
             self.screen_time_tab.refresh_data()
 
+    @Slot(tuple, tuple)
+    def _apply_stats(self, key, db_stats):
+        self._stats_cache[key] = db_stats
+        # A stale reply for a range the user has already left shouldn't
+        # overwrite the cards
+        if key == self._stats_key():
+            self._render_stats(db_stats)
+
+    def _render_stats(self, db_stats):
+        keys = db_stats[0] or 0
+        clicks = db_stats[1] or 0
+        distance = db_stats[2] or 0.0
+        scroll = db_stats[3] or 0.0
+
+        # If viewing today, also add current buffer (the tracker snapshot
+        # is in-memory and stays on the UI thread)
+        if self.time_selector.current_range == 'today':
+            buffer_stats = self.tracker.get_stats_snapshot()
+            keys += buffer_stats.get('buffer_keys', 0)
+            clicks += buffer_stats.get('buffer_clicks', 0)
+            distance += buffer_stats.get('buffer_distance', 0.0)
+            scroll += buffer_stats.get('buffer_scroll', 0.0)
+
+        # Update Cards
+        self.card_keys.update_value(f"{int(keys):,}")
+        self.card_clicks.update_value(f"{int(clicks):,}")
+        self.card_distance.update_value(f"{distance:.2f}")
+        self.card_scroll.update_value(f"{scroll:.0f}")
+
+    def _heatmap_tick(self):
+        """Periodic heatmap refresh; repaints only when there is new data.
+
+        The today view also repaints each tick so the live in-memory
+        buffers keep showing up between database flushes.
+        """
+        if self.tabs.currentWidget() is not self.heatmap_tab:
+            # Nobody can see it; on_tab_changed catches up on switch
+            return
+        version = getattr(self.tracker.db, 'data_version', 0)
+        if version != self._heatmap_version or self.heatmap_time_selector.current_range == 'today':
+            self._heatmap_version = version
+            self.update_heatmap()
+
     def update_heatmap(self):
         """Update keyboard heatmap based on heatmap tab's time selector and app filter."""
+        self._refresh_caches()
+        key = self._heatmap_key()
+        cached = self._heatmap_cache.get(key)
+        view_id = key[4]
+        if cached is not None:
+            if view_id == 0:
+                self._render_keyboard_heatmap(cached)
+            else:
+                self._render_mouse_heatmap(cached)
+        elif view_id == 0:
+            self.request_keyboard_heatmap.emit(key, key[1], key[2], key[3])
+        else:
+            self.request_mouse_heatmap.emit(key, key[1], key[2], key[3])
+
+    def _heatmap_key(self):
         start_date, end_date = self.heatmap_time_selector.get_date_range()
+        if start_date is None:  # All time
+            start_date = datetime.date(2000, 1, 1)
+            end_date = datetime.date.today()
+        return (self.heatmap_time_selector.current_range, start_date, end_date,
+                self.get_selected_heatmap_app(), self.view_group.checkedId())
+
+    @Slot(tuple, dict)
+    def _apply_keyboard_heatmap(self, key, heatmap_data):
+        self._heatmap_cache[key] = heatmap_data
+        if key == self._heatmap_key():
+            self._render_keyboard_heatmap(heatmap_data)
+
+    def _render_keyboard_heatmap(self, heatmap_data):
         app_filter = self.get_selected_heatmap_app()
         
-        if self.view_group.checkedId() == 0:
-            # Keyboard Heatmap
-            if start_date is None:  # All time
-                heatmap_data = self.tracker.db.get_heatmap_range(
-                    datetime.date(2000, 1, 1),
-                    datetime.date.today(),
-                    app_filter=app_filter
-                )
+        self.keyboard_heatmap.update_data(heatmap_data)
+
+        # Add the live buffer on top when viewing today; apply_delta
+        # folds it into the widget's counts array, so the cached dict
+        # is never copied or mutated.
+        if self.heatmap_time_selector.current_range == 'today':
+            snapshot = self.tracker.get_stats_snapshot()
+            if app_filter:
+                # Get app-specific buffer
+                buffer = snapshot.get('app_heatmap_buffer', {}).get(app_filter, {})
             else:
-                heatmap_data = self.tracker.db.get_heatmap_range(start_date, end_date, app_filter=app_filter)
-            
-            # Add current buffer if viewing today
-            if self.heatmap_time_selector.current_range == 'today':
-                snapshot = self.tracker.get_stats_snapshot()
-                if app_filter:
-                    # Get app-specific buffer
-                    app_buffer = snapshot.get('app_heatmap_buffer', {}).get(app_filter, {})
-                    for key, count in app_buffer.items():
-                        heatmap_data[key] = heatmap_data.get(key, 0) + count
-                else:
-                    # Get global buffer (use buffer_heatmap, not 'heatmap' which includes DB data)
-                    buffer = snapshot.get('buffer_heatmap', {})
-                    for key, count in buffer.items():
-                        heatmap_data[key] = heatmap_data.get(key, 0) + count
-            
-            self.keyboard_heatmap.update_data(heatmap_data)
-            
-        else:
-            # Mouse Heatmap
-            if start_date is None:
-                raw_data = self.tracker.db.get_mouse_heatmap_range(
-                    datetime.date(2000, 1, 1),
-                    datetime.date.today(),
-                    app_filter=app_filter
-                )
+                # Get global buffer (use buffer_heatmap, not 'heatmap' which includes DB data)
+                buffer = snapshot.get('buffer_heatmap', {})
+            self.keyboard_heatmap.apply_delta(buffer)
+
+    @Slot(tuple, dict)
+    def _apply_mouse_heatmap(self, key, mouse_data):
+        self._heatmap_cache[key] = mouse_data
+        if key == self._heatmap_key():
+            self._render_mouse_heatmap(mouse_data)
+
+    def _render_mouse_heatmap(self, mouse_data):
+        app_filter = self.get_selected_heatmap_app()
+        
+        # Add buffer if today (Counter copies and merges, same as the
+        # keyboard view)
+        if self.heatmap_time_selector.current_range == 'today':
+            snapshot = self.tracker.get_stats_snapshot()
+            mouse_data = Counter(mouse_data)
+            if app_filter:
+                # Get app-specific buffer
+                mouse_data.update(snapshot.get('app_mouse_heatmap_buffer', {}).get(app_filter, {}))
             else:
-                raw_data = self.tracker.db.get_mouse_heatmap_range(start_date, end_date, app_filter=app_filter)
-                
-            # raw_data is list of (x, y, count) tuples
-            # Convert to dict for widget
-            mouse_data = {(row[0], row[1]): row[2] for row in raw_data}
-            
-            # Add buffer if today
-            if self.heatmap_time_selector.current_range == 'today':
-                snapshot = self.tracker.get_stats_snapshot()
-                if app_filter:
-                    # Get app-specific buffer
-                    app_buffer = snapshot.get('app_mouse_heatmap_buffer', {}).get(app_filter, {})
-                    for (x, y), count in app_buffer.items():
-                        mouse_data[(x, y)] = mouse_data.get((x, y), 0) + count
-                else:
-                    # Get global buffer
-                    buffer = snapshot.get('mouse_heatmap', {})
-                    for (x, y), count in buffer.items():
-                        mouse_data[(x, y)] = mouse_data.get((x, y), 0) + count
-            
-            self.mouse_heatmap.update_data(mouse_data)
+                # Get global buffer
+                mouse_data.update(snapshot.get('mouse_heatmap', {}))
+        
+        self.mouse_heatmap.update_data(mouse_data)
 
     def on_theme_changed(self, theme_name):
         """Handle heatmap theme change from settings."""
@@ -918,6 +1079,8 @@ class MainWindow(QMainWindow):
             self.hide()
         else:
             # Actually quit the application
+            self._db_thread.quit()
+            self._db_thread.wait(2000)
             event.accept()
             from PySide6.QtWidgets import QApplication
             QApplication.instance().quit()
@@ -23,7 +23,8 @@ class OverlayWindow(QWidget):
         
         # Position in top right corner
         screen_geo = QApplication.primaryScreen().geometry()
-        self.move(screen_geo.width() - 270, 50)
+        self._base_pos = QPoint(screen_geo.width() - 270, 50)
+        self.move(self._base_pos)
         
         self.combo_count = 0
         self.combo_label = QLabel(self)
@@ -37,32 +38,38 @@ class OverlayWindow(QWidget):
         self.combo_label.move(0, 0)
         
         self.timer = QTimer()
+        # Coarse accuracy is plenty for a 2s combo reset and lets the OS
+        # coalesce the wakeup with other timers
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self.reset_combo)
         self.timer.setSingleShot(True)
         
+        # Shake keyframes are baked once; on_key_press only restarts the
+        # animation instead of rebuilding the keyframe vector per key
         self.shake_anim = QPropertyAnimation(self, b"pos")  # Animate the window itself
         self.shake_anim.setDuration(100)
         self.shake_anim.setEasingCurve(QEasingCurve.InOutBounce)
+        self.shake_anim.setStartValue(self._base_pos)
+        self.shake_anim.setKeyValueAt(0.25, self._base_pos + QPoint(5, 0))
+        self.shake_anim.setKeyValueAt(0.5, self._base_pos - QPoint(5, 0))
+        self.shake_anim.setKeyValueAt(0.75, self._base_pos + QPoint(3, 0))
+        self.shake_anim.setEndValue(self._base_pos)
 
     def on_key_press(self):
         self.combo_count += 1
         self.combo_label.setText(f"{self.combo_count} COMBO!")
-        self.combo_label.show()
-        self.combo_label.adjustSize()
+        if self.combo_label.isHidden():
+            # Show/adjust once per combo; reset_combo hides it again
+            self.combo_label.show()
+            self.combo_label.adjustSize()
         
         # Reset timer
         self.timer.start(2000) # 2 seconds to keep combo
         
-        # Shake effect - animate the window position
-        screen_geo = QApplication.primaryScreen().geometry()
-        base_pos = QPoint(screen_geo.width() - 270, 50)
-        self.shake_anim.stop()
-        self.shake_anim.setStartValue(base_pos)
-        self.shake_anim.setKeyValueAt(0.25, base_pos + QPoint(5, 0))
-        self.shake_anim.setKeyValueAt(0.5, base_pos - QPoint(5, 0))
-        self.shake_anim.setKeyValueAt(0.75, base_pos + QPoint(3, 0))
-        self.shake_anim.setEndValue(base_pos)
-        self.shake_anim.start()
+        # Shake effect: restart only when the last shake has finished,
+        # so fast typing doesn't stop/rewind the running animation
+        if self.shake_anim.state() != QPropertyAnimation.Running:
+            self.shake_anim.start()
 
     def reset_combo(self):
         self.combo_count = 0
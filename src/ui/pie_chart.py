@@ -1,6 +1,9 @@
+import heapq
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 import math
+import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from ..i18n import tr
@@ -21,6 +24,13 @@ PIE_COLORS = [
     "#29b6f6",  # Light Blue
 ]
 
+# Pre-parsed RGB float triples so matplotlib doesn't re-parse the hex
+# strings on every rebuild
+PIE_COLORS_RGB = [
+    (int(c[1:3], 16) / 255, int(c[3:5], 16) / 255, int(c[5:7], 16) / 255)
+    for c in PIE_COLORS
+]
+
 
 class PieChartWidget(QWidget):
     """A pie chart widget backed by matplotlib (more stable than custom QPainter)."""
@@ -29,15 +39,47 @@ class PieChartWidget(QWidget):
         super().__init__(parent)
         self.metric = 'keys'
         self.data = []  # list of (label, value)
+        # app_name -> display label, valid for one metadata dict; the
+        # dashboard passes the same dict back on metric toggles
+        self._label_cache = {}
+        self._last_metadata = None
         self.font_family = "Microsoft YaHei"
         self.fig = Figure(figsize=(4, 4), facecolor='#1e1e1e')
         self.canvas = FigureCanvas(self.fig)
         self.ax = self.fig.add_subplot(111)
+        # Figure-level styling survives axes clears, so apply it once:
+        # dark patch plus tight margins that leave room for leader lines
+        self.fig.patch.set_facecolor('#1e1e1e')
+        self.fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
+        self.ax.set_facecolor('#1e1e1e')
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.canvas)
         self.setMinimumSize(360, 360)
 
+        # Every artist we add to the axes, so redraws can remove exactly
+        # those instead of ax.clear() (which also wipes axes state and
+        # forces transform re-setup on the next draw)
+        self._dyn_artists = []
+
+        # Cached artists for in-place updates: when the slice labels are
+        # unchanged, a redraw only moves wedge angles, percentage texts
+        # and leader lines instead of rebuilding every artist.
+        self._wedges = None
+        self._autotexts = None
+        self._center_text = None
+        self._lines1 = None
+        self._lines2 = None
+        self._label_texts = None
+        self._last_labels = None
+
+        # Coalesce bursts of update_data calls (metric toggle plus DB
+        # refresh landing together) into one deferred full redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(50)
+        self._redraw_timer.timeout.connect(self._draw_chart)
+
     def set_metric(self, metric):
         self.metric = metric
 
@@ -50,43 +92,77 @@ class PieChartWidget(QWidget):
         metric_idx = {'keys': 1, 'clicks': 2, 'scrolls': 3, 'distance': 4}
         idx = metric_idx.get(self.metric, 1)
 
+        if metadata is not self._last_metadata:
+            self._label_cache = {}
+            self._last_metadata = metadata
+
+        label_cache = self._label_cache
         items = []
         for row in app_data:
             app_name = row[0]
             value = row[idx] or 0
             if value > 0:
-                label = metadata.get(app_name, {}).get('friendly_name') or (app_name[:-4] if app_name.lower().endswith('.exe') else app_name)
+                label = label_cache.get(app_name)
+                if label is None:
+                    label = metadata.get(app_name, {}).get('friendly_name') or (app_name[:-4] if app_name.lower().endswith('.exe') else app_name)
+                    label_cache[app_name] = label
                 items.append((label, value))
 
-        items.sort(key=lambda x: x[1], reverse=True)
         if len(items) > 6:
-            top = items[:6]
-            others = sum(v for _, v in items[6:])
+            # Partial selection beats a full sort when many apps are
+            # tracked; only the top 6 ever get their own slice
+            top = heapq.nlargest(6, items, key=lambda x: x[1])
+            others = sum(v for _, v in items) - sum(v for _, v in top)
             if others > 0:
                 top.append((tr('apps.others'), others))
             items = top
+        else:
+            items.sort(key=lambda x: x[1], reverse=True)
 
         self.data = items
-        self._draw_chart()
+        # Restart the coalescing window; only the last burst entry draws
+        self._redraw_timer.start()
 
     def _draw_chart(self):
-        self.ax.clear()
-        self.fig.patch.set_facecolor('#1e1e1e')
-        self.ax.set_facecolor('#1e1e1e')
-
         if not self.data:
-            self.ax.text(0.5, 0.5, tr('apps.no_data'), color='white', ha='center', va='center', fontsize=12)
+            self._clear_dynamic()
+            txt = self.ax.text(0.5, 0.5, tr('apps.no_data'), color='white', ha='center', va='center', fontsize=12)
+            self._dyn_artists.append(txt)
             self.ax.axis('off')
             self.canvas.draw_idle()
             return
 
         labels = [l for l, _ in self.data]
         values = [v for _, v in self.data]
-        colors = [PIE_COLORS[i % len(PIE_COLORS)] for i in range(len(values))]
+
+        if self._wedges is not None and labels == self._last_labels:
+            self._update_chart(values)
+        else:
+            self._build_chart(labels, values)
+        self.canvas.draw_idle()
+
+    def _clear_dynamic(self):
+        """Remove the artists from the previous render, leaving the axes
+        infrastructure (transforms, patches, state set by ax.pie) alive.
+        """
+        for artist in self._dyn_artists:
+            artist.remove()
+        self._dyn_artists.clear()
+        self._wedges = None
+        self._last_labels = None
+
+    def _total_text(self, total):
+        if self.metric == 'distance':
+            return f"{total:.1f} m"
+        return f"{int(total):,}"
+
+    def _build_chart(self, labels, values):
+        """Full rebuild: remove the old artists and recreate them."""
+        self._clear_dynamic()
+
+        colors = [PIE_COLORS_RGB[i % len(PIE_COLORS_RGB)] for i in range(len(values))]
 
         total = sum(values)
-        # Margins for leader lines
-        self.fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
 
         # Use autopct to add percentage labels directly
         wedges, texts, autotexts = self.ax.pie(
@@ -102,122 +178,115 @@ class PieChartWidget(QWidget):
         )
 
         # Center total text
-        if self.metric == 'distance':
-            total_text = f"{total:.1f} m"
-        else:
-            total_text = f"{int(total):,}"
-        self.ax.text(0, 0, total_text, ha='center', va='center', color='white',
-                      fontsize=13, fontweight='bold', fontname=self.font_family)
-
-        # Collect label information and group by side
-        label_info = []
-        for wedge, (label, value), color in zip(wedges, self.data, colors):
-            pct = (value / total) * 100 if total else 0
-            angle = (wedge.theta2 + wedge.theta1) / 2.0
-            theta = math.radians(angle)
-            
-            x_wedge = 1.0 * math.cos(theta)
-            y_wedge = 1.0 * math.sin(theta)
-            
-            label_info.append({
-                'label': label,
-                'pct': pct,
-                'color': color,
-                'theta': theta,
-                'x_wedge': x_wedge,
-                'y_wedge': y_wedge,
-                'on_right': x_wedge >= 0
-            })
-        
-        # Separate left and right, sort by y position (top to bottom)
-        left_labels = sorted([l for l in label_info if not l['on_right']], 
-                           key=lambda x: -x['y_wedge'])
-        right_labels = sorted([l for l in label_info if l['on_right']], 
-                            key=lambda x: -x['y_wedge'])
-        
-        def adjust_positions_no_overlap(labels_side):
-            """Adjust y positions to avoid overlap while maintaining order"""
-            if not labels_side:
-                return []
-            
-            min_spacing = 0.15  # Minimum vertical spacing between labels
-            
-            # Start with wedge y positions
-            positions = [l['y_wedge'] for l in labels_side]
-            
-            # Adjust to avoid overlaps (downward pass)
-            for i in range(1, len(positions)):
-                if positions[i] > positions[i-1] - min_spacing:
-                    positions[i] = positions[i-1] - min_spacing
-            
-            # Clamp to bounds and adjust upward if needed
-            max_y = 1.1
-            min_y = -1.1
-            
-            # First pass: clamp bottom
-            if positions[-1] < min_y:
-                offset = min_y - positions[-1]
-                positions = [p + offset for p in positions]
-            
-            # Second pass: clamp top
-            if positions[0] > max_y:
-                offset = positions[0] - max_y
-                positions = [p - offset for p in positions]
-            
-            return positions
-        
-        def draw_labels_side(labels_side, x_text_pos):
-            """Draw labels on one side with smart positioning to avoid crossings"""
-            if not labels_side:
-                return
-            
-            y_positions = adjust_positions_no_overlap(labels_side)
-            
-            for i, info in enumerate(labels_side):
-                # Start: edge of wedge
-                x_start = info['x_wedge']
-                y_start = info['y_wedge']
-                
-                # Elbow: radial extension
-                elbow_radius = 1.08
-                x_elbow = elbow_radius * math.cos(info['theta'])
-                y_elbow = elbow_radius * math.sin(info['theta'])
-                
-                # End: text position (adjusted to avoid overlap)
-                y_text = y_positions[i]
-                
-                # Draw two-segment line
-                self.ax.plot(
-                    [x_start, x_elbow], [y_start, y_elbow],
-                    color=info['color'], linewidth=1.0, alpha=0.7, zorder=1
-                )
-                self.ax.plot(
-                    [x_elbow, x_text_pos], [y_elbow, y_text],
-                    color=info['color'], linewidth=1.0, alpha=0.7, zorder=1
-                )
-                
-                # Add text
-                self.ax.text(
-                    x_text_pos, y_text,
-                    info['label'],
-                    ha='left' if x_text_pos > 0 else 'right',
-                    va='center',
-                    color='#e0e0e0',
-                    fontsize=9,
-                    fontfamily=self.font_family,
-                    clip_on=False,
-                    zorder=11
-                )
-        
-        # Draw left and right sides
-        draw_labels_side(left_labels, -1.25)
-        draw_labels_side(right_labels, 1.25)
+        self._center_text = self.ax.text(
+            0, 0, self._total_text(total), ha='center', va='center', color='white',
+            fontsize=13, fontweight='bold', fontname=self.font_family)
+
+        # Leader lines and side labels, one set per wedge; geometry is
+        # filled in by _layout_labels so the update path can reuse it
+        self._lines1 = []
+        self._lines2 = []
+        self._label_texts = []
+        for label, color in zip(labels, colors):
+            line1, = self.ax.plot([], [], color=color, linewidth=1.0, alpha=0.7, zorder=1)
+            line2, = self.ax.plot([], [], color=color, linewidth=1.0, alpha=0.7, zorder=1)
+            txt = self.ax.text(
+                0, 0, label, ha='left', va='center', color='#e0e0e0',
+                fontsize=9, fontfamily=self.font_family, clip_on=False, zorder=11)
+            self._lines1.append(line1)
+            self._lines2.append(line2)
+            self._label_texts.append(txt)
+
+        self._wedges = wedges
+        self._autotexts = autotexts
+        self._last_labels = labels
+        self._dyn_artists.extend(wedges)
+        self._dyn_artists.extend(autotexts)
+        self._dyn_artists.append(self._center_text)
+        self._dyn_artists.extend(self._lines1)
+        self._dyn_artists.extend(self._lines2)
+        self._dyn_artists.extend(self._label_texts)
+        self._layout_labels()
 
         # Preserve aspect and keep space for labels
         self.ax.axis('equal')
         self.ax.set_xlim(-1.6, 1.6)
         self.ax.set_ylim(-1.4, 1.4)
-        self.canvas.draw_idle()
+
+    def _update_chart(self, values):
+        """In-place update: same slices, new values — move the existing
+        wedges, percentage texts and leader lines instead of rebuilding.
+        """
+        total = sum(values)
+
+        # Reproduce ax.pie's angle walk (startangle=90, clockwise)
+        theta2 = 90.0
+        for wedge, autotext, value in zip(self._wedges, self._autotexts, values):
+            frac = value / total if total else 0
+            theta1 = theta2 - frac * 360.0
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+
+            mid = math.radians((theta1 + theta2) / 2.0)
+            autotext.set_position((0.75 * math.cos(mid), 0.75 * math.sin(mid)))
+            pct = frac * 100.0
+            autotext.set_text(f'{pct:.1f}%' if pct > 2 else '')
+            theta2 = theta1
+
+        self._center_text.set_text(self._total_text(total))
+        self._layout_labels()
+
+    def _layout_labels(self):
+        """Position the leader lines and side labels from wedge angles."""
+        # Wedge midpoints as arrays: one trig pass for every slice
+        thetas = np.radians([(w.theta1 + w.theta2) / 2.0 for w in self._wedges])
+        xw = np.cos(thetas)
+        yw = np.sin(thetas)
+        on_right = xw >= 0
+
+        # Index arrays per side, sorted by y position (top to bottom)
+        left_idx = np.flatnonzero(~on_right)
+        left_idx = left_idx[np.argsort(-yw[left_idx])]
+        right_idx = np.flatnonzero(on_right)
+        right_idx = right_idx[np.argsort(-yw[right_idx])]
+
+        def place_labels_side(idx, x_text_pos):
+            """Route one side's leader lines and labels without crossings"""
+            if idx.size == 0:
+                return
+
+            min_spacing = 0.15  # Minimum vertical spacing between labels
+
+            # Start with wedge y positions; push labels down to avoid
+            # overlap (sequential dependency, so a Python pass)
+            positions = yw[idx].copy()
+            for i in range(1, len(positions)):
+                if positions[i] > positions[i-1] - min_spacing:
+                    positions[i] = positions[i-1] - min_spacing
+
+            # Clamp to bounds: shift the whole column, bottom then top
+            if positions[-1] < -1.1:
+                positions += -1.1 - positions[-1]
+            if positions[0] > 1.1:
+                positions -= positions[0] - 1.1
+
+            # Elbow: radial extension of the wedge midpoint
+            ex = 1.08 * xw[idx]
+            ey = 1.08 * yw[idx]
+
+            ha = 'left' if x_text_pos > 0 else 'right'
+            for i, k in enumerate(idx):
+                # Two-segment line from wedge edge to the text column
+                self._lines1[k].set_data([xw[k], ex[i]], [yw[k], ey[i]])
+                self._lines2[k].set_data([ex[i], x_text_pos], [ey[i], positions[i]])
+
+                txt = self._label_texts[k]
+                txt.set_position((x_text_pos, positions[i]))
+                txt.set_ha(ha)
+
+        # Place left and right sides
+        place_labels_side(left_idx, -1.25)
+        place_labels_side(right_idx, 1.25)
 
 
 class AppPieChartWidget(QWidget):
@@ -227,6 +296,7 @@ class AppPieChartWidget(QWidget):
         super().__init__(parent)
         self._cached_data = []
         self._cached_metadata = {}
+        self._last_fp = None
         self.init_ui()
         
     def init_ui(self):
@@ -244,6 +314,13 @@ class AppPieChartWidget(QWidget):
         
     def update_data(self, app_data, metadata=None):
         """Update pie chart data."""
+        # DB-refresh callbacks often re-deliver identical rows; skip the
+        # redraw cycle when nothing the current metric can see changed
+        fingerprint = (self.pie_chart.metric,
+                       tuple(tuple(row[:5]) for row in (app_data or [])))
+        if fingerprint == self._last_fp:
+            return
+        self._last_fp = fingerprint
         self._cached_data = app_data
         self._cached_metadata = metadata
         self.pie_chart.update_data(app_data, metadata)
@@ -251,4 +328,5 @@ class AppPieChartWidget(QWidget):
     def refresh_display(self):
         """Refresh display with cached data (used when metric changes)."""
         if self._cached_data:
+            self._last_fp = None
             self.pie_chart.update_data(self._cached_data, self._cached_metadata)
@@ -29,6 +29,16 @@ def format_duration(seconds):
         return f"{secs}s"
 
 
+
+# Lookback spans per range key, built once at import so get_date_range is
+# a dict lookup instead of rebuilding timedeltas every call.
+_ONE_DAY = datetime.timedelta(days=1)
+_RANGE_SPANS = {
+    'week': datetime.timedelta(days=6),
+    'month': datetime.timedelta(days=29),
+    'year': datetime.timedelta(days=364),
+}
+
 class TimeRangeSelector(QWidget):
     """Button bar for selecting time range: Today, Yesterday, Week, Month, Year/All"""
     range_changed = Signal(str)
@@ -165,6 +175,11 @@ class TimeRangeSelector(QWidget):
     
     def on_range_selected(self, key):
         """Handle button selection."""
+        if key == self.current_range and not self._combo_active:
+            # Stray click on the already-selected button: keep it checked
+            # but skip the range_changed refresh cascade
+            self.buttons[key].setChecked(True)
+            return
         # Uncheck all buttons
         for k, btn in self.buttons.items():
             btn.setChecked(k == key)
@@ -189,20 +204,23 @@ class TimeRangeSelector(QWidget):
             self.current_range = key
             self.range_changed.emit(key)
     
-    def get_date_range(self):
-        """Returns (start_date, end_date) based on current selection."""
-        today = datetime.date.today()
+    def get_date_range(self, today=None):
+        """Returns (start_date, end_date) based on current selection.
+
+        Args:
+            today: Optional precomputed date, so repaint loops can share
+                one datetime.date.today() call per refresh.
+        """
+        if today is None:
+            today = datetime.date.today()
         if self.current_range == 'today':
             return today, today
-        elif self.current_range == 'yesterday':
-            yesterday = today - datetime.timedelta(days=1)
+        if self.current_range == 'yesterday':
+            yesterday = today - _ONE_DAY
             return yesterday, yesterday
-        elif self.current_range == 'week':
-            return today - datetime.timedelta(days=6), today
-        elif self.current_range == 'month':
-            return today - datetime.timedelta(days=29), today
-        elif self.current_range == 'year':
-            return today - datetime.timedelta(days=364), today
+        span = _RANGE_SPANS.get(self.current_range)
+        if span is not None:
+            return today - span, today
         else:  # 'all'
             return datetime.date(2000, 1, 1), today
 
@@ -3,17 +3,20 @@ Settings page UI for ActivityTrack.
 Provides controls for autostart, data retention, theme selection, etc.
 """
 
+import functools
 import os
 import datetime
+
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QCheckBox, QComboBox, QSpinBox, QPushButton, QGroupBox,
     QFormLayout, QMessageBox, QScrollArea, QSizePolicy, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QPainter, QPen
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QImage, QPixmap
 
-from ..config import Config, HEATMAP_THEMES, get_theme_color
+from ..config import Config, HEATMAP_THEMES, get_theme_color, get_theme_colors_float
 from ..i18n import tr, get_i18n, get_supported_languages, set_language
 from ..exporter import DataExporter
 from .app_grouping import AppGroupingDialog
@@ -27,60 +30,9 @@ KEYBOARD_LAYOUT_OPTIONS = {
 }
 
 
-class ColorPreviewWidget(QWidget):
-    """Widget to preview heatmap color gradient."""
-    
-    def __init__(self, theme_name='default'):
-        super().__init__()
-        self.theme_name = theme_name
-        self.setFixedHeight(30)
-        self.setMinimumWidth(200)
-    
-    def set_theme(self, theme_name):
-        self.theme_name = theme_name
-        self.update()
-    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw gradient bar
-        width = self.width() - 4
-        height = self.height() - 4
-        
-        for x in range(width):
-            ratio = x / max(width - 1, 1)
-            r, g, b = get_theme_color(self.theme_name, ratio)
-            painter.setPen(QPen(QColor(r, g, b)))
-            painter.drawLine(x + 2, 2, x + 2, height + 2)
-        
-        # Draw border
-        painter.setPen(QPen(QColor(80, 80, 80), 1))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 3, 3)
-
-
-class SettingsWidget(QWidget):
-    """Settings page with all configuration options."""
-    
-    # Signal emitted when theme changes (for live preview)
-    theme_changed = Signal(str)
-    keyboard_layout_changed = Signal(str)
-    settings_changed = Signal()
-    language_changed = Signal(str)
-    
-    def __init__(self, config: Config = None, database=None):
-        super().__init__()
-        self.config = config or Config()
-        self.database = database
-        self.exporter = DataExporter(database) if database else None
-        self.setup_ui()
-        self.load_settings()
-    
-    def setup_ui(self):
-        """Setup the settings UI."""
-        # Force dark theme for ALL child widgets to prevent system theme interference
-        self.setStyleSheet("""
+# One shared QSS blob: applied once at the SettingsWidget root and
+# cascaded by Qt to every descendant via the type selectors
+_SETTINGS_QSS = """
             QWidget {
                 background-color: #1e1e1e;
                 color: #ffffff;
@@ -255,7 +207,94 @@ class SettingsWidget(QWidget):
             QPushButton.exportBtn:pressed {
                 background-color: #1565c0;
             }
-        """)
+"""
+
+_LABEL_QSS = "color: #ffffff; font-size: 14px; background-color: transparent;"
+_HINT_QSS = "color: #888888; font-size: 12px; background-color: transparent;"
+
+
+@functools.lru_cache(maxsize=64)
+def _rendered_gradient(theme_name, width, height):
+    """Rasterize a theme gradient bar, memoized by (theme, size).
+
+    Flipping back and forth between themes in the combo reuses earlier
+    renders; a handful of themes times a few widget sizes keeps the
+    cache tiny. Interpolates in float and adds interleaved-gradient-
+    noise dither before quantizing to 8 bits — a plain gradient fill
+    bands visibly in the dark end of some themes on this app's #2b2b2b
+    surroundings.
+    """
+    xs = np.arange(width, dtype=np.float64)
+    dither = np.modf(52.9829189 * np.modf(0.06711056 * xs)[0])[0] - 0.5
+    rgb = get_theme_colors_float(theme_name, np.linspace(0.0, 1.0, width))
+    row = np.ascontiguousarray(
+        np.clip(rgb + dither[:, None], 0, 255).astype(np.uint8))
+    img = QImage(row.tobytes(), width, 1, width * 3, QImage.Format_RGB888)
+    return QPixmap.fromImage(img).scaled(
+        width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+class ColorPreviewWidget(QWidget):
+    """Widget to preview heatmap color gradient."""
+    
+    def __init__(self, theme_name='default'):
+        super().__init__()
+        self.theme_name = theme_name
+        self._pixmap = None  # gradient bar, rebuilt on theme/size change
+        self.setFixedHeight(30)
+        self.setMinimumWidth(200)
+    
+    def set_theme(self, theme_name):
+        self.theme_name = theme_name
+        self._pixmap = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self._pixmap = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if not self.isVisible() or event.rect().isEmpty():
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Draw gradient bar (cached; repaints are a single blit)
+        width = max(self.width() - 4, 1)
+        height = max(self.height() - 4, 1)
+        if self._pixmap is None:
+            self._pixmap = _rendered_gradient(self.theme_name, width, height)
+        painter.drawPixmap(2, 2, self._pixmap)
+        
+        # Draw border
+        painter.setPen(QPen(QColor(80, 80, 80), 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 3, 3)
+
+
+class SettingsWidget(QWidget):
+    """Settings page with all configuration options."""
+    
+    # Signal emitted when theme changes (for live preview)
+    theme_changed = Signal(str)
+    keyboard_layout_changed = Signal(str)
+    settings_changed = Signal()
+    language_changed = Signal(str)
+    
+    def __init__(self, config: Config = None, database=None):
+        super().__init__()
+        self.config = config or Config()
+        self.database = database
+        self.exporter = DataExporter(database) if database else None
+        self._built = False          # groups not constructed yet
+        self._groups_ready = False   # set once load_settings has run
+        self._pending_builders = []
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Setup the settings UI."""
+        # Force dark theme for ALL child widgets to prevent system theme interference
+        self.setStyleSheet(_SETTINGS_QSS)
         
         # Main layout with scroll area for many settings
         main_layout = QVBoxLayout(self)
@@ -277,6 +316,47 @@ class SettingsWidget(QWidget):
         scroll_layout.setSpacing(20)
         scroll_layout.setContentsMargins(0, 0, 10, 0)
         
+        # Groups are built lazily by showEvent; the stretch stays last
+        # and groups are inserted in front of it as they are created
+        scroll_layout.addStretch()
+        self._scroll_layout = scroll_layout
+        
+        scroll.setWidget(scroll_content)
+        main_layout.addWidget(scroll)
+
+    def showEvent(self, event):
+        # Build the settings groups the first time the page is shown, so
+        # app startup doesn't pay for controls the user may never open
+        if not self._built:
+            self._built = True
+            self._pending_builders = [
+                self._build_general_group,
+                self._build_data_group,
+                self._build_idle_group,
+                self._build_break_group,
+                self._build_appearance_group,
+                self._build_grouping_group,
+                self._build_display_mode_group,
+                self._build_export_group,
+            ]
+            self._build_next_group()
+        super().showEvent(event)
+
+    def _build_next_group(self):
+        """Build one group, then yield to the event loop before the next
+        so the page appears immediately; load settings once all controls
+        exist.
+        """
+        builder = self._pending_builders.pop(0)
+        group = builder()
+        self._scroll_layout.insertWidget(self._scroll_layout.count() - 1, group)
+        if self._pending_builders:
+            QTimer.singleShot(0, self._build_next_group)
+        else:
+            self._groups_ready = True
+            self.load_settings()
+
+    def _build_general_group(self):
         # General Settings Group
         self.general_group = self.create_group(tr('settings.general'))
         general_layout = QVBoxLayout()
@@ -304,8 +384,9 @@ class SettingsWidget(QWidget):
         general_layout.addWidget(self.minimize_tray_check)
         
         self.general_group.setLayout(general_layout)
-        scroll_layout.addWidget(self.general_group)
-        
+        return self.general_group
+
+    def _build_data_group(self):
         # Data Management Group
         self.data_group = self.create_group(tr('settings.data_management'))
         data_layout = QVBoxLayout()
@@ -314,7 +395,7 @@ class SettingsWidget(QWidget):
         # Data retention setting
         retention_layout = QHBoxLayout()
         self.retention_label = QLabel(tr('settings.retention'))
-        self.retention_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.retention_label.setStyleSheet(_LABEL_QSS)
         retention_layout.addWidget(self.retention_label)
         
         self.retention_spin = QSpinBox()
@@ -330,7 +411,7 @@ class SettingsWidget(QWidget):
         
         # Data retention hint
         self.retention_hint = QLabel(tr('settings.retention_hint'))
-        self.retention_hint.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.retention_hint.setStyleSheet(_HINT_QSS)
         data_layout.addWidget(self.retention_hint)
         
         # Separator
@@ -339,7 +420,7 @@ class SettingsWidget(QWidget):
         # Clear data button
         clear_layout = QHBoxLayout()
         self.clear_label = QLabel(tr('settings.clear_data'))
-        self.clear_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.clear_label.setStyleSheet(_LABEL_QSS)
         clear_layout.addWidget(self.clear_label)
         
         self.clear_data_btn = QPushButton(tr('settings.clear_data_btn'))
@@ -352,8 +433,9 @@ class SettingsWidget(QWidget):
         data_layout.addLayout(clear_layout)
         
         self.data_group.setLayout(data_layout)
-        scroll_layout.addWidget(self.data_group)
-        
+        return self.data_group
+
+    def _build_idle_group(self):
         # Idle Detection Group
         self.idle_group = self.create_group(tr('settings.idle_detection'))
         idle_layout = QVBoxLayout()
@@ -362,7 +444,7 @@ class SettingsWidget(QWidget):
         # Idle timeout setting
         idle_timeout_layout = QHBoxLayout()
         self.idle_timeout_label = QLabel(tr('settings.idle_timeout'))
-        self.idle_timeout_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.idle_timeout_label.setStyleSheet(_LABEL_QSS)
         idle_timeout_layout.addWidget(self.idle_timeout_label)
         
         self.idle_timeout_spin = QSpinBox()
@@ -378,12 +460,13 @@ class SettingsWidget(QWidget):
         
         # Idle timeout hint
         self.idle_timeout_hint = QLabel(tr('settings.idle_timeout_hint'))
-        self.idle_timeout_hint.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.idle_timeout_hint.setStyleSheet(_HINT_QSS)
         idle_layout.addWidget(self.idle_timeout_hint)
         
         self.idle_group.setLayout(idle_layout)
-        scroll_layout.addWidget(self.idle_group)
-        
+        return self.idle_group
+
+    def _build_break_group(self):
         # Break Reminder Group
         self.break_group = self.create_group(tr('settings.break_reminder'))
         break_layout = QVBoxLayout()
@@ -397,7 +480,7 @@ class SettingsWidget(QWidget):
         # Break reminder interval setting
         break_interval_layout = QHBoxLayout()
         self.break_interval_label = QLabel(tr('settings.break_interval'))
-        self.break_interval_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.break_interval_label.setStyleSheet(_LABEL_QSS)
         break_interval_layout.addWidget(self.break_interval_label)
         
         self.break_interval_spin = QSpinBox()
@@ -414,7 +497,7 @@ class SettingsWidget(QWidget):
         # Suggested break duration setting
         break_duration_layout = QHBoxLayout()
         self.break_duration_label = QLabel(tr('settings.break_duration'))
-        self.break_duration_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.break_duration_label.setStyleSheet(_LABEL_QSS)
         break_duration_layout.addWidget(self.break_duration_label)
         
         self.break_duration_spin = QSpinBox()
@@ -429,13 +512,14 @@ class SettingsWidget(QWidget):
         
         # Break reminder hint
         self.break_hint = QLabel(tr('settings.break_hint'))
-        self.break_hint.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.break_hint.setStyleSheet(_HINT_QSS)
         self.break_hint.setWordWrap(True)
         break_layout.addWidget(self.break_hint)
         
         self.break_group.setLayout(break_layout)
-        scroll_layout.addWidget(self.break_group)
-        
+        return self.break_group
+
+    def _build_appearance_group(self):
         # Appearance Group
         self.appearance_group = self.create_group(tr('settings.appearance'))
         appearance_layout = QVBoxLayout()
@@ -444,7 +528,7 @@ class SettingsWidget(QWidget):
         # Language selector
         language_layout = QHBoxLayout()
         self.language_label = QLabel(tr('settings.language'))
-        self.language_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.language_label.setStyleSheet(_LABEL_QSS)
         language_layout.addWidget(self.language_label)
         
         self.language_combo = QComboBox()
@@ -462,7 +546,7 @@ class SettingsWidget(QWidget):
         
         # Language change hint
         self.language_hint = QLabel(tr('settings.language_hint'))
-        self.language_hint.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.language_hint.setStyleSheet(_HINT_QSS)
         appearance_layout.addWidget(self.language_hint)
         
         appearance_layout.addSpacing(10)
@@ -470,7 +554,7 @@ class SettingsWidget(QWidget):
         # Heatmap theme selector
         theme_layout = QHBoxLayout()
         self.theme_label = QLabel(tr('settings.theme'))
-        self.theme_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.theme_label.setStyleSheet(_LABEL_QSS)
         theme_layout.addWidget(self.theme_label)
         
         self.theme_combo = QComboBox()
@@ -503,7 +587,7 @@ class SettingsWidget(QWidget):
         # Keyboard layout selector
         kb_layout_row = QHBoxLayout()
         self.kb_layout_label = QLabel(tr('settings.keyboard_layout'))
-        self.kb_layout_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.kb_layout_label.setStyleSheet(_LABEL_QSS)
         kb_layout_row.addWidget(self.kb_layout_label)
         
         self.kb_layout_combo = QComboBox()
@@ -520,8 +604,9 @@ class SettingsWidget(QWidget):
         appearance_layout.addLayout(kb_layout_row)
         
         self.appearance_group.setLayout(appearance_layout)
-        scroll_layout.addWidget(self.appearance_group)
-        
+        return self.appearance_group
+
+    def _build_grouping_group(self):
         # App Grouping Section
         self.grouping_group = self.create_group(tr('settings.app_grouping'))
         grouping_layout = QVBoxLayout()
@@ -530,13 +615,13 @@ class SettingsWidget(QWidget):
         # Description
         self.grouping_desc = QLabel(tr('settings.app_grouping_desc'))
         self.grouping_desc.setWordWrap(True)
-        self.grouping_desc.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.grouping_desc.setStyleSheet(_HINT_QSS)
         grouping_layout.addWidget(self.grouping_desc)
         
         # Button to open grouping dialog
         grouping_btn_layout = QHBoxLayout()
         self.grouping_label = QLabel(tr('settings.manage_groups'))
-        self.grouping_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.grouping_label.setStyleSheet(_LABEL_QSS)
         grouping_btn_layout.addWidget(self.grouping_label)
         
         self.grouping_btn = QPushButton(tr('settings.open_grouping'))
@@ -553,8 +638,9 @@ class SettingsWidget(QWidget):
         grouping_layout.addWidget(self.grouping_stats)
         
         self.grouping_group.setLayout(grouping_layout)
-        scroll_layout.addWidget(self.grouping_group)
-        
+        return self.grouping_group
+
+    def _build_display_mode_group(self):
         # Screen Time Display Mode Group
         self.display_mode_group = self.create_group(tr('settings.screen_time_display'))
         display_mode_layout = QVBoxLayout()
@@ -563,13 +649,13 @@ class SettingsWidget(QWidget):
         # Description
         self.display_mode_desc = QLabel(tr('settings.screen_time_display_desc'))
         self.display_mode_desc.setWordWrap(True)
-        self.display_mode_desc.setStyleSheet("color: #888888; font-size: 12px; background-color: transparent;")
+        self.display_mode_desc.setStyleSheet(_HINT_QSS)
         display_mode_layout.addWidget(self.display_mode_desc)
         
         # Display mode selector
         display_mode_row = QHBoxLayout()
         self.display_mode_label = QLabel(tr('settings.display_mode'))
-        self.display_mode_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.display_mode_label.setStyleSheet(_LABEL_QSS)
         display_mode_row.addWidget(self.display_mode_label)
         
         self.display_mode_combo = QComboBox()
@@ -582,8 +668,9 @@ class SettingsWidget(QWidget):
         display_mode_layout.addLayout(display_mode_row)
         
         self.display_mode_group.setLayout(display_mode_layout)
-        scroll_layout.addWidget(self.display_mode_group)
-        
+        return self.display_mode_group
+
+    def _build_export_group(self):
         # Data Export Group
         self.export_group = self.create_group(tr('settings.export'))
         export_layout = QVBoxLayout()
@@ -592,7 +679,7 @@ class SettingsWidget(QWidget):
         # Export range selector
         export_range_layout = QHBoxLayout()
         self.export_range_label = QLabel(tr('settings.export_range'))
-        self.export_range_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.export_range_label.setStyleSheet(_LABEL_QSS)
         export_range_layout.addWidget(self.export_range_label)
         
         self.export_range_combo = QComboBox()
@@ -612,7 +699,7 @@ class SettingsWidget(QWidget):
         # Export CSV button
         csv_layout = QHBoxLayout()
         self.export_csv_label = QLabel(tr('settings.export_csv'))
-        self.export_csv_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.export_csv_label.setStyleSheet(_LABEL_QSS)
         csv_layout.addWidget(self.export_csv_label)
         
         self.export_csv_btn = QPushButton(tr('settings.export_csv_btn'))
@@ -626,7 +713,7 @@ class SettingsWidget(QWidget):
         # Export JSON button
         json_layout = QHBoxLayout()
         self.export_json_label = QLabel(tr('settings.export_json'))
-        self.export_json_label.setStyleSheet("color: #ffffff; font-size: 14px; background-color: transparent;")
+        self.export_json_label.setStyleSheet(_LABEL_QSS)
         json_layout.addWidget(self.export_json_label)
         
         self.export_json_btn = QPushButton(tr('settings.export_json_btn'))
@@ -638,14 +725,9 @@ class SettingsWidget(QWidget):
         export_layout.addLayout(json_layout)
         
         self.export_group.setLayout(export_layout)
-        scroll_layout.addWidget(self.export_group)
-        
-        # Add stretch at the end
-        scroll_layout.addStretch()
+        return self.export_group
+
         
-        scroll.setWidget(scroll_content)
-        main_layout.addWidget(scroll)
-    
     def create_group(self, title):
         """Create a styled group box."""
         group = QGroupBox(title)
@@ -654,6 +736,10 @@ class SettingsWidget(QWidget):
     def retranslate_ui(self):
         """Update all UI text for current language."""
         self.title_label.setText(tr('settings.title'))
+        if not self._groups_ready:
+            # Lazy-built groups don't exist yet; when they are created
+            # they pick up the current language strings anyway
+            return
         
         # General group
         self.general_group.setTitle(tr('settings.general'))
@@ -771,18 +857,15 @@ class SettingsWidget(QWidget):
     
     def load_settings(self):
         """Load current settings into UI controls."""
-        # Block signals while loading
-        self.autostart_check.blockSignals(True)
-        self.minimize_tray_check.blockSignals(True)
-        self.retention_spin.blockSignals(True)
-        self.theme_combo.blockSignals(True)
-        self.kb_layout_combo.blockSignals(True)
-        self.language_combo.blockSignals(True)
-        self.idle_timeout_spin.blockSignals(True)
-        self.break_enabled_check.blockSignals(True)
-        self.break_interval_spin.blockSignals(True)
-        self.break_duration_spin.blockSignals(True)
-        self.display_mode_combo.blockSignals(True)
+        # RAII signal blockers: released when the list goes out of scope
+        # at the end of the method, even if loading raises partway
+        blockers = [QSignalBlocker(w) for w in (
+            self.autostart_check, self.minimize_tray_check,
+            self.retention_spin, self.theme_combo, self.kb_layout_combo,
+            self.language_combo, self.idle_timeout_spin,
+            self.break_enabled_check, self.break_interval_spin,
+            self.break_duration_spin, self.display_mode_combo,
+        )]
         
         # Load values from config (trust config file, not registry)
         self.autostart_check.setChecked(self.config.autostart)
@@ -800,48 +883,28 @@ class SettingsWidget(QWidget):
         # Update enabled state of interval/duration based on checkbox
         self._update_break_controls_enabled()
         
-        # Set language combo
-        current_lang = self.config.language
-        for i in range(self.language_combo.count()):
-            if self.language_combo.itemData(i) == current_lang:
-                self.language_combo.setCurrentIndex(i)
-                break
+        # Combos jump straight to the stored value via findData instead
+        # of a Python scan over the items
+        idx = self.language_combo.findData(self.config.language)
+        if idx >= 0:
+            self.language_combo.setCurrentIndex(idx)
         
-        # Set theme combo
         current_theme = self.config.heatmap_theme
-        for i in range(self.theme_combo.count()):
-            if self.theme_combo.itemData(i) == current_theme:
-                self.theme_combo.setCurrentIndex(i)
-                break
+        idx = self.theme_combo.findData(current_theme)
+        if idx >= 0:
+            self.theme_combo.setCurrentIndex(idx)
         
         self.theme_preview.set_theme(current_theme)
         
-        # Set keyboard layout combo
-        current_kb_layout = self.config.keyboard_layout
-        for i in range(self.kb_layout_combo.count()):
-            if self.kb_layout_combo.itemData(i) == current_kb_layout:
-                self.kb_layout_combo.setCurrentIndex(i)
-                break
+        idx = self.kb_layout_combo.findData(self.config.keyboard_layout)
+        if idx >= 0:
+            self.kb_layout_combo.setCurrentIndex(idx)
         
-        # Set display mode combo
-        current_display_mode = self.config.screen_time_group_display
-        for i in range(self.display_mode_combo.count()):
-            if self.display_mode_combo.itemData(i) == current_display_mode:
-                self.display_mode_combo.setCurrentIndex(i)
-                break
+        idx = self.display_mode_combo.findData(self.config.screen_time_group_display)
+        if idx >= 0:
+            self.display_mode_combo.setCurrentIndex(idx)
         
-        # Unblock signals
-        self.autostart_check.blockSignals(False)
-        self.minimize_tray_check.blockSignals(False)
-        self.retention_spin.blockSignals(False)
-        self.theme_combo.blockSignals(False)
-        self.kb_layout_combo.blockSignals(False)
-        self.language_combo.blockSignals(False)
-        self.idle_timeout_spin.blockSignals(False)
-        self.break_enabled_check.blockSignals(False)
-        self.break_interval_spin.blockSignals(False)
-        self.break_duration_spin.blockSignals(False)
-        self.display_mode_combo.blockSignals(False)
+        del blockers
     
     def _update_break_controls_enabled(self):
         """Update enabled state of break reminder controls based on checkbox."""
@@ -966,18 +1029,9 @@ class SettingsWidget(QWidget):
         """Clear all data from database."""
         if self.database:
             try:
-                with self.database.get_connection() as conn:
-                    cursor = conn.cursor()
-                    # Clear all tables
-                    cursor.execute("DELETE FROM daily_stats")
-                    cursor.execute("DELETE FROM app_stats")
-                    cursor.execute("DELETE FROM heatmap_data")
-                    cursor.execute("DELETE FROM mouse_heatmap_data")
-                    cursor.execute("DELETE FROM app_heatmap_data")
-                    cursor.execute("DELETE FROM app_mouse_heatmap_data")
-                    cursor.execute("DELETE FROM hourly_app_stats")
-                    # Keep app_metadata as it's just friendly names
-                    conn.commit()
+                # One batched script + VACUUM inside the database layer
+                # (app_metadata is kept as it's just friendly names)
+                self.database.clear_all_data()
                 
                 QMessageBox.information(
                     self,
@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
@@ -5,6 +6,37 @@ from PySide6.QtGui import QIcon, QAction, QPixmap, QPainter, QColor, QBrush
 from PySide6.QtCore import Signal, Qt
 from ..i18n import tr
 
+
+@functools.lru_cache(maxsize=1)
+def _default_tray_icon():
+    """Create the fallback tray icon programmatically.
+
+    Cached so the 64x64 rasterization (ellipse + text) runs at most once
+    per process no matter how many TrayIcon instances are created.
+    """
+    pixmap = QPixmap(64, 64)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # Draw green circle background
+    painter.setBrush(QBrush(QColor(0, 230, 118)))  # #00e676
+    painter.setPen(Qt.NoPen)
+    painter.drawEllipse(4, 4, 56, 56)
+
+    # Draw "K" letter
+    painter.setPen(QColor(30, 30, 30))
+    font = painter.font()
+    font.setPixelSize(36)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, "K")
+
+    painter.end()
+
+    return QIcon(pixmap)
+
 class TrayIcon(QSystemTrayIcon):
     show_window_signal = Signal()
     quit_signal = Signal()
@@ -57,33 +89,7 @@ class TrayIcon(QSystemTrayIcon):
                     return icon
         
         # Fallback to programmatic icon
-        return self._create_default_icon()
-    
-    def _create_default_icon(self):
-        """Create a simple icon programmatically."""
-        # Create a 64x64 pixmap
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw green circle background
-        painter.setBrush(QBrush(QColor(0, 230, 118)))  # #00e676
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(4, 4, 56, 56)
-        
-        # Draw "K" letter
-        painter.setPen(QColor(30, 30, 30))
-        font = painter.font()
-        font.setPixelSize(36)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), Qt.AlignCenter, "K")
-        
-        painter.end()
-        
-        return QIcon(pixmap)
+        return _default_tray_icon()
 
     def on_activated(self, reason):
         if reason == QSystemTrayIcon.Trigger:
@@ -1,10 +1,10 @@
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QColor, QFont, QPen, QPixmap, QRadialGradient, QImage, qRgba, QGuiApplication
-from PySide6.QtCore import Qt, QRect
+from PySide6.QtCore import Qt, QRect, QTimer
 import numpy as np
 from scipy.ndimage import gaussian_filter
 import win32api
-from ..config import get_theme_color, HEATMAP_THEMES
+from ..config import get_theme_color, get_theme_colors, HEATMAP_THEMES
 
 # =============================================================================
 # Keyboard Layout Definitions
@@ -170,6 +170,10 @@ KEYBOARD_LAYOUTS = {
     ],
 }
 
+# Freeze the layouts: they are read-only reference data, and tuples
+# iterate slightly faster while making the immutability explicit
+KEYBOARD_LAYOUTS = {name: tuple(keys) for name, keys in KEYBOARD_LAYOUTS.items()}
+
 # Default layout for backward compatibility
 KEYBOARD_LAYOUT = KEYBOARD_LAYOUTS['tkl']
 
@@ -180,7 +184,7 @@ def get_keyboard_layout(layout_name: str = 'tkl') -> list:
         layout_name: One of 'full', 'tkl', '75', '60'
     
     Returns:
-        List of key tuples (scan_code, label, row, col, width)
+        Tuple of key tuples (scan_code, label, row, col, width)
     """
     return KEYBOARD_LAYOUTS.get(layout_name, KEYBOARD_LAYOUTS['tkl'])
 
@@ -199,16 +203,51 @@ def get_heat_color(ratio, theme='default'):
     return QColor(r, g, b)
 
 
+def get_heat_colors(ratios, theme='default'):
+    """Vectorized get_heat_color: one LUT gather for a batch of ratios.
+
+    Args:
+        ratios: Array-like of heat ratios from 0.0 to 1.0
+        theme: Theme name ('default', 'fire', 'ocean', etc.)
+
+    Returns:
+        List of QColor, one per ratio
+    """
+    return [QColor(int(r), int(g), int(b))
+            for r, g, b in get_theme_colors(theme, ratios)]
+
+
 class HeatmapWidget(QWidget):
     def __init__(self, data=None, theme='default', layout_name='tkl'):
         super().__init__()
         self.data = data or {}
+        self._rebuild_soa()
         self.theme = theme
         self.layout_name = layout_name
         self.setMinimumSize(800, 450)
+        # The widget paints its full rect itself, so Qt can skip the
+        # style's background fill
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.base_key_size = 45
         self.key_spacing = 3
         self.margin = 30
+        # Geometry cache: key rects/fonts depend only on widget size and
+        # layout, so they are computed once instead of per paint
+        self._layout_cache = None
+        self._bg_pixmap = None  # board in its all-idle state
+        self._rect_by_scan = {}  # scan_code -> rects (some codes repeat)
+        self._corner_radius = 5
+        self._count_font = QFont("Arial", 7)
+        self._key_pen = QPen(QColor(80, 80, 80), 1)
+        self._idle_color = QColor(60, 60, 60)
+        self._label_on_heat = QColor(0, 0, 0)
+        self._label_idle = QColor(180, 180, 180)
+        # Coalesce bursts of data updates into at most ~30 repaints/sec
+        self._delta_applied = False
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(33)
+        self._repaint_timer.timeout.connect(self.update)
     
     def set_theme(self, theme):
         """Set the heatmap color theme."""
@@ -219,28 +258,19 @@ class HeatmapWidget(QWidget):
         """Set the keyboard layout to display."""
         if layout_name in KEYBOARD_LAYOUTS:
             self.layout_name = layout_name
+            self._layout_cache = None
             self.update()
 
-    def update_data(self, data):
-        self.data = data
-        self.update()
+    def resizeEvent(self, event):
+        self._layout_cache = None
+        super().resizeEvent(event)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Background
-        painter.fillRect(self.rect(), QColor(40, 40, 40))
-        
-        # Get current layout
+    def _rebuild_layout_cache(self):
+        """Compute per-key screen rects, label fonts and count-text
+        anchors for the current widget size and layout.
+        """
         layout = get_keyboard_layout(self.layout_name)
-        
-        if not self.data:
-            painter.setPen(QColor(200, 200, 200))
-            painter.setFont(QFont("Arial", 14))
-            painter.drawText(self.rect(), Qt.AlignCenter, "Start typing to see heatmap...")
-            return
-        
+
         # Calculate total size of keyboard in base units
         # Handle both 5-tuple (legacy) and 6-tuple (with height) formats
         max_col_units = 0
@@ -250,73 +280,191 @@ class HeatmapWidget(QWidget):
             height = key_tuple[5] if len(key_tuple) > 5 else 1
             max_col_units = max(max_col_units, col + width)
             max_row_units = max(max_row_units, row + height)
-        
+
         # Calculate scale factor to fit the widget while maintaining aspect ratio
         base_total_w = max_col_units * self.base_key_size + (max_col_units - 1) * self.key_spacing
         base_total_h = max_row_units * self.base_key_size + (max_row_units - 1) * self.key_spacing
-        
+
         available_w = self.width() - 2 * self.margin
         available_h = self.height() - 2 * self.margin
-        
+
         scale = min(available_w / base_total_w, available_h / base_total_h)
         # Allow shrinking to avoid clipping on smaller windows.
         # Keep a reasonable lower bound so labels remain legible.
         scale = max(scale, 0.6)
-        
+
         key_size = self.base_key_size * scale
         spacing = self.key_spacing * scale
-        
+
         total_w = max_col_units * key_size + (max_col_units - 1) * spacing
         total_h = max_row_units * key_size + (max_row_units - 1) * spacing
-        
+
         # Calculate offsets to center
         start_x = (self.width() - total_w) / 2
         start_y = (self.height() - total_h) / 2
-        
-        max_count = max(self.data.values()) if self.data else 1
-        
+
         # Scale font sizes
-        label_font_size = max(9, int(11 * scale))
-        label_font_size_small = max(7, int(9 * scale))
-        count_font_size = max(6, int(7 * scale))
-        corner_radius = int(5 * scale)
-        
+        label_font = QFont("Arial", max(9, int(11 * scale)))
+        label_font_small = QFont("Arial", max(7, int(9 * scale)))
+        self._count_font = QFont("Arial", max(6, int(7 * scale)))
+        self._corner_radius = int(5 * scale)
+
+        cache = []
         for key_tuple in layout:
             scan_code, label, row, col, width = key_tuple[:5]
             height = key_tuple[5] if len(key_tuple) > 5 else 1
-            
+
             x = start_x + col * (key_size + spacing)
             y = start_y + row * (key_size + spacing)
             w = width * key_size + (width - 1) * spacing
             h = height * key_size + (height - 1) * spacing
-            
-            # Get heat level
-            count = self.data.get(scan_code, 0)
-            if count > 0 and max_count > 0:
-                ratio = min(count / max_count, 1.0)
-                bg_color = get_heat_color(ratio, self.theme)
-            else:
-                bg_color = QColor(60, 60, 60)
+
+            rect = QRect(int(x), int(y), int(w), int(h))
+            font = label_font_small if len(label) > 2 else label_font
+            count_pos = (int(x + 2 * scale), int(y + h - 12 * scale))
+            cache.append((scan_code, rect, font, label, count_pos))
+        self._layout_cache = cache
+        self._rect_by_scan = {}
+        for scan_code, rect, _, _, _ in cache:
+            self._rect_by_scan.setdefault(scan_code, []).append(rect)
+        self._render_background()
+
+    def _render_background(self):
+        """Pre-render the board with every key idle; paintEvent blits
+        this and only repaints keys that have a count.
+        """
+        pixmap = QPixmap(self.size())
+        pixmap.fill(QColor(40, 40, 40))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for _, rect, font, label, _ in self._layout_cache:
+            painter.setBrush(self._idle_color)
+            painter.setPen(self._key_pen)
+            painter.drawRoundedRect(rect, self._corner_radius, self._corner_radius)
+            painter.setPen(self._label_idle)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignCenter, label)
+        painter.end()
+        self._bg_pixmap = pixmap
+
+    def _rebuild_soa(self):
+        """Mirror self.data into parallel arrays: scan_code -> slot index
+        plus one contiguous counts array, so buffer deltas merge with a
+        single np.add.at instead of a per-key dict loop.
+        """
+        self._index = {code: i for i, code in enumerate(self.data)}
+        self._counts = np.fromiter(self.data.values(), dtype=np.int64,
+                                   count=len(self.data))
+
+    def _schedule_repaint(self):
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def update_data(self, data):
+        if data is self.data and not self._delta_applied:
+            # Same cached dict and no buffer merged on top since the
+            # last rebuild: the repaint would be a no-op
+            return
+        self.data = data
+        self._delta_applied = False
+        self._rebuild_soa()
+        self._schedule_repaint()
+
+    def apply_delta(self, delta):
+        """Add a dict of scan_code -> extra count on top of the current
+        data (live today-buffer merges) without copying the base dict.
+        """
+        if not delta:
+            return
+        new_codes = [code for code in delta if code not in self._index]
+        if new_codes:
+            for code in new_codes:
+                self._index[code] = len(self._index)
+            self._counts = np.concatenate(
+                [self._counts, np.zeros(len(new_codes), dtype=np.int64)])
+        idx = np.fromiter((self._index[code] for code in delta),
+                          dtype=np.intp, count=len(delta))
+        vals = np.fromiter(delta.values(), dtype=np.int64, count=len(delta))
+        np.add.at(self._counts, idx, vals)
+        self._delta_applied = True
+        self._schedule_repaint()
+
+    def bump_key(self, scan_code, count):
+        """Fast path for a single-key change: store the new count and
+        repaint only that key's rect(s). Falls back to a full repaint
+        when the overall max changes, since that rescales every key's
+        color, or when the geometry cache isn't built yet.
+        """
+        old_max = int(self._counts.max()) if self._counts.size else 0
+        slot = self._index.get(scan_code)
+        if slot is None:
+            self._index[scan_code] = len(self._counts)
+            self._counts = np.append(self._counts, np.int64(count))
+        else:
+            self._counts[slot] = count
+        self._delta_applied = True
+        rects = self._rect_by_scan.get(scan_code)
+        if count > old_max or not rects:
+            self.update()
+            return
+        for rect in rects:
+            self.update(rect)
+
+    def paintEvent(self, event):
+        if not self.isVisible() or event.rect().isEmpty():
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        if not self._index:
+            painter.fillRect(self.rect(), QColor(40, 40, 40))
+            painter.setPen(QColor(200, 200, 200))
+            painter.setFont(QFont("Arial", 14))
+            painter.drawText(self.rect(), Qt.AlignCenter, "Start typing to see heatmap...")
+            return
+
+        if self._layout_cache is None:
+            self._rebuild_layout_cache()
+
+        # Static board in one blit; only pressed keys get repainted below
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+        # Qt clips to the dirty region anyway; skipping non-intersecting
+        # keys here avoids issuing their draw calls at all
+        region = event.region()
+
+        max_count = int(self._counts.max()) if self._counts.size else 1
+
+        # Batch-color the whole board: one LUT gather instead of a
+        # get_heat_color call per pressed key
+        counts = np.array([self._counts[self._index[k[0]]]
+                           if k[0] in self._index else 0
+                           for k in self._layout_cache],
+                          dtype=np.float64)
+        ratios = np.minimum(counts / (max_count if max_count > 0 else 1), 1.0)
+        heat_colors = get_heat_colors(ratios, self.theme)
+
+        corner_radius = self._corner_radius
+        for i, (scan_code, rect, font, label, count_pos) in enumerate(self._layout_cache):
+            count = int(counts[i])
+            if count <= 0:
+                continue  # idle keys come from the background pixmap
+            if not region.intersects(rect):
+                continue
             
             # Draw key background
-            painter.setBrush(bg_color)
-            painter.setPen(QPen(QColor(80, 80, 80), 1))
-            painter.drawRoundedRect(int(x), int(y), int(w), int(h), corner_radius, corner_radius)
-            
-            # Draw label
-            if count > 0:
-                painter.setPen(QColor(0, 0, 0))  # Dark text on colored bg
-            else:
-                painter.setPen(QColor(180, 180, 180))  # Light text on dark bg
+            painter.setBrush(heat_colors[i])
+            painter.setPen(self._key_pen)
+            painter.drawRoundedRect(rect, corner_radius, corner_radius)
             
-            font_size = label_font_size_small if len(label) > 2 else label_font_size
-            painter.setFont(QFont("Arial", font_size))
-            painter.drawText(int(x), int(y), int(w), int(h), Qt.AlignCenter, label)
+            # Draw label (dark text on colored bg)
+            painter.setPen(self._label_on_heat)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignCenter, label)
             
-            # Draw count if non-zero
-            if count > 0:
-                painter.setFont(QFont("Arial", count_font_size))
-                painter.drawText(int(x + 2 * scale), int(y + h - 12 * scale), str(count))
+            # Draw count
+            painter.setFont(self._count_font)
+            painter.drawText(count_pos[0], count_pos[1], str(count))
 
 
 class MouseHeatmapWidget(QWidget):
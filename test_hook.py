@@ -2,6 +2,7 @@
 Safe test script for Windows low-level hooks.
 This script has a 10-second timeout and can be stopped with Ctrl+C.
 """
+import collections
 import ctypes
 from ctypes import wintypes
 import threading
@@ -15,6 +16,12 @@ WH_KEYBOARD_LL = 13
 WH_MOUSE_LL = 14
 WM_KEYDOWN = 0x0100
 WM_LBUTTONDOWN = 0x0201
+WM_QUIT = 0x0012
+PM_REMOVE = 1
+QS_ALLINPUT = 0x04FF
+MWMO_ALERTABLE = 0x0002
+WAIT_OBJECT_0 = 0
+INFINITE = 0xFFFFFFFF
 
 # CRITICAL: On 64-bit Windows, LPARAM is 64-bit
 # LRESULT is also 64-bit (c_longlong on 64-bit, c_long on 32-bit)
@@ -38,6 +45,29 @@ HOOKPROC = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, LPARAM)
 user32.CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, LPARAM]
 user32.CallNextHookEx.restype = LRESULT
 
+# Declare the rest of the Win32 surface we touch so ctypes skips its
+# per-call argument inspection; on 64-bit this also keeps HANDLE-sized
+# values from being truncated through the default c_int conversion.
+user32.SetWindowsHookExW.argtypes = [ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+user32.SetWindowsHookExW.restype = wintypes.HHOOK
+user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+user32.UnhookWindowsHookEx.restype = wintypes.BOOL
+user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                wintypes.UINT, wintypes.UINT, wintypes.UINT]
+user32.PeekMessageW.restype = wintypes.BOOL
+user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+user32.TranslateMessage.restype = wintypes.BOOL
+user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+user32.DispatchMessageW.restype = LRESULT
+user32.MsgWaitForMultipleObjectsEx.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                               wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+user32.MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+kernel32.CreateEventW.restype = wintypes.HANDLE
+kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+kernel32.SetEvent.restype = wintypes.BOOL
+
 class SafeHookTest:
     def __init__(self):
         self.keyboard_hook = None
@@ -46,6 +76,18 @@ class SafeHookTest:
         self.key_count = 0
         self.click_count = 0
         self.running = False
+        # Auto-reset event; stop() signals it to break the blocking wait
+        self._wake_event = kernel32.CreateEventW(None, False, False, None)
+        # Pre-bound function pointer: the hook callbacks run on the
+        # input thread under the LowLevelHooksTimeout budget, so every
+        # attribute lookup saved there counts
+        self._call_next = user32.CallNextHookEx
+        # Events queue here and a reporter thread prints them; stdio
+        # from inside the callback can block the input thread long
+        # enough for Windows to silently unhook us. deque.append is
+        # atomic under the GIL, so no lock on the hot path.
+        self._event_queue = collections.deque(maxlen=4096)
+        self._queue_append = self._event_queue.append
         
     def keyboard_proc(self, nCode, wParam, lParam):
         """
@@ -62,16 +104,17 @@ class SafeHookTest:
         
         # Method 2: Process first, then call next hook (original approach) 
         # This should also work if we always return properly
-        if nCode >= 0 and wParam == WM_KEYDOWN:
+        # (wParam test first: far more selective than nCode >= 0)
+        if wParam == WM_KEYDOWN and nCode >= 0:
             self.key_count += 1
-            print(f"Key pressed! Count: {self.key_count}")
-        return user32.CallNextHookEx(self.keyboard_hook, nCode, wParam, lParam)
+            self._queue_append(('k', self.key_count))
+        return self._call_next(self.keyboard_hook, nCode, wParam, lParam)
     
     def mouse_proc(self, nCode, wParam, lParam):
-        if nCode >= 0 and wParam == WM_LBUTTONDOWN:
+        if wParam == WM_LBUTTONDOWN and nCode >= 0:
             self.click_count += 1
-            print(f"Mouse clicked! Count: {self.click_count}")
-        return user32.CallNextHookEx(self.mouse_hook, nCode, wParam, lParam)
+            self._queue_append(('m', self.click_count))
+        return self._call_next(self.mouse_hook, nCode, wParam, lParam)
     
     def hook_loop(self):
         self.hook_thread_id = kernel32.GetCurrentThreadId()
@@ -95,20 +138,25 @@ class SafeHookTest:
         print("Hooks are active. Try typing or clicking...")
         
         # Message loop - THIS IS CRITICAL
+        # Block until input arrives or stop() signals the wake event:
+        # no 100 Hz polling wakeups while idle, no 10ms added latency
+        # per keystroke, and shutdown is immediate.
         msg = wintypes.MSG()
-        while self.running:
-            # Use PeekMessage with a timeout approach instead of blocking GetMessage
-            # This allows us to check self.running periodically
-            ret = user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 1)  # PM_REMOVE = 1
-            if ret:
-                if msg.message == 0x0012:  # WM_QUIT
+        handles = (wintypes.HANDLE * 1)(self._wake_event)
+        quit_seen = False
+        while self.running and not quit_seen:
+            ret = user32.MsgWaitForMultipleObjectsEx(
+                1, handles, INFINITE, QS_ALLINPUT, MWMO_ALERTABLE)
+            if ret == WAIT_OBJECT_0:  # wake event from stop()
+                break
+            # Drain everything that queued up before waiting again
+            while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                if msg.message == WM_QUIT:
                     print("Received WM_QUIT")
+                    quit_seen = True
                     break
                 user32.TranslateMessage(ctypes.byref(msg))
                 user32.DispatchMessageW(ctypes.byref(msg))
-            else:
-                # No message, sleep briefly to avoid busy loop
-                time.sleep(0.01)
         
         # Cleanup
         if self.keyboard_hook:
@@ -118,17 +166,32 @@ class SafeHookTest:
             user32.UnhookWindowsHookEx(self.mouse_hook)
             print("Mouse hook removed")
     
+    def _report_loop(self):
+        """Print queued hook events off the input thread."""
+        queue = self._event_queue
+        while self.running or queue:
+            if queue:
+                kind, count = queue.popleft()
+                if kind == 'k':
+                    print(f"Key pressed! Count: {count}")
+                else:
+                    print(f"Mouse clicked! Count: {count}")
+            else:
+                time.sleep(0.05)
+
     def start(self):
         self.running = True
         self.thread = threading.Thread(target=self.hook_loop, daemon=True)
         self.thread.start()
+        self._reporter = threading.Thread(target=self._report_loop, daemon=True)
+        self._reporter.start()
         
     def stop(self):
         print("\nStopping hooks...")
         self.running = False
-        if self.hook_thread_id:
-            user32.PostThreadMessageW(self.hook_thread_id, 0x0012, 0, 0)  # WM_QUIT
-        time.sleep(0.5)
+        kernel32.SetEvent(self._wake_event)
+        self.thread.join(timeout=1.0)
+        self._reporter.join(timeout=1.0)
         print(f"Final stats - Keys: {self.key_count}, Clicks: {self.click_count}")
 
 
@@ -140,19 +203,26 @@ def main():
     
     tester = SafeHookTest()
     tester.start()
-    
+
+    # One waitable object instead of ten sleep(1) scheduler round trips;
+    # anything that sets it (a future stop path, tests) ends the run at
+    # once instead of waiting out the current second
+    done = threading.Event()
     try:
         # Give hooks time to install
         time.sleep(0.5)
-        
-        # Run for 10 seconds max
-        for i in range(10, 0, -1):
-            print(f"\rTime remaining: {i}s ", end="", flush=True)
-            time.sleep(1)
+
+        # Run for 10 seconds max, refreshing the countdown once a second
+        for i in range(100):
+            if done.wait(0.1):
+                break
+            if i % 10 == 0:
+                print(f"\rTime remaining: {10 - i // 10}s ", end="", flush=True)
         print()
-        
+
     except KeyboardInterrupt:
         print("\nCtrl+C detected")
+        done.set()
     finally:
         tester.stop()
     